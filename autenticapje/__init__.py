@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import traceback
-from contextlib import suppress
+from abc import ABC, abstractmethod
+from contextlib import nullcontext, suppress
 from os import environ
 from typing import NoReturn
 from uuid import uuid4
 
-import jpype
-import pyotp
 import requests
 from dotenv import load_dotenv
-from jpype import JClass
 from selenium.common import TimeoutException
 from selenium.common.exceptions import (
     UnexpectedAlertPresentException,
@@ -20,49 +18,63 @@ from selenium.common.exceptions import (
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.wait import WebDriverWait
 from tqdm import tqdm
 
 from autenticapje.driver import BotDriver
+from autenticapje.driver.eventos import ErroSSO, aguardar_pagina
+from autenticapje.driver.recursos import carregamento_enxuto
 
 from .assinador import Assinador
 from .elements import pje as el
 from .formatadores import formata_msg, random_base36
-from .keystore import KeyStore
-
-if not jpype.isJVMStarted():
-    jpype.startJVM()
+from .keystore import indice_otp
+from .metricas import Medidor
+from .otp import EstrategiaOTP, gerar_otp
 
 load_dotenv()
 
 NO_CONTENT_STATUS = 204
-ENDPOINT_DESAFIO = "https://sso.cloud.pje.jus.br/auth/realms/pje/pjeoffice-rest"
 
 MessageError = "Erro ao executar operaçao: "
-ByteArrayInputStream = JClass("java.io.ByteArrayInputStream")
-CertificateFactory = JClass("java.security.cert.CertificateFactory")
-ArrayList = JClass("java.util.ArrayList")
 
 
-class AutenticadorPJe:
-    """Implemente autenticação no PJe usando certificado.
+class AutenticadorBase(ABC):
+    """Reúna as etapas comuns aos modos de login com e sem navegador.
 
-    A classe gerencia o fluxo de login com certificado
-    digital e fator duplo de autenticação.
+    Assinatura e registro do desafio, geração do OTP e mensagens não
+    dependem de como os formulários do SSO são enviados; as
+    subclasses implementam o envio e a leitura dos cookies (métodos
+    abstratos, exigidos já ao instanciar).
     """
 
+    # "proxima" evita a espera pela virada da janela do OTP, mas exige
+    # que o SSO aceite uma janela de tolerância
+    estrategia_otp: EstrategiaOTP = "aguardar"
+
     def __init__(self, regiao: str = "1") -> None:
-        """Inicialize o autenticador com o driver e região.
+        """Inicialize a região e o medidor das fases do login.
 
         Args:
             regiao (str): Identificador da região do PJe.
 
         """
-        bot_driver = BotDriver()
-
-        self.driver = bot_driver.driver
+        self.medidor = Medidor()
         self.regiao = regiao
-        self.wait = bot_driver.wait
+
+    @abstractmethod
+    def autenticar(self) -> bool:
+        """Realize o login no PJe e retorne True se bem-sucedido."""
+
+    @abstractmethod
+    def get_cookies_for_requests(self) -> dict[str, str]:
+        """Retorne os cookies da sessão no formato "Py"."""
+
+    @abstractmethod
+    def get_cookies_browser(self) -> list[dict]:
+        """Retorne os cookies da sessão no formato do navegador."""
+
+    def fechar(self) -> None:
+        """Libere os recursos do autenticador."""
 
     def print_message(self, message: str, message_type: str) -> None:
         """Escreva a mensagem formatada no progresso.
@@ -84,6 +96,115 @@ class AutenticadorPJe:
         prefix = prefixes.get(message_type.lower(), "[MSG]")
         tqdm.write(f"{prefix} {message}")
 
+    def _enviar_desafio(self) -> tuple[str, str]:
+        """Assine um desafio e registre-o no endpoint do PJe.
+
+        Returns:
+            tuple[str, str]: Desafio assinado e UUID da tarefa, a
+                serem informados no formulário de login.
+
+        """
+        # enviar diretamente ao endpoint PJe (exemplo)
+        ssopayload = self._assinar_desafio()
+
+        with self.medidor.fase("desafio"):
+            resp = requests.post(el.ENDPOINT_DESAFIO, json=ssopayload, timeout=30)
+
+        if resp.status_code != NO_CONTENT_STATUS:
+            _auth_error()
+
+        return ssopayload["mensagem"], ssopayload["uuid"]
+
+    def _assinar_desafio(self) -> dict[str, str]:
+        """Gere e assine um desafio para o endpoint do PJe.
+
+        Returns:
+            dict[str, str]: Corpo do `pjeoffice-rest` (uuid,
+                mensagem, assinatura e certChain).
+
+        """
+        uuid_tarefa = str(uuid4())
+        desafio = random_base36()
+        with self.medidor.fase("assinatura"):
+            assinador = Assinador()
+            conteudo_assinado = assinador.assinar_conteudo(desafio)
+
+        return {
+            "uuid": uuid_tarefa,
+            "mensagem": desafio,
+            "assinatura": conteudo_assinado.conteudo_assinado_base64,
+            "certChain": conteudo_assinado.cadeia_base64,
+        }
+
+    def _gerar_otp(self) -> str:
+        """Gere o código OTP e informe a validade restante.
+
+        Returns:
+            str: Código OTP pronto para envio.
+
+        """
+        with self.medidor.fase("otp_keystore"):
+            codigo_otp = gerar_otp(
+                self._get_otp_uri(),
+                estrategia=self.estrategia_otp,
+            )
+        self.print_message(
+            message=(
+                f"TRT{self.regiao}: OTP válido por mais "
+                f"{codigo_otp.segundos_restantes:.0f}s"
+            ),
+            message_type="info",
+        )
+        return codigo_otp.codigo
+
+    def _get_otp_uri(self) -> str:
+        """Obtenha a URI OTP armazenada no keystore.
+
+        Procura a entrada pelo CPF do ambiente no índice em memória,
+        que só reabre o KeePass quando o arquivo muda.
+        """
+        otp_uri = indice_otp.obter(environ.get("CPF"))
+        if not otp_uri:
+            _auth_error()
+
+        return otp_uri
+
+
+class AutenticadorPJe(AutenticadorBase):
+    """Implemente autenticação no PJe usando certificado.
+
+    A classe gerencia o fluxo de login com certificado
+    digital e fator duplo de autenticação.
+    """
+
+    def __init__(
+        self,
+        regiao: str = "1",
+        bot_driver: BotDriver | None = None,
+        *,
+        login_enxuto: bool = True,
+    ) -> None:
+        """Inicialize o autenticador com o driver e região.
+
+        Args:
+            regiao (str): Identificador da região do PJe.
+            bot_driver (BotDriver | None): Driver já iniciado (ex.:
+                emprestado de um PoolDrivers); quando informado, o
+                autenticador não o encerra em `fechar`.
+            login_enxuto (bool): Bloqueie imagens, fontes, estilos e
+                scripts de análise durante o login.
+
+        """
+        super().__init__(regiao)
+        self._driver_proprio = bot_driver is None
+        if bot_driver is None:
+            with self.medidor.fase("driver"):
+                bot_driver = BotDriver()
+
+        self.driver = bot_driver.driver
+        self.wait = bot_driver.wait
+        self.login_enxuto = login_enxuto
+
     def autenticar(self) -> bool:
         """Realize o login no PJe e retorne True se bem-sucedido.
 
@@ -92,31 +213,24 @@ class AutenticadorPJe:
 
         """
         sucesso_login = False
+        recursos = (
+            carregamento_enxuto(self.driver) if self.login_enxuto else nullcontext()
+        )
         try:
-            url = el.LINK_AUTENTICACAO_SSO.format(regiao=self.regiao)
-            self.driver.get(url)
+            with recursos:
+                if self._abrir_pagina_sso():
+                    return True
 
-            if "https://sso.cloud.pje.jus.br/" not in self.driver.current_url:
-                return True
+                self._login_certificado()
+                self._desafio_duplo_fator()
+                sucesso_login = self._aguardar_redirecionamento()
 
-            self.wait.until(
-                ec.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        el.CSS_FORM_LOGIN,
-                    )
-                ),
+        except ErroSSO as e:
+            self.print_message(
+                message=f"TRT{self.regiao}: SSO recusou o login: {e}",
+                message_type="error",
             )
 
-            self._login_certificado()
-            self._desafio_duplo_fator()
-            sucesso_login = WebDriverWait(
-                driver=self.driver,
-                timeout=10,
-                poll_frequency=0.3,
-                ignored_exceptions=(UnexpectedAlertPresentException),
-            ).until(ec.url_contains("pjekz"))
-
         except (
             TimeoutException,
             UnexpectedAlertPresentException,
@@ -131,55 +245,92 @@ class AutenticadorPJe:
 
         return sucesso_login
 
+    def _abrir_pagina_sso(self) -> bool:
+        """Abra o login da região e aguarde o formulário do SSO.
+
+        Returns:
+            bool: True se o PJe já considerou a sessão autenticada e
+                não redirecionou ao SSO.
+
+        """
+        with self.medidor.fase("pagina_sso"):
+            url = el.LINK_AUTENTICACAO_SSO.format(regiao=self.regiao)
+            self.driver.get(url)
+
+            if el.URL_SSO not in self.driver.current_url:
+                return True
+
+            self.wait.until(
+                ec.presence_of_element_located(
+                    (
+                        By.CSS_SELECTOR,
+                        el.CSS_FORM_LOGIN,
+                    )
+                ),
+            )
+
+        return False
+
     def _login_certificado(self) -> None:
         """Envie o desafio assinado ao endpoint do PJe.
 
         Gera UUID e desafio, assina, e submete o formulário.
         """
-        # enviar diretamente ao endpoint PJe (exemplo)
-        uuid_tarefa = str(uuid4())
-        desafio = random_base36()
-        assinador = Assinador()
-        conteudo_assinado = assinador.assinar_conteudo(desafio)
+        desafio, uuid_tarefa = self._enviar_desafio()
+        self._submeter_desafio(desafio, uuid_tarefa)
 
-        base64_conteudo = conteudo_assinado.conteudo_assinado_base64
-        cadeia_base64 = conteudo_assinado.cadeia_base64
+    def _submeter_desafio(self, desafio: str, uuid_tarefa: str) -> None:
+        """Preencha o formulário do SSO com o desafio e envie-o.
 
-        ssopayload = {
-            "uuid": uuid_tarefa,
-            "mensagem": desafio,
-            "assinatura": base64_conteudo,
-            "certChain": cadeia_base64,
-        }
-
-        resp = requests.post(ENDPOINT_DESAFIO, json=ssopayload, timeout=30)
-
-        if resp.status_code != NO_CONTENT_STATUS:
-            _auth_error()
+        Args:
+            desafio (str): Desafio registrado no endpoint do PJe.
+            uuid_tarefa (str): UUID da tarefa do desafio.
 
-        self.driver.execute_script(el.COMMAND, el.ID_INPUT_DESAFIO, desafio)
-        self.driver.execute_script(el.COMMAND, el.ID_CODIGO_PJE, uuid_tarefa)
-        self.driver.execute_script("document.forms[0].submit()")
+        """
+        with self.medidor.fase("envio_formulario"):
+            self.driver.execute_script(el.COMMAND, el.ID_INPUT_DESAFIO, desafio)
+            self.driver.execute_script(el.COMMAND, el.ID_CODIGO_PJE, uuid_tarefa)
+            self.driver.execute_script("document.forms[0].submit()")
 
     def _desafio_duplo_fator(self) -> None:
         """Preencha e envie o token OTP para confirmar login.
 
-        Obtém a URI OTP e envia o código ao formulário.
+        Aguarda o campo OTP antes de gerar o código, garantindo que
+        ele ainda tenha validade suficiente ao ser enviado.
+
+        Raises:
+            ErroSSO: Se o SSO recusar o certificado.
+            TimeoutException: Se o campo OTP não aparecer em 60s.
+
         """
-        otp_uri = self._get_otp_uri()
-        otp = str(pyotp.parse_uri(uri=otp_uri).now())
-
-        input_otp = WebDriverWait(self.driver, 60).until(
-            ec.presence_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    'input[id="otp"]',
-                )
-            ),
-        )
+        with self.medidor.fase("pagina_otp"):
+            if not aguardar_pagina(self.driver, seletor=el.CSS_INPUT_OTP, timeout=60):
+                raise TimeoutException("Campo OTP não apareceu no SSO")
 
-        input_otp.send_keys(otp)
-        input_otp.send_keys(Keys.ENTER)
+            input_otp = self.driver.find_element(By.CSS_SELECTOR, el.CSS_INPUT_OTP)
+
+        otp = self._gerar_otp()
+
+        with self.medidor.fase("otp_envio"):
+            input_otp.send_keys(otp)
+            input_otp.send_keys(Keys.ENTER)
+
+    def _aguardar_redirecionamento(self) -> bool:
+        """Aguarde o retorno autenticado ao PJe após o OTP.
+
+        Returns:
+            bool: True se a URL indicar sessão autenticada.
+
+        Raises:
+            ErroSSO: Se o SSO recusar o código OTP.
+
+        """
+        with self.medidor.fase("redirecionamento"):
+            return aguardar_pagina(
+                self.driver,
+                url_contem=el.TRECHO_URL_AUTENTICADO,
+                timeout=10,
+            )
 
     def _confirmar_login(self) -> bool:
         """Aguarde confirmação final do redirecionamento.
@@ -188,13 +339,12 @@ class AutenticadorPJe:
             bool: True se a URL indicar sessão autenticada.
 
         """
-        with suppress(TimeoutException):
-            return WebDriverWait(
-                driver=self.driver,
+        with suppress(ErroSSO):
+            return aguardar_pagina(
+                self.driver,
+                url_contem=el.TRECHO_URL_AUTENTICADO,
                 timeout=10,
-                poll_frequency=0.3,
-                ignored_exceptions=(UnexpectedAlertPresentException),
-            ).until(ec.url_contains("pjekz"))
+            )
 
         return False
 
@@ -215,19 +365,13 @@ class AutenticadorPJe:
         cookies_driver = self.driver.get_cookies()
         return {str(cookie["name"]): str(cookie["value"]) for cookie in cookies_driver}
 
-    def _get_otp_uri(self) -> str:
-        """Obtenha a URI OTP armazenada no keystore.
-
-        Procura a entrada pelo CPF do ambiente.
-        """
-        kp = KeyStore()
-        username = environ.get("CPF")
-        entries = kp.find_entries({"username": username})
-
-        if isinstance(entries, list):
-            return list(filter(lambda x: x.otp, entries))[-1].otp
+    def fechar(self) -> None:
+        """Encerre o navegador, se tiver sido criado pelo autenticador."""
+        if not self._driver_proprio:
+            return
 
-        return entries.otp
+        with suppress(Exception):
+            self.driver.quit()
 
 
 def _auth_error() -> NoReturn:
@@ -3,11 +3,32 @@
 from __future__ import annotations
 
 import base64
-from os import environ
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import cached_property
+from glob import glob
+from os import cpu_count, environ
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, cast
+from threading import Lock
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    ClassVar,
+    Literal,
+    NamedTuple,
+    Self,
+    cast,
+)
 
-import jpype
 from clear import clear
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
@@ -17,6 +38,7 @@ from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey
 from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.asymmetric.x448 import X448PrivateKey
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 from cryptography.hazmat.primitives.serialization import (
@@ -27,17 +49,15 @@ from cryptography.hazmat.primitives.serialization.pkcs12 import (
     PKCS12KeyAndCertificates,
     load_pkcs12,
 )
-
-# Importa classes Java
-from jpype import JArray, JByte, JClass
 from tqdm import tqdm
 from typer import Argument, Option, Typer
 
+from .pkipath import codificar_pkipath
+
 if TYPE_CHECKING:
-    from cryptography.x509 import Certificate
+    from collections.abc import Iterable, Iterator
 
-if not jpype.isJVMStarted():
-    jpype.startJVM()
+    from cryptography.x509 import Certificate
 
 app = Typer()
 
@@ -54,11 +74,74 @@ type PrivateKey = (
 )
 
 type Algoritmos = Literal["SHA256withRSA", "SHA1withRSA", "MD5withRSA"]
+type ChaveCache = tuple[str, int, int, str]
 
+TAMANHO_BLOCO = 1024 * 1024
 
-ByteArrayInputStream = JClass("java.io.ByteArrayInputStream")
-CertificateFactory = JClass("java.security.cert.CertificateFactory")
-ArrayList = JClass("java.util.ArrayList")
+
+class CadeiaCertificados:
+    """Cadeia de certificados com codificações calculadas uma vez.
+
+    A cadeia de um certificado carregado nunca muda, então o DER de
+    cada certificado, o PkiPath e seu base64 são gerados no primeiro
+    acesso e reaproveitados por todo ConteudoAssinado produzido.
+    """
+
+    def __init__(self, certificados: list[Certificate]) -> None:
+        """Inicialize a cadeia a partir dos certificados carregados.
+
+        Args:
+            certificados (list[Certificate]): Certificados na ordem da
+                cadeia (certificado final primeiro).
+
+        """
+        self.certificados: tuple[Certificate, ...] = tuple(certificados)
+
+    @classmethod
+    def do_pkcs12(cls, pkcs12: PKCS12KeyAndCertificates) -> Self:
+        """Monte a cadeia a partir de um PKCS#12 carregado.
+
+        Args:
+            pkcs12 (PKCS12KeyAndCertificates): Certificado carregado.
+
+        Returns:
+            Self: Cadeia com o certificado final primeiro.
+
+        """
+        return cls([
+            pkcs12.cert.certificate,
+            *(cert.certificate for cert in pkcs12.additional_certs),
+        ])
+
+    @cached_property
+    def der(self) -> tuple[bytes, ...]:
+        """Retorne os certificados da cadeia em DER.
+
+        Returns:
+            tuple[bytes, ...]: Certificados codificados em DER.
+
+        """
+        return tuple(cert.public_bytes(Encoding.DER) for cert in self.certificados)
+
+    @cached_property
+    def pkipath(self) -> bytes:
+        """Retorne a cadeia codificada em PkiPath.
+
+        Returns:
+            bytes: Estrutura PkiPath em DER.
+
+        """
+        return codificar_pkipath(self.der)
+
+    @cached_property
+    def pkipath_base64(self) -> str:
+        """Retorne a cadeia em PkiPath codificada em base64.
+
+        Returns:
+            str: PkiPath em base64.
+
+        """
+        return base64.b64encode(self.pkipath).decode("utf-8")
 
 
 class ConteudoAssinado:
@@ -66,21 +149,21 @@ class ConteudoAssinado:
 
     Attributes
     ----------
-    _chain : list[PKCS12Certificate]
+    _cadeia : CadeiaCertificados
         Cadeia de certificados utilizada na assinatura.
     _conteudo_assinado : bytes
         Conteúdo assinado em formato binário.
 
     """
 
-    _chain: list[PKCS12Certificate]
+    _cadeia: CadeiaCertificados
     _conteudo_assinado: bytes
 
     def __init__(
         self,
         conteudo_assinado: bytes,
         certificado: PKCS12Certificate,
-        cadeia: list[PKCS12Certificate],
+        cadeia: CadeiaCertificados,
     ) -> None:
         """Inicializa o ConteudoAssinado com o conteúdo assinado, certificado e cadeia de certificados.
 
@@ -90,43 +173,174 @@ class ConteudoAssinado:
             Conteúdo assinado em formato binário.
         certificado : PKCS12Certificate
             Certificado utilizado na assinatura.
-        cadeia : list[PKCS12Certificate]
-            Cadeia de certificados utilizada na assinatura.
+        cadeia : CadeiaCertificados
+            Cadeia de certificados compartilhada pelo Assinador.
 
         """
-        self._chain = cadeia
+        self._cadeia = cadeia
         self._cert = certificado
         self._conteudo_assinado = conteudo_assinado
 
-    @property
+    @cached_property
     def conteudo_assinado_base64(self) -> str:
         return base64.b64encode(self._conteudo_assinado).decode()
 
     @property
     def cadeia_base64(self) -> str:
+        """Retorne a cadeia de certificados em PkiPath base64.
+
+        Returns:
+            str: Cadeia codificada em PkiPath e base64.
+
+        """
+        return self._cadeia.pkipath_base64
+
+
+class CertificadoCarregado(NamedTuple):
+    """Material de chave decifrado de um PKCS#12.
+
+    Args:
+        pkcs12 (PKCS12KeyAndCertificates): Chave e certificados.
+        cadeia (CadeiaCertificados): Cadeia memorizada.
+        carregado_em (float): Instante do carregamento (monotônico).
+
+    """
+
+    pkcs12: PKCS12KeyAndCertificates
+    cadeia: CadeiaCertificados
+    carregado_em: float
+
+
+class CacheCertificados:
+    """Compartilhe certificados PKCS#12 já decifrados no processo.
+
+    A chave do cache combina caminho, mtime, tamanho e o hash da
+    senha, então um arquivo alterado em disco é relido
+    automaticamente. O acesso é seguro entre threads e cada
+    certificado é decifrado uma única vez, mesmo com chamadas
+    simultâneas.
+    """
+
+    def __init__(self, ttl: float | None = None) -> None:
+        """Inicialize o cache vazio.
+
+        Args:
+            ttl (float | None): Validade, em segundos, de cada item;
+                None mantém os itens até serem invalidados.
+
+        """
+        self.ttl = ttl
+        self._trava = Lock()
+        self._entradas: dict[ChaveCache, CertificadoCarregado] = {}
+        self._travas_carga: dict[ChaveCache, Lock] = {}
 
-        cf = CertificateFactory.getInstance("X.509")
-        java_chain = ArrayList()
+    def obter(self, caminho: str | Path, senha: bytes) -> CertificadoCarregado:
+        """Retorne o certificado decifrado, carregando se necessário.
+
+        Args:
+            caminho (str | Path): Caminho do arquivo PKCS#12.
+            senha (bytes): Senha do certificado.
+
+        Returns:
+            CertificadoCarregado: Material de chave compartilhado.
+
+        """
+        caminho = Path(caminho).resolve()
+        estado = caminho.stat()
+        chave = (
+            str(caminho),
+            estado.st_mtime_ns,
+            estado.st_size,
+            hashlib.sha256(senha).hexdigest(),
+        )
 
-        for cert in self._chain:
-            # converte o certificado DER em InputStream Java
-            der = cert.public_bytes(Encoding.DER)
-            der_array = JArray(JByte)(der)
-            bais = ByteArrayInputStream(der_array)
-            java_cert = cf.generateCertificate(bais)
-            java_chain.add(java_cert)
+        with self._trava:
+            entrada = self._valida(chave)
+            if entrada:
+                return entrada
 
-        # gera o CertPath e exporta em formato PkiPath
-        cert_path = cf.generateCertPath(java_chain)
-        pkipath_bytes = cert_path.getEncoded("PkiPath")
+            trava_carga = self._travas_carga.setdefault(chave, Lock())
 
-        return base64.b64encode(bytes(pkipath_bytes)).decode("utf-8")
+        # Decifra fora da trava global para não bloquear outros arquivos
+        with trava_carga:
+            try:
+                with self._trava:
+                    entrada = self._valida(chave)
+                if entrada:
+                    return entrada
+
+                pkcs12 = load_pkcs12(caminho.read_bytes(), senha)
+                entrada = CertificadoCarregado(
+                    pkcs12=pkcs12,
+                    cadeia=CadeiaCertificados.do_pkcs12(pkcs12),
+                    carregado_em=monotonic(),
+                )
+
+                with self._trava:
+                    # Versões antigas do mesmo arquivo deixam de ser úteis
+                    for antiga in [c for c in self._entradas if c[0] == chave[0]]:
+                        del self._entradas[antiga]
+
+                    self._entradas[chave] = entrada
+
+            finally:
+                # Também após falha (ex.: senha errada), para não acumular travas
+                with self._trava:
+                    self._travas_carga.pop(chave, None)
+
+        return entrada
+
+    def invalidar(self, caminho: str | Path | None = None) -> None:
+        """Descarte os certificados do cache.
+
+        Args:
+            caminho (str | Path | None): Arquivo a descartar; None
+                esvazia o cache inteiro.
+
+        """
+        with self._trava:
+            if caminho is None:
+                self._entradas.clear()
+                return
+
+            alvo = str(Path(caminho).resolve())
+            for chave in [c for c in self._entradas if c[0] == alvo]:
+                del self._entradas[chave]
+
+    def _valida(
+        self,
+        chave: ChaveCache,
+    ) -> CertificadoCarregado | None:
+        """Retorne a entrada se existir e não estiver expirada.
+
+        Deve ser chamada com a trava global adquirida.
+
+        Args:
+            chave (ChaveCache): Chave da entrada.
+
+        Returns:
+            CertificadoCarregado | None: Entrada válida ou None.
+
+        """
+        entrada = self._entradas.get(chave)
+        if (
+            entrada
+            and self.ttl is not None
+            and monotonic() - entrada.carregado_em > self.ttl
+        ):
+            del self._entradas[chave]
+            return None
+
+        return entrada
+
+
+cache_certificados = CacheCertificados()
 
 
 class Assinador:
     """Classe responsável por assinar conteúdos utilizando certificados digitais."""
 
-    _chain: list[Certificate]
+    _cadeia: CadeiaCertificados = None
     _certificado_carregado: PKCS12KeyAndCertificates = None
     algoritmos_suportados: ClassVar[dict[Algoritmos, hashes.HashAlgorithm]] = {
         "SHA256withRSA": hashes.SHA256(),
@@ -136,23 +350,39 @@ class Assinador:
 
     def __init__(
         self,
-        certificado: str | None = None,
+        certificado: str | Path | None = None,
         senha_certificado: str | None = None,
+        cache: CacheCertificados | None = cache_certificados,
     ) -> None:
         """Inicialize o objeto Assinador com o certificado digital e senha.
 
         Args:
-            certificado (str | None): Caminho para o certificado digital.
-            senha_certificado (str | None): Senha do certificado digital.
+            certificado (str | Path | None): Caminho para o certificado
+                digital (padrão: variável CERTIFICADO).
+            senha_certificado (str | None): Senha do certificado digital
+                (padrão: variável SENHA_CERTIFICADO).
+            cache (CacheCertificados | None): Cache de certificados
+                decifrados; None força a leitura do arquivo.
 
         """
-        certificado = environ.get("CERTIFICADO")
-        senha_certificado = environ.get("SENHA_CERTIFICADO")
+        certificado = certificado or environ.get("CERTIFICADO")
+        senha_certificado = senha_certificado or environ.get("SENHA_CERTIFICADO")
+
+        # Mantidos para recarregar o certificado em processos filhos
+        self._origem = (str(certificado), senha_certificado)
 
         senha_certificado = senha_certificado.encode()
-        certificado = Path(certificado).read_bytes()
 
-        self.certificado_carregado = load_pkcs12(certificado, senha_certificado)
+        if cache is None:
+            self.certificado_carregado = load_pkcs12(
+                Path(certificado).read_bytes(),
+                senha_certificado,
+            )
+            return
+
+        carregado = cache.obter(certificado, senha_certificado)
+        self._certificado_carregado = carregado.pkcs12
+        self._cadeia = carregado.cadeia
 
     def assinar_conteudo(
         self,
@@ -160,23 +390,192 @@ class Assinador:
         algoritmo_assinatura: Algoritmos = "MD5withRSA",
     ) -> ConteudoAssinado:
 
+        return self._embalar(self._assinar(conteudo, algoritmo_assinatura))
+
+    def assinar_arquivo(
+        self,
+        caminho: str | Path,
+        algoritmo_assinatura: Algoritmos = "MD5withRSA",
+    ) -> ConteudoAssinado:
+        """Assine um arquivo lendo-o em blocos de tamanho fixo.
+
+        O resumo é calculado incrementalmente e assinado como
+        `Prehashed`, gerando a mesma assinatura de
+        `assinar_conteudo` com memória constante.
+
+        Args:
+            caminho (str | Path): Arquivo a assinar.
+            algoritmo_assinatura (Algoritmos): Algoritmo utilizado.
+
+        Returns:
+            ConteudoAssinado: Assinatura do arquivo.
+
+        """
+        return self._embalar(self._assinar(Path(caminho), algoritmo_assinatura))
+
+    def assinar_lote(
+        self,
+        conteudos: Iterable[str | bytes | Path],
+        algoritmo_assinatura: Algoritmos = "MD5withRSA",
+        max_workers: int | None = None,
+        *,
+        processos: bool = False,
+        ordenado: bool = True,
+    ) -> Iterator[tuple[int, ConteudoAssinado]]:
+        """Assine vários conteúdos em paralelo.
+
+        A assinatura RSA do cryptography libera o GIL, então threads
+        já escalam entre núcleos; processos ficam disponíveis para
+        chaves cuja assinatura não libere o GIL. Apenas uma janela
+        limitada de conteúdos fica em memória por vez.
+
+        Args:
+            conteudos (Iterable[str | bytes | Path]): Conteúdos a
+                assinar; caminhos são lidos em blocos.
+            algoritmo_assinatura (Algoritmos): Algoritmo utilizado.
+            max_workers (int | None): Quantidade de workers (padrão:
+                núcleos disponíveis).
+            processos (bool): Use processos em vez de threads.
+            ordenado (bool): Entregue na ordem de entrada; False
+                entrega conforme cada assinatura termina.
+
+        Yields:
+            tuple[int, ConteudoAssinado]: Índice do conteúdo na
+                entrada e o conteúdo assinado.
+
+        Raises:
+            ValueError: Quando o algoritmo não é suportado.
+
+        """
+        self._algoritmo(algoritmo_assinatura)
+        max_workers = max_workers or cpu_count() or 1
+
+        if processos:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_inicializar_processo,
+                initargs=self._origem,
+            )
+            tarefa = _assinar_em_processo
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            tarefa = self._assinar
+
+        with executor:
+            pendentes: dict[Future[bytes], int] = {}
+            # A ordem de envio só importa na entrega ordenada
+            fila: deque[Future[bytes]] | None = deque() if ordenado else None
+            limite = max_workers * 2
+
+            for indice, conteudo in enumerate(conteudos):
+                futuro = executor.submit(tarefa, conteudo, algoritmo_assinatura)
+                pendentes[futuro] = indice
+                if fila is not None:
+                    fila.append(futuro)
+
+                if len(pendentes) >= limite:
+                    yield from self._concluidos(pendentes, fila)
+
+            while pendentes:
+                yield from self._concluidos(pendentes, fila)
+
+    def _concluidos(
+        self,
+        pendentes: dict[Future[bytes], int],
+        fila: deque[Future[bytes]] | None,
+    ) -> Iterator[tuple[int, ConteudoAssinado]]:
+        """Aguarde e entregue as próximas assinaturas prontas.
+
+        Args:
+            pendentes (dict[Future[bytes], int]): Futuros em execução
+                e seus índices.
+            fila (deque[Future[bytes]] | None): Futuros em ordem de
+                envio, na entrega ordenada; None entrega o que
+                terminar primeiro.
+
+        Yields:
+            tuple[int, ConteudoAssinado]: Índice e conteúdo assinado.
+
+        """
+        if fila is not None:
+            prontos = [fila.popleft()]
+        else:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+
+        for futuro in prontos:
+            indice = pendentes.pop(futuro)
+            yield indice, self._embalar(futuro.result())
+
+    def _assinar(
+        self,
+        conteudo: str | bytes | Path,
+        algoritmo_assinatura: Algoritmos,
+    ) -> bytes:
+        """Assine o conteúdo e retorne a assinatura bruta.
+
+        Args:
+            conteudo (str | bytes | Path): Conteúdo ou arquivo a
+                assinar.
+            algoritmo_assinatura (Algoritmos): Algoritmo utilizado.
+
+        Returns:
+            bytes: Assinatura PKCS#1 v1.5.
+
+        """
+        algoritmo = self._algoritmo(algoritmo_assinatura)
+        pad = padding.PKCS1v15()
+
+        if isinstance(conteudo, Path):
+            return cast(
+                "bytes",
+                self.chave.sign(
+                    _resumo_arquivo(conteudo, algoritmo),
+                    pad,
+                    Prehashed(algoritmo),
+                ),
+            )
+
         if isinstance(conteudo, str):
             conteudo = conteudo.encode()
 
+        return cast(
+            "bytes",
+            self.chave.sign(conteudo, pad, algoritmo),
+        )
+
+    def _algoritmo(self, algoritmo_assinatura: Algoritmos) -> hashes.HashAlgorithm:
+        """Obtenha o hash correspondente ao algoritmo informado.
+
+        Args:
+            algoritmo_assinatura (Algoritmos): Nome do algoritmo.
+
+        Returns:
+            hashes.HashAlgorithm: Algoritmo de hash.
+
+        Raises:
+            ValueError: Quando o algoritmo não é suportado.
+
+        """
         algoritmo = self.algoritmos_suportados.get(algoritmo_assinatura)
         if not algoritmo:
             raise ValueError("Algoritmo não suportado: " + algoritmo_assinatura)
 
-        pad = padding.PKCS1v15()
-        conteudo_assinado = cast(
-            "bytes",
-            self.chave.sign(conteudo, pad, algoritmo),
-        )
+        return algoritmo
+
+    def _embalar(self, conteudo_assinado: bytes) -> ConteudoAssinado:
+        """Associe a assinatura ao certificado e à cadeia.
 
+        Args:
+            conteudo_assinado (bytes): Assinatura bruta.
+
+        Returns:
+            ConteudoAssinado: Assinatura com a cadeia compartilhada.
+
+        """
         return ConteudoAssinado(
             conteudo_assinado=conteudo_assinado,
             certificado=self.certficado,
-            cadeia=self.cadeia,
+            cadeia=self.cadeia_certificados,
         )
 
     @property
@@ -186,6 +585,7 @@ class Assinador:
     @certificado_carregado.setter
     def certificado_carregado(self, valor: PKCS12KeyAndCertificates) -> None:
         self._certificado_carregado = valor
+        self._cadeia = CadeiaCertificados.do_pkcs12(valor)
 
     @property
     def chave(self) -> PrivateKey:
@@ -197,14 +597,66 @@ class Assinador:
 
     @property
     def cadeia(self) -> list[PKCS12Certificate]:
-        chain = [self.certficado]
-        chain.extend(
-            [
-                cert.certificate
-                for cert in self.certificado_carregado.additional_certs
-            ],
-        )
-        return chain
+        return list(self._cadeia.certificados)
+
+    @property
+    def cadeia_certificados(self) -> CadeiaCertificados:
+        """Obtenha a cadeia memorizada do certificado carregado."""
+        return self._cadeia
+
+
+def _resumo_arquivo(caminho: Path, algoritmo: hashes.HashAlgorithm) -> bytes:
+    """Calcule o resumo do arquivo lendo blocos de tamanho fixo.
+
+    Args:
+        caminho (Path): Arquivo a resumir.
+        algoritmo (hashes.HashAlgorithm): Algoritmo de hash.
+
+    Returns:
+        bytes: Resumo do conteúdo do arquivo.
+
+    """
+    resumo = hashes.Hash(algoritmo)
+    bloco = bytearray(TAMANHO_BLOCO)
+    visao = memoryview(bloco)
+
+    with caminho.open("rb") as arquivo:
+        while lidos := arquivo.readinto(bloco):
+            resumo.update(visao[:lidos])
+
+    return resumo.finalize()
+
+
+_assinador_processo: Assinador | None = None
+
+
+def _inicializar_processo(certificado: str, senha_certificado: str) -> None:
+    """Carregue o certificado uma vez em cada processo filho.
+
+    Args:
+        certificado (str): Caminho do certificado digital.
+        senha_certificado (str): Senha do certificado digital.
+
+    """
+    global _assinador_processo  # noqa: PLW0603
+    _assinador_processo = Assinador(certificado, senha_certificado)
+
+
+def _assinar_em_processo(
+    conteudo: str | bytes | Path,
+    algoritmo_assinatura: Algoritmos,
+) -> bytes:
+    """Assine o conteúdo com o certificado do processo filho.
+
+    Args:
+        conteudo (str | bytes | Path): Conteúdo ou arquivo a assinar.
+        algoritmo_assinatura (Algoritmos): Algoritmo utilizado.
+
+    Returns:
+        bytes: Assinatura bruta.
+
+    """
+    return _assinador_processo._assinar(conteudo, algoritmo_assinatura)  # noqa: SLF001
 
 
 if __name__ == "__main__":
@@ -238,8 +690,9 @@ if __name__ == "__main__":
             certificado=caminho_certificado,
             senha_certificado=senha_certificado,
         )
-        conteudo_assinado = assinador.assinar_conteudo(
-            caminho_arquivo.read_bytes(),
+        conteudo_assinado = assinador.assinar_arquivo(
+            caminho_arquivo,
+            algoritmo or "MD5withRSA",
         )
 
         clear()
@@ -255,4 +708,71 @@ Base64 conteúdo:
 =============================
 """)
 
+    @app.command()
+    def assinar_lote(
+        origem: Annotated[str, Argument()],
+        certificado: Annotated[str, Option()],
+        senha_certificado: Annotated[str, Option()],
+        manifesto: Annotated[str, Option()] = "assinaturas.ndjson",
+        algoritmo: Annotated[str, Option()] = "MD5withRSA",
+        workers: Annotated[int | None, Option()] = None,
+        processos: Annotated[bool, Option()] = False,
+    ) -> None:
+        """Assina todos os arquivos de um diretório ou padrão glob.
+
+        Cada assinatura é gravada como uma linha JSON no manifesto,
+        na ordem dos arquivos.
+
+        Parameters
+        ----------
+        origem : str
+            Diretório ou padrão glob (ex.: "docs/**/*.pdf").
+        certificado : str
+            Caminho para o arquivo do certificado digital.
+        senha_certificado : str
+            Senha do certificado digital.
+        manifesto : str
+            Arquivo NDJSON de saída.
+        algoritmo : Algoritmos
+            Algoritmo de assinatura a ser utilizado.
+        workers : int, optional
+            Quantidade de assinaturas simultâneas.
+        processos : bool
+            Usa processos em vez de threads.
+
+        """
+        caminho_origem = Path(origem)
+        if caminho_origem.is_dir():
+            arquivos = sorted(p for p in caminho_origem.iterdir() if p.is_file())
+        else:
+            arquivos = sorted(
+                Path(p) for p in glob(origem, recursive=True) if Path(p).is_file()
+            )
+
+        assinador = Assinador(
+            certificado=Path(certificado).resolve(),
+            senha_certificado=senha_certificado,
+        )
+        assinaturas = assinador.assinar_lote(
+            arquivos,
+            algoritmo_assinatura=algoritmo,
+            max_workers=workers,
+            processos=processos,
+        )
+
+        with (
+            Path(manifesto).open("w", encoding="utf-8") as saida,
+            tqdm(total=len(arquivos), desc="Assinando") as progresso,
+        ):
+            for indice, conteudo_assinado in assinaturas:
+                registro = {
+                    "arquivo": str(arquivos[indice]),
+                    "algoritmo": algoritmo,
+                    "assinatura": conteudo_assinado.conteudo_assinado_base64,
+                }
+                saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                progresso.update()
+
+        tqdm.write(f"Manifesto: {Path(manifesto).resolve().as_uri()}")
+
     app()
@@ -0,0 +1,356 @@
+"""Autentique no PJe a partir de um loop asyncio.
+
+O `AsyncAutenticadorPJe` percorre as mesmas etapas do
+`AutenticadorPJe`, mas sem prender o loop: o desafio é enviado ao
+`pjeoffice-rest` com httpx assíncrono, e as chamadas bloqueantes
+(abertura do Chrome, Selenium, assinatura e KDF do KeePass) rodam em
+um executor com número limitado de threads. Timeout e cancelamento
+encerram o navegador, o que também interrompe a etapa bloqueante em
+andamento.
+
+Requer o extra `async` (httpx).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING, Self
+
+from tqdm import tqdm
+
+from autenticapje import NO_CONTENT_STATUS, AutenticadorPJe, _auth_error
+from autenticapje.driver.eventos import ErroSSO
+from autenticapje.driver.recursos import bloquear_recursos, liberar_recursos
+
+from .elements import pje as el
+from .sessao import HTTP_OK_STATUS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor, Future
+
+    import httpx
+
+    from autenticapje.driver import BotDriver
+    from autenticapje.metricas import Medidor
+    from autenticapje.sessao import SessaoArmazenada
+
+type AnyType = any
+
+LIMITE_THREADS = 32
+TIMEOUT_LOGIN = 120.0
+TIMEOUT_HTTP = 30.0
+
+_executor_padrao: ThreadPoolExecutor | None = None
+_trava_executor = Lock()
+
+
+def executor_padrao() -> ThreadPoolExecutor:
+    """Retorne o executor compartilhado pelas etapas bloqueantes.
+
+    Limita a `LIMITE_THREADS` as chamadas bloqueantes simultâneas,
+    independentemente de quantas tarefas de login estejam no loop.
+
+    Returns:
+        ThreadPoolExecutor: Executor criado na primeira chamada.
+
+    """
+    global _executor_padrao  # noqa: PLW0603
+
+    with _trava_executor:
+        if _executor_padrao is None:
+            _executor_padrao = ThreadPoolExecutor(
+                max_workers=LIMITE_THREADS,
+                thread_name_prefix="autenticapje-async",
+            )
+
+        return _executor_padrao
+
+
+class AsyncAutenticadorPJe:
+    """Versão asyncio do AutenticadorPJe, com navegador.
+
+    Cada etapa bloqueante é despachada ao executor, então centenas de
+    tarefas podem aguardar no mesmo loop sem ocupar uma thread cada.
+    """
+
+    def __init__(
+        self,
+        regiao: str = "1",
+        bot_driver: BotDriver | None = None,
+        executor: Executor | None = None,
+        cliente: httpx.AsyncClient | None = None,
+        *,
+        login_enxuto: bool = True,
+    ) -> None:
+        """Inicialize o autenticador sem abrir o navegador.
+
+        Args:
+            regiao (str): Identificador da região do PJe.
+            bot_driver (BotDriver | None): Driver já iniciado (ex.:
+                de um PoolDrivers); não é encerrado em `fechar`, e
+                quem o emprestou deve reciclá-lo após um timeout.
+            executor (Executor | None): Executor das etapas
+                bloqueantes (padrão: `executor_padrao()`).
+            cliente (httpx.AsyncClient | None): Cliente HTTP
+                compartilhado; sem ele, cada login usa o seu.
+            login_enxuto (bool): Bloqueie imagens, fontes, estilos e
+                scripts de análise durante o login.
+
+        """
+        self.regiao = regiao
+        self.login_enxuto = login_enxuto
+        self._bot_driver = bot_driver
+        self._executor = executor or executor_padrao()
+        self._cliente = cliente
+        self._autenticador: AutenticadorPJe | None = None
+
+    @property
+    def medidor(self) -> Medidor | None:
+        """Medições do login (None antes de `abrir`)."""
+        return self._autenticador.medidor if self._autenticador else None
+
+    async def abrir(self) -> AutenticadorPJe:
+        """Abra o navegador no executor, se ainda não estiver aberto.
+
+        Returns:
+            AutenticadorPJe: Autenticador síncrono usado nas etapas.
+
+        """
+        if self._autenticador is None:
+            futuro = self._executor.submit(
+                AutenticadorPJe,
+                self.regiao,
+                bot_driver=self._bot_driver,
+                login_enxuto=self.login_enxuto,
+            )
+            try:
+                self._autenticador = await asyncio.wrap_future(futuro)
+            except asyncio.CancelledError:
+                # O Chrome termina de abrir na thread: encerre-o ao ficar pronto
+                futuro.add_done_callback(_fechar_ao_concluir)
+                raise
+
+        return self._autenticador
+
+    async def autenticar(self, timeout: float | None = TIMEOUT_LOGIN) -> bool:
+        """Realize o login no PJe sem bloquear o loop.
+
+        Ao esgotar o tempo, o navegador é encerrado e o resultado é
+        False. Se a tarefa for cancelada, o navegador também é
+        encerrado antes de propagar o cancelamento.
+
+        Args:
+            timeout (float | None): Tempo máximo do login completo,
+                incluindo a abertura do navegador.
+
+        Returns:
+            bool: Indica se o login foi realizado com sucesso.
+
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._autenticar()
+
+        except TimeoutError:
+            tqdm.write(f"[ERRO] TRT{self.regiao}: login excedeu {timeout}s")
+            await self.fechar()
+            return False
+
+        except asyncio.CancelledError:
+            await asyncio.shield(self.fechar())
+            raise
+
+    async def cookies_requests(self) -> dict[str, str]:
+        """Retorne os cookies atuais no formato "Py".
+
+        Returns:
+            dict[str, str]: Mapa nome -> valor dos cookies.
+
+        """
+        autenticador = await self.abrir()
+        return await self._executar(autenticador.get_cookies_for_requests)
+
+    async def cookies_navegador(self) -> list[dict]:
+        """Retorne os cookies atuais no formato do navegador.
+
+        Returns:
+            list[dict]: Cookies do navegador.
+
+        """
+        autenticador = await self.abrir()
+        return await self._executar(autenticador.get_cookies_browser)
+
+    async def fechar(self) -> None:
+        """Encerre o navegador, se tiver sido criado pelo autenticador.
+
+        Usa uma thread fora do executor limitado, para que a limpeza
+        não fique na fila atrás de outros logins.
+        """
+        if self._autenticador:
+            await asyncio.to_thread(self._autenticador.fechar)
+
+    async def __aenter__(self) -> Self:
+        """Retorne o próprio autenticador para uso em `async with`.
+
+        Returns:
+            Self: Este autenticador.
+
+        """
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Encerre o navegador ao sair do bloco.
+
+        Args:
+            *args (object): Informações da exceção, se houver.
+
+        """
+        await self.fechar()
+
+    async def _autenticar(self) -> bool:
+        """Percorra as etapas do login alternando loop e executor.
+
+        Returns:
+            bool: Indica se o login foi realizado com sucesso.
+
+        """
+        autenticador = await self.abrir()
+        driver = autenticador.driver
+
+        bloqueio = self.login_enxuto and await self._executar(
+            partial(bloquear_recursos, driver),
+        )
+        sucesso_login = False
+        try:
+            if await self._executar(autenticador._abrir_pagina_sso):  # noqa: SLF001
+                sucesso_login = True
+            else:
+                desafio, uuid_tarefa = await self._enviar_desafio(autenticador)
+                await self._executar(
+                    partial(
+                        autenticador._submeter_desafio,  # noqa: SLF001
+                        desafio,
+                        uuid_tarefa,
+                    ),
+                )
+                await self._executar(autenticador._desafio_duplo_fator)  # noqa: SLF001
+                sucesso_login = await self._executar(
+                    autenticador._aguardar_redirecionamento,  # noqa: SLF001
+                )
+
+        except ErroSSO as e:
+            autenticador.print_message(
+                message=f"TRT{self.regiao}: SSO recusou o login: {e}",
+                message_type="error",
+            )
+
+        except Exception as e:  # noqa: BLE001
+            exc = "\n".join(traceback.format_exception(e))
+            autenticador.print_message(
+                message=f"Erro ao realizar autenticação: {exc}",
+                message_type="error",
+            )
+
+        # Em timeout/cancelamento o navegador é encerrado e o bloqueio some junto
+        if bloqueio:
+            await self._executar(partial(liberar_recursos, driver))
+
+        return sucesso_login
+
+    async def _enviar_desafio(self, autenticador: AutenticadorPJe) -> tuple[str, str]:
+        """Assine o desafio no executor e registre-o com httpx.
+
+        Args:
+            autenticador (AutenticadorPJe): Autenticador síncrono.
+
+        Returns:
+            tuple[str, str]: Desafio assinado e UUID da tarefa.
+
+        """
+        import httpx  # noqa: PLC0415
+
+        ssopayload = await self._executar(autenticador._assinar_desafio)  # noqa: SLF001
+
+        with autenticador.medidor.fase("desafio"):
+            if self._cliente:
+                resp = await self._cliente.post(el.ENDPOINT_DESAFIO, json=ssopayload)
+            else:
+                async with httpx.AsyncClient(timeout=TIMEOUT_HTTP) as cliente:
+                    resp = await cliente.post(el.ENDPOINT_DESAFIO, json=ssopayload)
+
+        if resp.status_code != NO_CONTENT_STATUS:
+            _auth_error()
+
+        return ssopayload["mensagem"], ssopayload["uuid"]
+
+    async def _executar[T](self, funcao: Callable[[], T]) -> T:
+        """Execute uma etapa bloqueante no executor.
+
+        Args:
+            funcao (Callable[[], T]): Etapa sem argumentos.
+
+        Returns:
+            T: Retorno da etapa.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, funcao)
+
+
+def _fechar_ao_concluir(futuro: Future[AutenticadorPJe]) -> None:
+    """Encerre o navegador aberto por uma tarefa já cancelada.
+
+    Args:
+        futuro (Future[AutenticadorPJe]): Criação do autenticador.
+
+    """
+    if not futuro.cancelled() and futuro.exception() is None:
+        futuro.result().fechar()
+
+
+async def verificar_sessao(
+    sessao: SessaoArmazenada,
+    cliente: httpx.AsyncClient | None = None,
+    timeout: float = 5,
+) -> bool:
+    """Verifique uma sessão salva com uma requisição assíncrona.
+
+    Equivale a `CacheSessoes.verificar`, para renovar muitas sessões
+    do mesmo loop sem threads.
+
+    Args:
+        sessao (SessaoArmazenada): Sessão a verificar.
+        cliente (httpx.AsyncClient | None): Cliente compartilhado.
+        timeout (float): Tempo máximo da requisição.
+
+    Returns:
+        bool: True se o PJe aceitar os cookies da sessão.
+
+    """
+    import httpx  # noqa: PLC0415
+
+    url = el.LINK_VERIFICA_SESSAO.format(trt_id=sessao["regiao"])
+    # Cookies por requisição foram descontinuados no httpx: vão no cabeçalho
+    cabecalho_cookie = "; ".join(
+        f"{nome}={valor}" for nome, valor in sessao["cookies_requests"].items()
+    )
+    requisicao: dict[str, AnyType] = {
+        "headers": {"Cookie": cabecalho_cookie},
+        "follow_redirects": False,
+        "timeout": timeout,
+    }
+    try:
+        if cliente:
+            resp = await cliente.get(url, **requisicao)
+        else:
+            async with httpx.AsyncClient() as avulso:
+                resp = await avulso.get(url, **requisicao)
+    except httpx.HTTPError:
+        return False
+
+    return resp.status_code == HTTP_OK_STATUS
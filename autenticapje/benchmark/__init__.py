@@ -0,0 +1,303 @@
+"""Meça os caminhos críticos do login e compare com uma referência.
+
+Os casos rodam offline sobre fixtures geradas na hora (certificado
+PKCS#12 e banco KeePass). As medições podem ser salvas como
+referência; execuções seguintes falham quando algum caso fica mais
+lento que a referência além da tolerância.
+
+O caso ponta a ponta (`autenticar[http]`) roda o login completo
+contra o `ServidorSimulado`, sem acesso à rede.
+
+Execute com `python -m autenticapje.benchmark --help`.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import platform
+from contextlib import redirect_stdout
+from statistics import median
+from timeit import Timer
+from typing import TYPE_CHECKING, TypedDict
+
+from cryptography.hazmat.primitives.serialization.pkcs12 import load_pkcs12
+
+from autenticapje.assinador import (
+    Assinador,
+    CacheCertificados,
+    CadeiaCertificados,
+    ConteudoAssinado,
+)
+from autenticapje.formatadores import random_base36
+from autenticapje.keystore import IndiceOTP, KeyStore
+from autenticapje.regioes import MODOS_LOGIN, ModoLogin
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from .fixtures import Fixtures
+
+type CasoBenchmark = Callable[[], object]
+
+REPETICOES_PADRAO = 5
+TOLERANCIA_PADRAO = 0.25
+
+
+class Medicao(TypedDict):
+    """Resultado de um caso de benchmark.
+
+    Args:
+        nome (str): Identificador do caso.
+        iteracoes (int): Chamadas por rodada.
+        repeticoes (int): Rodadas executadas.
+        mediana (float): Segundos por chamada (mediana das rodadas).
+        minimo (float): Segundos por chamada na rodada mais rápida.
+
+    """
+
+    nome: str
+    iteracoes: int
+    repeticoes: int
+    mediana: float
+    minimo: float
+
+
+class Comparacao(TypedDict):
+    """Comparação de um caso com a referência salva.
+
+    Args:
+        nome (str): Identificador do caso.
+        atual (float): Mediana atual, em segundos por chamada.
+        referencia (float | None): Mediana da referência, se houver.
+        variacao (float | None): Variação relativa (0.1 = 10% mais
+            lento).
+        regressao (bool): Indica se a variação passou da tolerância.
+
+    """
+
+    nome: str
+    atual: float
+    referencia: float | None
+    variacao: float | None
+    regressao: bool
+
+
+def casos_padrao(fixtures: Fixtures) -> dict[str, CasoBenchmark]:
+    """Monte os casos de benchmark sobre as fixtures informadas.
+
+    Args:
+        fixtures (Fixtures): Certificado e banco KeePass gerados.
+
+    Returns:
+        dict[str, CasoBenchmark]: Casos por nome.
+
+    """
+    pkcs12 = fixtures.certificado.read_bytes()
+    senha_certificado = fixtures.senha_certificado.encode()
+    assinador = Assinador(
+        certificado=fixtures.certificado,
+        senha_certificado=fixtures.senha_certificado,
+        cache=CacheCertificados(),
+    )
+    cadeia = assinador.cadeia
+    keystore = KeyStore(str(fixtures.kdbx), fixtures.senha_kdbx)
+    indice = IndiceOTP()
+
+    casos: dict[str, CasoBenchmark] = {
+        f"assinar_conteudo[{algoritmo}]": (
+            lambda algoritmo=algoritmo: assinador.assinar_conteudo(
+                random_base36(),
+                algoritmo,
+            )
+        )
+        for algoritmo in Assinador.algoritmos_suportados
+    }
+    casos["cadeia_base64"] = lambda: ConteudoAssinado(
+        b"",
+        cadeia[0],
+        CadeiaCertificados(cadeia),
+    ).cadeia_base64
+    casos["carregar_pkcs12"] = lambda: load_pkcs12(pkcs12, senha_certificado)
+    casos["find_entries"] = lambda: keystore.find_entries(
+        {"username": fixtures.usuario, "first": True},
+    )
+    casos["indice_otp"] = lambda: indice.obter(
+        fixtures.usuario,
+        str(fixtures.kdbx),
+        fixtures.senha_kdbx,
+    )
+    casos["random_base36"] = random_base36
+    return casos
+
+
+def caso_autenticar(modo: ModoLogin = "http", regiao: str = "1") -> CasoBenchmark:
+    """Monte o caso de login completo, do autenticador aos cookies.
+
+    As URLs e as variáveis de ambiente já devem apontar para o
+    simulador (ver `autenticapje.simulador.apontar_urls`).
+
+    Args:
+        modo (ModoLogin): "http" ou "navegador" (requer Chrome).
+        regiao (str): Região autenticada.
+
+    Returns:
+        CasoBenchmark: Função que executa um login.
+
+    """
+
+    def autenticar() -> None:
+        # As mensagens de progresso do login poluiriam a saída
+        with redirect_stdout(io.StringIO()):
+            autenticador = MODOS_LOGIN[modo](regiao)
+            # Sem esperar a virada da janela do OTP (até MARGEM_MINIMA),
+            # que faria o tempo do caso variar conforme o relógio
+            autenticador.estrategia_otp = "proxima"
+            try:
+                if not autenticador.autenticar():
+                    raise RuntimeError(f"Login ponta a ponta falhou (TRT{regiao})")
+            finally:
+                autenticador.fechar()
+
+    return autenticar
+
+
+def medir(
+    nome: str,
+    caso: CasoBenchmark,
+    repeticoes: int = REPETICOES_PADRAO,
+) -> Medicao:
+    """Meça o caso calibrando as iterações de cada rodada.
+
+    Uma chamada de aquecimento é feita antes, para que caches e
+    inicializações preguiçosas não contaminem a medição.
+
+    Args:
+        nome (str): Identificador do caso.
+        caso (CasoBenchmark): Função medida.
+        repeticoes (int): Rodadas cronometradas.
+
+    Returns:
+        Medicao: Tempos por chamada.
+
+    """
+    caso()
+    timer = Timer(caso)
+    iteracoes, _ = timer.autorange()
+    iteracoes = max(1, iteracoes)
+
+    tempos = [
+        tempo / iteracoes
+        for tempo in timer.repeat(repeat=repeticoes, number=iteracoes)
+    ]
+    return Medicao(
+        nome=nome,
+        iteracoes=iteracoes,
+        repeticoes=repeticoes,
+        mediana=median(tempos),
+        minimo=min(tempos),
+    )
+
+
+def executar(
+    casos: dict[str, CasoBenchmark],
+    filtro: str | None = None,
+    repeticoes: int = REPETICOES_PADRAO,
+) -> Iterator[Medicao]:
+    """Meça os casos cujo nome contém o filtro.
+
+    Args:
+        casos (dict[str, CasoBenchmark]): Casos por nome.
+        filtro (str | None): Trecho do nome a selecionar.
+        repeticoes (int): Rodadas cronometradas por caso.
+
+    Yields:
+        Medicao: Resultado de cada caso, na ordem informada.
+
+    """
+    for nome, caso in casos.items():
+        if filtro and filtro not in nome:
+            continue
+
+        yield medir(nome, caso, repeticoes=repeticoes)
+
+
+def salvar_referencia(medicoes: Iterable[Medicao], arquivo: Path) -> None:
+    """Grave as medições como referência para comparações futuras.
+
+    Casos já presentes na referência e não medidos agora são
+    preservados.
+
+    Args:
+        medicoes (Iterable[Medicao]): Medições a gravar.
+        arquivo (Path): Arquivo JSON da referência.
+
+    """
+    referencia = carregar_referencia(arquivo)
+    referencia.update({medicao["nome"]: medicao for medicao in medicoes})
+
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    arquivo.write_text(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "maquina": platform.machine(),
+                "medicoes": list(referencia.values()),
+            },
+            indent=2,
+        ),
+    )
+
+
+def carregar_referencia(arquivo: Path) -> dict[str, Medicao]:
+    """Leia a referência salva.
+
+    Args:
+        arquivo (Path): Arquivo JSON da referência.
+
+    Returns:
+        dict[str, Medicao]: Medições por nome (vazio se ausente).
+
+    """
+    if not arquivo.exists():
+        return {}
+
+    dados = json.loads(arquivo.read_text())
+    return {medicao["nome"]: medicao for medicao in dados["medicoes"]}
+
+
+def comparar(
+    medicoes: Iterable[Medicao],
+    referencia: dict[str, Medicao],
+    tolerancia: float = TOLERANCIA_PADRAO,
+) -> list[Comparacao]:
+    """Compare as medições com a referência.
+
+    Args:
+        medicoes (Iterable[Medicao]): Medições atuais.
+        referencia (dict[str, Medicao]): Medições de referência.
+        tolerancia (float): Piora relativa aceita (0.25 = 25%).
+
+    Returns:
+        list[Comparacao]: Uma comparação por medição.
+
+    """
+    comparacoes = []
+    for medicao in medicoes:
+        anterior = referencia.get(medicao["nome"])
+        variacao = None
+        if anterior and anterior["mediana"] > 0:
+            variacao = medicao["mediana"] / anterior["mediana"] - 1
+
+        comparacoes.append(
+            Comparacao(
+                nome=medicao["nome"],
+                atual=medicao["mediana"],
+                referencia=anterior["mediana"] if anterior else None,
+                variacao=variacao,
+                regressao=variacao is not None and variacao > tolerancia,
+            ),
+        )
+
+    return comparacoes
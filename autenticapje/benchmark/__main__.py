@@ -0,0 +1,101 @@
+"""Execute a suíte de benchmarks pela linha de comando."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Annotated
+
+from tqdm import tqdm
+from typer import Exit, Option, Typer
+
+from autenticapje.benchmark import (
+    REPETICOES_PADRAO,
+    TOLERANCIA_PADRAO,
+    carregar_referencia,
+    caso_autenticar,
+    casos_padrao,
+    comparar,
+    executar,
+    salvar_referencia,
+)
+from autenticapje.benchmark.fixtures import gerar_fixtures
+from autenticapje.simulador import ServidorSimulado, apontar_urls
+
+REFERENCIA_PADRAO = Path.home().joinpath(".autenticapje", "benchmark.json")
+
+app = Typer()
+
+
+@app.command()
+def benchmark(
+    referencia: Annotated[
+        Path,
+        Option(help="Arquivo JSON com as medições de referência."),
+    ] = REFERENCIA_PADRAO,
+    salvar: Annotated[
+        bool,
+        Option(help="Grave as medições atuais como nova referência."),
+    ] = False,
+    tolerancia: Annotated[
+        float,
+        Option(help="Piora relativa aceita antes de falhar (0.25 = 25%)."),
+    ] = TOLERANCIA_PADRAO,
+    repeticoes: Annotated[int, Option(help="Rodadas por caso.")] = REPETICOES_PADRAO,
+    filtro: Annotated[
+        str | None,
+        Option(help="Execute apenas casos cujo nome contém o texto."),
+    ] = None,
+    entradas: Annotated[int, Option(help="Entradas no KDBX gerado.")] = 200,
+    ponta_a_ponta: Annotated[
+        bool,
+        Option(help="Inclua o login completo contra o simulador local."),
+    ] = True,
+) -> None:
+    """Meça os caminhos críticos e compare com a referência.
+
+    Termina com código 1 se algum caso piorar além da tolerância.
+    """
+    with ExitStack() as pilha:
+        temporario = pilha.enter_context(
+            TemporaryDirectory(prefix="autenticapje-bench-"),
+        )
+        tqdm.write("Gerando certificado e banco KeePass de teste...")
+        fixtures = gerar_fixtures(Path(temporario), entradas=entradas)
+        casos = casos_padrao(fixtures)
+
+        if ponta_a_ponta:
+            servidor = pilha.enter_context(
+                ServidorSimulado(otp_uri=fixtures.otp_uri),
+            )
+            apontar_urls(servidor.url_pje, servidor.url_sso)
+            environ.update(fixtures.variaveis_ambiente())
+            casos["autenticar[http]"] = caso_autenticar("http")
+
+        medicoes = list(executar(casos, filtro=filtro, repeticoes=repeticoes))
+
+    comparacoes = comparar(medicoes, carregar_referencia(referencia), tolerancia)
+    for comparacao in comparacoes:
+        situacao = "REGRESSÃO" if comparacao["regressao"] else "ok"
+        variacao = ""
+        if comparacao["variacao"] is not None:
+            variacao = f"{comparacao['variacao']:+.1%}"
+
+        tqdm.write(
+            f"{comparacao['nome']:<32} {comparacao['atual'] * 1e6:>12.1f} µs "
+            f"{variacao:>8} {situacao}",
+        )
+
+    if salvar:
+        salvar_referencia(medicoes, referencia)
+        tqdm.write(f"Referência gravada em {referencia}")
+        return
+
+    if any(comparacao["regressao"] for comparacao in comparacoes):
+        raise Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
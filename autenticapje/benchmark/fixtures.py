@@ -0,0 +1,213 @@
+"""Gere certificados e bancos KeePass descartáveis para os benchmarks.
+
+Tudo é criado localmente, sem rede: uma cadeia raiz -> intermediária
+-> final em PKCS#12 e um KDBX com várias entradas, das quais apenas
+uma pertence ao usuário procurado.
+"""
+
+from __future__ import annotations
+
+import secrets
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+import pyotp
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import NameOID
+from pykeepass import create_database
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CPF_FIXTURE = "000.000.001-91"
+SENHA_FIXTURE = "benchmark"
+TAMANHO_CHAVE = 2048
+
+
+class Fixtures(NamedTuple):
+    """Arquivos gerados para os benchmarks.
+
+    Args:
+        certificado (Path): Certificado PKCS#12 com a cadeia.
+        senha_certificado (str): Senha do certificado.
+        kdbx (Path): Banco KeePass com as entradas OTP.
+        senha_kdbx (str): Senha do banco KeePass.
+        usuario (str): Usuário (CPF) com OTP cadastrado.
+        otp_uri (str): URI OTP do usuário.
+
+    """
+
+    certificado: Path
+    senha_certificado: str
+    kdbx: Path
+    senha_kdbx: str
+    usuario: str
+    otp_uri: str
+
+    def variaveis_ambiente(self) -> dict[str, str]:
+        """Monte as variáveis de ambiente lidas pelos autenticadores.
+
+        Returns:
+            dict[str, str]: CPF, certificado e KeePass das fixtures.
+
+        """
+        return {
+            "CPF": self.usuario,
+            "CERTIFICADO": str(self.certificado),
+            "SENHA_CERTIFICADO": self.senha_certificado,
+            "KBDX_PATH": str(self.kdbx),
+            "KBDX_PASSWORD": self.senha_kdbx,
+        }
+
+
+def gerar_fixtures(diretorio: Path, entradas: int = 200) -> Fixtures:
+    """Crie o certificado e o banco KeePass no diretório informado.
+
+    Args:
+        diretorio (Path): Pasta onde os arquivos serão gravados.
+        entradas (int): Quantidade de entradas no KDBX.
+
+    Returns:
+        Fixtures: Caminhos e credenciais gerados.
+
+    """
+    diretorio.mkdir(parents=True, exist_ok=True)
+    otp_uri = pyotp.TOTP(pyotp.random_base32()).provisioning_uri(
+        name=CPF_FIXTURE,
+        issuer_name="PJe",
+    )
+    return Fixtures(
+        certificado=gerar_certificado(diretorio.joinpath("certificado.pfx")),
+        senha_certificado=SENHA_FIXTURE,
+        kdbx=gerar_kdbx(diretorio.joinpath("banco.kdbx"), otp_uri, entradas),
+        senha_kdbx=SENHA_FIXTURE,
+        usuario=CPF_FIXTURE,
+        otp_uri=otp_uri,
+    )
+
+
+def gerar_certificado(arquivo: Path, senha: str = SENHA_FIXTURE) -> Path:
+    """Grave um PKCS#12 com a cadeia final -> intermediária -> raiz.
+
+    Args:
+        arquivo (Path): Arquivo de destino.
+        senha (str): Senha do PKCS#12.
+
+    Returns:
+        Path: Arquivo gravado.
+
+    """
+    chave_raiz, raiz = _emitir("AC Raiz Benchmark")
+    chave_intermediaria, intermediaria = _emitir(
+        "AC Intermediaria Benchmark",
+        chave_raiz,
+        raiz,
+    )
+    chave_final, final = _emitir(
+        f"USUARIO BENCHMARK:{CPF_FIXTURE}",
+        chave_intermediaria,
+        intermediaria,
+        autoridade=False,
+    )
+
+    arquivo.write_bytes(
+        pkcs12.serialize_key_and_certificates(
+            name=b"benchmark",
+            key=chave_final,
+            cert=final,
+            cas=[intermediaria, raiz],
+            encryption_algorithm=serialization.BestAvailableEncryption(
+                senha.encode(),
+            ),
+        ),
+    )
+    return arquivo
+
+
+def gerar_kdbx(
+    arquivo: Path,
+    otp_uri: str,
+    entradas: int = 200,
+    senha: str = SENHA_FIXTURE,
+) -> Path:
+    """Grave um banco KeePass com uma entrada OTP do usuário fixture.
+
+    As demais entradas simulam um cofre real, com outros usuários e
+    credenciais sem OTP.
+
+    Args:
+        arquivo (Path): Arquivo de destino.
+        otp_uri (str): URI OTP do usuário fixture.
+        entradas (int): Quantidade total de entradas.
+        senha (str): Senha do banco.
+
+    Returns:
+        Path: Arquivo gravado.
+
+    """
+    arquivo.unlink(missing_ok=True)
+    banco = create_database(str(arquivo), password=senha)
+    grupo = banco.add_group(banco.root_group, "PJe")
+
+    for numero in range(max(entradas - 1, 0)):
+        banco.add_entry(
+            grupo if numero % 2 else banco.root_group,
+            title=f"Entrada {numero}",
+            username=f"usuario{numero}",
+            password=secrets.token_urlsafe(16),
+            otp=None if numero % 3 else pyotp.random_base32(),
+        )
+
+    banco.add_entry(
+        grupo,
+        title="PJe",
+        username=CPF_FIXTURE,
+        password=secrets.token_urlsafe(16),
+        otp=otp_uri,
+    )
+    banco.save()
+    return arquivo
+
+
+def _emitir(
+    nome: str,
+    chave_emissor: rsa.RSAPrivateKey | None = None,
+    emissor: x509.Certificate | None = None,
+    *,
+    autoridade: bool = True,
+) -> tuple[rsa.RSAPrivateKey, x509.Certificate]:
+    """Emita um certificado RSA (autoassinado se não houver emissor).
+
+    Args:
+        nome (str): Nome comum do titular.
+        chave_emissor (rsa.RSAPrivateKey | None): Chave do emissor.
+        emissor (x509.Certificate | None): Certificado do emissor.
+        autoridade (bool): Marca o certificado como AC.
+
+    Returns:
+        tuple[rsa.RSAPrivateKey, x509.Certificate]: Chave e
+            certificado emitidos.
+
+    """
+    chave = rsa.generate_private_key(public_exponent=65537, key_size=TAMANHO_CHAVE)
+    titular = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, nome)])
+    agora = datetime.now(UTC)
+
+    certificado = (
+        x509.CertificateBuilder()
+        .subject_name(titular)
+        .issuer_name(emissor.subject if emissor else titular)
+        .public_key(chave.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(agora - timedelta(days=1))
+        .not_valid_after(agora + timedelta(days=30))
+        .add_extension(
+            x509.BasicConstraints(ca=autoridade, path_length=None),
+            critical=True,
+        )
+        .sign(chave_emissor or chave, hashes.SHA256())
+    )
+    return chave, certificado
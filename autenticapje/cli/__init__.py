@@ -1,5 +1,5 @@
-import json
 import platform
+from contextlib import nullcontext
 from os import environ as env
 from pathlib import Path
 
@@ -9,7 +9,24 @@ from tqdm import tqdm
 from typer import Option, Typer
 from typing_extensions import Annotated
 
-from autenticapje import AutenticadorPJe
+from autenticapje.driver.pool import PoolDrivers
+from autenticapje.metricas import ExportadorPrometheus, gravar_jsonl
+from autenticapje.regioes import (
+    MODOS_LOGIN,
+    TOTAL_REGIOES,
+    ModoLogin,
+    ResultadoAutenticacao,
+    autenticar_regiao,
+    autenticar_regioes,
+    interpretar_regioes,
+)
+from autenticapje.servidor import (
+    IDADE_RENOVACAO,
+    INTERVALO_VERIFICACAO,
+    PORTA_PADRAO,
+    ServidorSessoes,
+)
+from autenticapje.sessao import CacheSessoes
 
 app = Typer()
 
@@ -25,8 +42,169 @@ class EnvKeys:
 
 
 @app.command()
-def autenticar(regiao: Annotated[str, Option()] = "1") -> None:
+def autenticar(
+    regiao: Annotated[str, Option(help='Regiões (ex.: "1", "1-24,3").')] = "1",
+    workers: Annotated[int, Option(help="Navegadores simultâneos.", min=1)] = 1,
+    sem_cache: Annotated[
+        bool,
+        Option(help="Ignore sessões salvas e force novo login."),
+    ] = False,
+    modo: Annotated[
+        str,
+        Option(help='"navegador" (Chrome) ou "http" (sem navegador).'),
+    ] = "navegador",
+    metricas_jsonl: Annotated[
+        Path | None,
+        Option(help="Acrescente as fases de cada login neste JSON lines."),
+    ] = None,
+    metricas_prometheus: Annotated[
+        Path | None,
+        Option(help="Grave histogramas de latência no formato Prometheus."),
+    ] = None,
+) -> None:
     clear()
+    if not _ambiente_configurado():
+        return
+
+    if modo not in MODOS_LOGIN:
+        tqdm.write(f'Modo "{modo}" inválido! Use "navegador" ou "http".')
+        return
+
+    regioes = _regioes_informadas(regiao)
+    if not regioes:
+        return
+
+    cache = None if sem_cache else CacheSessoes()
+    metricas = _Metricas(metricas_jsonl, metricas_prometheus)
+    if len(regioes) > 1:
+        _autenticar_varias(regioes, workers, cache, modo, metricas)
+        return
+
+    resultado = autenticar_regiao(
+        regioes[0],
+        sufixo="",
+        cache=cache,
+        modo=modo,
+    )
+    metricas.registrar(resultado)
+    if resultado["sucesso"]:
+        mensagem = "Autenticado com sucesso!"
+        if resultado["origem"] == "cache":
+            mensagem = "Sessão salva ainda válida, login dispensado!"
+
+        tqdm.write(mensagem)
+        tqdm.write(f"""
+
+======================================
+Cookies "Py" (Requests, Httpx, etc): {_uri(resultado["cookies_requests"])}
+
+
+Cookies Navegador: {_uri(resultado["cookies_navegador"])}
+======================================
+                   """)
+        return
+
+    if resultado["erro"]:
+        tqdm.write(resultado["erro"])
+
+
+@app.command(name="serve")
+def servir(
+    regiao: Annotated[str, Option(help='Regiões (ex.: "1", "1-24,3").')] = "1",
+    workers: Annotated[int, Option(help="Logins simultâneos.", min=1)] = 1,
+    modo: Annotated[
+        str,
+        Option(help='"navegador" (Chrome) ou "http" (sem navegador).'),
+    ] = "navegador",
+    porta: Annotated[
+        int,
+        Option(help="Porta da API em 127.0.0.1."),
+    ] = PORTA_PADRAO,
+    socket: Annotated[
+        Path | None,
+        Option(help="Atenda por este socket Unix em vez da porta."),
+    ] = None,
+    renovar_apos: Annotated[
+        float,
+        Option(help="Idade, em minutos, para renovar a sessão."),
+    ] = IDADE_RENOVACAO / 60,
+    intervalo: Annotated[
+        float,
+        Option(help="Segundos entre as verificações das sessões."),
+    ] = INTERVALO_VERIFICACAO,
+) -> None:
+    """Mantenha as sessões vivas e sirva os cookies localmente."""
+    if not _ambiente_configurado():
+        return
+
+    if modo not in MODOS_LOGIN:
+        tqdm.write(f'Modo "{modo}" inválido! Use "navegador" ou "http".')
+        return
+
+    regioes = _regioes_informadas(regiao)
+    if not regioes:
+        return
+
+    servidor = ServidorSessoes(
+        regioes,
+        modo=modo,
+        workers=workers,
+        idade_renovacao=renovar_apos * 60,
+        intervalo_verificacao=intervalo,
+    )
+    with servidor:
+        endereco = (
+            servidor.servir_unix(socket.resolve()).as_uri()
+            if socket
+            else servidor.servir_http(porta=porta)
+        )
+        tqdm.write(f"""
+======================================
+Sessões mantidas: {", ".join(f"TRT{r}" for r in servidor.regioes)}
+API: {endereco}
+Token (Authorization: Bearer): {servidor.arquivo_token}
+  GET  /cookies/<regiao>
+  GET  /cookies/<regiao>/navegador
+  GET  /sessoes
+  POST /renovar/<regiao>
+======================================
+""")
+        try:
+            servidor.aguardar()
+        except KeyboardInterrupt:
+            tqdm.write("Encerrando...")
+
+
+def _regioes_informadas(regiao: str) -> list[str]:
+    """Interprete `--regiao`, exibindo o erro em vez de um traceback.
+
+    Args:
+        regiao (str): Expressão informada (ex.: "1-24,3").
+
+    Returns:
+        list[str]: Regiões, ou lista vazia (após exibir o motivo) se a
+            expressão for inválida ou vazia.
+
+    """
+    try:
+        regioes = interpretar_regioes(regiao)
+    except ValueError as e:
+        tqdm.write(f'{e}! Use números de 1 a {TOTAL_REGIOES} (ex.: "1-24,3").')
+        return []
+
+    if not regioes:
+        tqdm.write("Nenhuma região informada!")
+
+    return regioes
+
+
+def _ambiente_configurado() -> bool:
+    """Confira as variáveis de ambiente exigidas pelo login.
+
+    Returns:
+        bool: False (após exibir como configurar) se faltar alguma.
+
+    """
     for item in dir(EnvKeys):
         if item.startswith("_"):
             continue
@@ -47,26 +225,100 @@ Exemplo:
 Saiba mais em: 
 ` https://github.com/Robotz213/AutenticaPJe/blob/main/TemplateEnv.md `  
                         ''')
-            return
+            return False
 
-    autenticador = AutenticadorPJe(regiao)
-    if autenticador.autenticar():
-        tqdm.write("Autenticado com sucesso!")
+    return True
 
-        cookie_requestslib = autenticador.get_cookies_for_requests()
-        arquivo1 = Path.home().joinpath("cookies_requests.json")
-        arquivo1.write_text(json.dumps(cookie_requestslib))
 
-        cookie_navegador = autenticador.get_cookies_browser()
-        arquivo2 = Path.home().joinpath("cookies_navegador.json")
-        arquivo2.write_text(json.dumps(cookie_navegador))
+class _Metricas:
+    """Encaminhe as medições de cada região aos arquivos escolhidos."""
 
-        tqdm.write(f"""
+    def __init__(self, jsonl: Path | None, prometheus: Path | None) -> None:
+        """Inicialize os destinos das métricas.
 
-======================================
-Cookies "Py" (Requests, Httpx, etc): {arquivo1.as_uri()}
+        Args:
+            jsonl (Path | None): Arquivo JSON lines, se informado.
+            prometheus (Path | None): Arquivo Prometheus, se informado.
 
+        """
+        self.jsonl = jsonl
+        self.prometheus = prometheus
+        self.exportador = ExportadorPrometheus() if prometheus else None
+
+    def registrar(self, resultado: ResultadoAutenticacao) -> None:
+        """Grave a medição da região nos destinos configurados.
+
+        Args:
+            resultado (ResultadoAutenticacao): Resultado da região.
+
+        """
+        if self.jsonl:
+            gravar_jsonl(resultado, self.jsonl)
+
+        if self.exportador:
+            self.exportador.registrar(resultado)
+            self.exportador.gravar(self.prometheus)
+
+
+def _autenticar_varias(
+    regioes: list[str],
+    workers: int,
+    cache: CacheSessoes | None,
+    modo: ModoLogin,
+    metricas: _Metricas,
+) -> None:
+    """Autentique as regiões e exiba cada resultado ao concluir.
+
+    Args:
+        regioes (list[str]): Regiões a autenticar.
+        workers (int): Navegadores simultâneos.
+        cache (CacheSessoes | None): Cache de sessões salvas.
+        modo (ModoLogin): Modo de login utilizado.
+        metricas (_Metricas): Destino das medições de cada região.
+
+    """
+    sucessos = 0
+    # Os navegadores são reaproveitados entre as regiões da varredura
+    pool = PoolDrivers(tamanho=workers) if modo == "navegador" else None
+    with (
+        pool or nullcontext(),
+        tqdm(total=len(regioes), desc="Regiões") as progresso,
+    ):
+        for resultado in autenticar_regioes(
+            regioes,
+            max_workers=workers,
+            cache=cache,
+            modo=modo,
+            pool=pool,
+        ):
+            progresso.update()
+            metricas.registrar(resultado)
+            detalhe = f"{resultado['tempo']:.1f}s, {resultado['origem']}"
+            if resultado["sucesso"]:
+                sucessos += 1
+                tqdm.write(
+                    f"[OK] TRT{resultado['regiao']} ({detalhe}) "
+                    f"{_uri(resultado['cookies_requests'])} "
+                    f"{_uri(resultado['cookies_navegador'])}",
+                )
+                continue
+
+            tqdm.write(f"[ERRO] TRT{resultado['regiao']} ({detalhe})")
+            if resultado["erro"]:
+                tqdm.write(resultado["erro"])
+
+    tqdm.write(f"{sucessos}/{len(regioes)} regiões autenticadas.")
+
+
+def _uri(caminho: str | None) -> str:
+    """Converta o caminho do arquivo em URI para exibição.
+
+    Args:
+        caminho (str | None): Caminho do arquivo.
+
+    Returns:
+        str: URI do arquivo ou string vazia.
+
+    """
+    return Path(caminho).as_uri() if caminho else ""
 
-Cookies Navegador: {arquivo2.as_uri()}
-======================================
-                   """)
@@ -0,0 +1,452 @@
+"""Consulte processos nas APIs REST do PJe com conexões reaproveitadas.
+
+O `ClientePJe` recebe os cookies de uma sessão autenticada por região
+e mantém uma `requests.Session` por host do TRT, com conexões
+keep-alive. Para cada número CNJ, resolve o `dadosbasicos` no id do
+processo e busca partes, assuntos e audiências em paralelo, sempre sob
+um limite de requisições simultâneas por host. Respostas 429/503
+pausam o host pelo `Retry-After` informado.
+"""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from queue import Queue
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Self, TypedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .elements import pje as el
+from .sso import USER_AGENT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from concurrent.futures import Future
+
+type AnyType = any
+type FonteCookies = (
+    Mapping[str, dict[str, str]] | Callable[[str], dict[str, str] | None]
+)
+
+LIMITE_POR_HOST = 8
+TENTATIVAS = 4
+ESPERA_PADRAO = 1.0
+ESPERA_MAXIMA = 60.0
+STATUS_LIMITE = frozenset({429, 503})
+
+# NNNNNNN-DD.AAAA.J.TR.OOOO (Resolução CNJ 65/2008); J = 5 é a Justiça do Trabalho
+PADRAO_CNJ = re.compile(r"(\d{7})-?(\d{2})\.?(\d{4})\.?(\d)\.?(\d{2})\.?(\d{4})")
+SEGMENTO_TRABALHO = "5"
+
+# Detalhe -> constante do link em elements/pje.py (lida a cada uso, pois
+# `apontar_urls` recarrega o módulo)
+DETALHES = {
+    "partes": "LINK_CONSULTA_PARTES",
+    "assuntos": "LINK_CONSULTA_ASSUNTOS",
+    "audiencias": "LINK_AUDIENCIAS",
+}
+
+
+class DadosProcesso(TypedDict):
+    """Dados consultados de um processo.
+
+    Args:
+        numero (str): Número CNJ informado.
+        regiao (str | None): TRT do processo.
+        id_processo (int | None): Id interno do PJe.
+        dados_basicos (AnyType): Resposta do `dadosbasicos`.
+        partes (AnyType): Partes do processo.
+        assuntos (AnyType): Assuntos do processo.
+        audiencias (AnyType): Audiências do processo.
+        erro (str | None): Falha da consulta, se houver.
+
+    """
+
+    numero: str
+    regiao: str | None
+    id_processo: int | None
+    dados_basicos: AnyType
+    partes: AnyType
+    assuntos: AnyType
+    audiencias: AnyType
+    erro: str | None
+
+
+def regiao_do_processo(numero: str) -> str:
+    """Extraia o TRT do número CNJ.
+
+    Args:
+        numero (str): Número CNJ, com ou sem pontuação.
+
+    Returns:
+        str: Região sem zeros à esquerda (ex.: "1" para TRT1).
+
+    Raises:
+        ValueError: Se o número não é CNJ ou não é da Justiça do
+            Trabalho.
+
+    """
+    correspondencia = PADRAO_CNJ.fullmatch(numero.strip())
+    if not correspondencia:
+        raise ValueError("Número CNJ inválido: " + numero)
+
+    segmento, tribunal = correspondencia.group(4, 5)
+    if segmento != SEGMENTO_TRABALHO or tribunal == "00":
+        raise ValueError("Processo não pertence a um TRT: " + numero)
+
+    return str(int(tribunal))
+
+
+class ClientePJe:
+    """Cliente das APIs REST do PJe com limite de concorrência por host."""
+
+    def __init__(
+        self,
+        cookies: FonteCookies,
+        limite_por_host: int = LIMITE_POR_HOST,
+        max_workers: int | None = None,
+        timeout: float = 30,
+    ) -> None:
+        """Inicialize o cliente sem abrir conexões.
+
+        Args:
+            cookies (FonteCookies): Cookies "Py" por região, ou uma
+                função que os obtém (ex.: `servidor.obter_cookies`).
+            limite_por_host (int): Requisições simultâneas por TRT.
+            max_workers (int | None): Threads do cliente (padrão:
+                4 vezes o limite por host).
+            timeout (float): Tempo máximo de cada requisição.
+
+        """
+        self._cookies = cookies if callable(cookies) else cookies.get
+        self.limite_por_host = max(1, limite_por_host)
+        self.max_workers = max_workers or self.limite_por_host * 4
+        self.timeout = timeout
+
+        self._trava = Lock()
+        self._sessoes: dict[str, requests.Session] = {}
+        self._semaforos: dict[str, BoundedSemaphore] = {}
+        self._pausas: dict[str, float] = {}
+
+    def consultar(self, numero: str) -> DadosProcesso:
+        """Consulte um único processo.
+
+        Args:
+            numero (str): Número CNJ.
+
+        Returns:
+            DadosProcesso: Dados do processo ou o erro da consulta.
+
+        """
+        return next(self.consultar_varios([numero]))
+
+    def consultar_varios(self, numeros: Iterable[str]) -> Iterator[DadosProcesso]:
+        """Consulte vários processos, entregando cada um ao concluir.
+
+        Os números são lidos aos poucos: só há processos suficientes
+        em andamento para manter as threads ocupadas, então listas
+        longas não ficam todas em memória nem atrasam os primeiros
+        resultados.
+
+        Args:
+            numeros (Iterable[str]): Números CNJ.
+
+        Yields:
+            DadosProcesso: Resultado de cada processo, na ordem de
+                conclusão.
+
+        """
+        numeros = iter(numeros)
+        concluidos: Queue[DadosProcesso] = Queue()
+        em_andamento = 0
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="autenticapje-cliente",
+        ) as executor:
+
+            def abastecer() -> int:
+                enviados = 0
+                while em_andamento + enviados < self.max_workers * 2:
+                    numero = next(numeros, None)
+                    if numero is None:
+                        break
+
+                    executor.submit(self._resolver, numero, executor, concluidos)
+                    enviados += 1
+
+                return enviados
+
+            em_andamento += abastecer()
+            while em_andamento:
+                resultado = concluidos.get()
+                em_andamento -= 1
+                em_andamento += abastecer()
+                yield resultado
+
+    def get(self, regiao: str, url: str) -> AnyType:
+        """Faça um GET autenticado respeitando os limites do host.
+
+        Args:
+            regiao (str): Região (define sessão, cookies e limite).
+            url (str): URL completa da API.
+
+        Returns:
+            AnyType: Corpo JSON da resposta.
+
+        Raises:
+            requests.HTTPError: Se a resposta final não for 2xx.
+
+        """
+        for tentativa in range(TENTATIVAS):
+            with self.conexao(regiao) as sessao:
+                resp = sessao.get(url, timeout=self.timeout)
+                limitado = resp.status_code in STATUS_LIMITE
+                # Pausa antes de liberar a vaga, para que ninguém a ocupe antes
+                if limitado and tentativa < TENTATIVAS - 1:
+                    self.pausar(regiao, _espera(resp, tentativa))
+
+            if not limitado or tentativa == TENTATIVAS - 1:
+                break
+
+        resp.raise_for_status()
+        return resp.json()
+
+    @contextmanager
+    def conexao(self, regiao: str) -> Iterator[requests.Session]:
+        """Ocupe uma das vagas do host durante o bloco.
+
+        Aguarda a pausa do host (após 429/503) e o limite de
+        requisições simultâneas; use para respostas em streaming, que
+        mantêm a conexão ocupada enquanto são lidas.
+
+        Args:
+            regiao (str): Região do host.
+
+        Yields:
+            requests.Session: Sessão autenticada da região.
+
+        """
+        sessao = self._sessao(regiao)
+        self._aguardar_pausa(regiao)
+        with self._semaforos[regiao]:
+            # O host pode ter sido pausado enquanto esta thread esperava a vaga
+            self._aguardar_pausa(regiao)
+            yield sessao
+
+    def pausar(self, regiao: str, segundos: float) -> None:
+        """Suspenda novas requisições ao host pelo tempo informado.
+
+        Args:
+            regiao (str): Região do host limitado.
+            segundos (float): Duração da pausa.
+
+        """
+        with self._trava:
+            fim = monotonic() + segundos
+            self._pausas[regiao] = max(self._pausas.get(regiao, 0.0), fim)
+
+    def fechar(self) -> None:
+        """Feche as conexões de todas as sessões."""
+        with self._trava:
+            for sessao in self._sessoes.values():
+                sessao.close()
+
+            self._sessoes.clear()
+
+    def __enter__(self) -> Self:
+        """Retorne o próprio cliente para uso em bloco `with`.
+
+        Returns:
+            Self: Este cliente.
+
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Feche as conexões ao sair do bloco `with`.
+
+        Args:
+            *args (object): Informações da exceção, se houver.
+
+        """
+        self.fechar()
+
+    def _resolver(
+        self,
+        numero: str,
+        executor: ThreadPoolExecutor,
+        concluidos: Queue[DadosProcesso],
+    ) -> None:
+        """Resolva o id do processo e dispare as consultas de detalhe.
+
+        Args:
+            numero (str): Número CNJ.
+            executor (ThreadPoolExecutor): Executor das consultas.
+            concluidos (Queue[DadosProcesso]): Fila dos resultados.
+
+        """
+        resultado = DadosProcesso(
+            numero=numero,
+            regiao=None,
+            id_processo=None,
+            dados_basicos=None,
+            partes=None,
+            assuntos=None,
+            audiencias=None,
+            erro=None,
+        )
+        try:
+            regiao = resultado["regiao"] = regiao_do_processo(numero)
+            dados_basicos = self.get(
+                regiao,
+                el.LINK_DADOS_BASICOS.format(trt_id=regiao, numero_processo=numero),
+            )
+            resultado["dados_basicos"] = dados_basicos
+            resultado["id_processo"] = _id_processo(dados_basicos)
+        except Exception as e:  # noqa: BLE001
+            # Qualquer falha vira resultado: sem ele, consultar_varios esperaria
+            # para sempre pelo processo na fila
+            resultado["erro"] = f"{type(e).__name__}: {e}"
+            concluidos.put(resultado)
+            return
+
+        restantes = len(DETALHES)
+        trava = Lock()
+
+        def concluir(chave: str, futuro: Future[AnyType]) -> None:
+            nonlocal restantes
+            try:
+                resultado[chave] = futuro.result()
+            except Exception as e:  # noqa: BLE001
+                resultado["erro"] = f"{chave}: {type(e).__name__}: {e}"
+
+            with trava:
+                restantes -= 1
+                ultimo = restantes == 0
+
+            if ultimo:
+                concluidos.put(resultado)
+
+        for chave, constante in DETALHES.items():
+            url = getattr(el, constante).format(
+                trt_id=regiao,
+                id_processo=resultado["id_processo"],
+            )
+            executor.submit(self.get, regiao, url).add_done_callback(
+                partial(concluir, chave),
+            )
+
+    def _sessao(self, regiao: str) -> requests.Session:
+        """Obtenha (ou crie) a sessão keep-alive da região.
+
+        Args:
+            regiao (str): Região da sessão.
+
+        Returns:
+            requests.Session: Sessão com os cookies da região.
+
+        Raises:
+            LookupError: Se não houver cookies para a região.
+
+        """
+        with self._trava:
+            if regiao in self._sessoes:
+                return self._sessoes[regiao]
+
+        # A fonte pode consultar a rede (ex.: servidor de sessões): fora da trava
+        cookies = self._cookies(regiao)
+        if not cookies:
+            raise LookupError(f"Sem sessão autenticada para o TRT{regiao}")
+
+        with self._trava:
+            if regiao in self._sessoes:
+                return self._sessoes[regiao]
+
+            sessao = requests.Session()
+            adaptador = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.limite_por_host,
+            )
+            sessao.mount("https://", adaptador)
+            sessao.mount("http://", adaptador)
+            sessao.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept": "application/json",
+            })
+            sessao.cookies.update(cookies)
+
+            # As APIs do PJe exigem o token XSRF do cookie também no cabeçalho
+            xsrf = next(
+                (v for nome, v in cookies.items() if nome.lower() == "xsrf-token"),
+                None,
+            )
+            if xsrf:
+                sessao.headers["X-XSRF-TOKEN"] = xsrf
+
+            self._sessoes[regiao] = sessao
+            self._semaforos[regiao] = BoundedSemaphore(self.limite_por_host)
+            return sessao
+
+    def _aguardar_pausa(self, regiao: str) -> None:
+        """Aguarde o fim da pausa do host, inclusive se for prorrogada.
+
+        Args:
+            regiao (str): Região do host.
+
+        """
+        while True:
+            with self._trava:
+                restante = self._pausas.get(regiao, 0.0) - monotonic()
+
+            if restante <= 0:
+                return
+
+            sleep(restante)
+
+
+def _id_processo(dados_basicos: AnyType) -> int:
+    """Extraia o id interno do processo da resposta do `dadosbasicos`.
+
+    Args:
+        dados_basicos (AnyType): Lista (ou objeto) devolvido pela API.
+
+    Returns:
+        int: Id do processo.
+
+    Raises:
+        LookupError: Se o processo não foi encontrado.
+
+    """
+    registro = dados_basicos
+    if isinstance(dados_basicos, list):
+        registro = dados_basicos[0] if dados_basicos else None
+
+    if not registro or "id" not in registro:
+        raise LookupError("Processo não encontrado no dadosbasicos")
+
+    return int(registro["id"])
+
+
+def _espera(resp: requests.Response, tentativa: int) -> float:
+    """Calcule a pausa após 429/503, preferindo o `Retry-After`.
+
+    Args:
+        resp (requests.Response): Resposta limitada.
+        tentativa (int): Tentativa atual (a partir de 0).
+
+    Returns:
+        float: Segundos de espera.
+
+    """
+    informado = resp.headers.get("Retry-After", "")
+    if informado.replace(".", "", 1).isdigit():
+        return min(float(informado), ESPERA_MAXIMA)
+
+    return min(ESPERA_PADRAO * 2**tentativa, ESPERA_MAXIMA)
@@ -0,0 +1,419 @@
+"""Baixe a íntegra dos processos em streaming, com retomada por Range.
+
+A resposta do `LINK_DOWNLOAD_INTEGRA` é gravada em blocos em um
+arquivo `.part`, com memória constante independentemente do tamanho
+do PDF. Se a conexão cair, a próxima tentativa (nesta ou em outra
+execução) pede apenas os bytes que faltam com `Range`, condicionado
+por `If-Range` ao ETag (ou Last-Modified) da primeira resposta, salvo
+em `.part.meta`. Se a primeira resposta não trouxer validador, se o
+servidor ignorar o Range, se o documento mudou ou se a faixa devolvida
+não começar onde o `.part` termina, o download recomeça do zero. O
+arquivo final só aparece quando o download termina.
+
+Os downloads usam as sessões e os limites por host do `ClientePJe`.
+"""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http import HTTPStatus
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, TypedDict
+
+import requests
+
+from .cliente import STATUS_LIMITE, _espera
+from .elements import pje as el
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from .cliente import ClientePJe
+
+type Progresso = Callable[[int, int, int | None], None]
+
+TAMANHO_BLOCO = 1024 * 1024
+TENTATIVAS = 5
+TIMEOUT_LEITURA = 60.0
+CONTENT_RANGE = re.compile(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)")
+FALHAS_CONEXAO = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class ResultadoDownload(TypedDict):
+    """Resultado do download da íntegra de um processo.
+
+    Args:
+        regiao (str): Região do processo.
+        id_processo (int): Id interno do processo.
+        arquivo (str | None): PDF gravado, se concluído.
+        tamanho (int): Tamanho final do arquivo, em bytes.
+        baixados (int): Bytes transferidos nesta execução.
+        retomado (bool): Se aproveitou bytes de uma transferência
+            interrompida.
+        duracao (float): Tempo do download, em segundos.
+        vazao (float): Bytes transferidos por segundo.
+        erro (str | None): Falha do download, se houver.
+
+    """
+
+    regiao: str
+    id_processo: int
+    arquivo: str | None
+    tamanho: int
+    baixados: int
+    retomado: bool
+    duracao: float
+    vazao: float
+    erro: str | None
+
+
+def baixar_integra(
+    cliente: ClientePJe,
+    regiao: str,
+    id_processo: int,
+    diretorio: Path,
+    progresso: Progresso | None = None,
+) -> ResultadoDownload:
+    """Baixe a íntegra do processo, retomando um `.part` existente.
+
+    Um arquivo final já existente é mantido, sem nova transferência.
+
+    Args:
+        cliente (ClientePJe): Cliente com a sessão da região.
+        regiao (str): Região do processo.
+        id_processo (int): Id interno do processo.
+        diretorio (Path): Pasta de destino.
+        progresso (Progresso | None): Chamada a cada bloco com o id do
+            processo, os bytes já gravados e o total (se conhecido).
+
+    Returns:
+        ResultadoDownload: Arquivo, tamanho e vazão do download.
+
+    """
+    diretorio.mkdir(parents=True, exist_ok=True)
+    destino = diretorio.joinpath(f"integra_trt{regiao}_{id_processo}.pdf")
+    parcial = destino.with_name(destino.name + ".part")
+    url = el.LINK_DOWNLOAD_INTEGRA.format(trt_id=regiao, id_processo=id_processo)
+
+    resultado = ResultadoDownload(
+        regiao=regiao,
+        id_processo=id_processo,
+        arquivo=None,
+        tamanho=0,
+        baixados=0,
+        retomado=False,
+        duracao=0.0,
+        vazao=0.0,
+        erro=None,
+    )
+    inicio = perf_counter()
+    try:
+        if destino.exists():
+            resultado["tamanho"] = destino.stat().st_size
+        else:
+            resultado["retomado"] = parcial.exists() and parcial.stat().st_size > 0
+            resultado["tamanho"] = _transferir(
+                cliente,
+                regiao,
+                url,
+                parcial,
+                lambda bloco, gravados, total: _registrar(
+                    resultado,
+                    bloco,
+                    gravados,
+                    total,
+                    progresso,
+                ),
+            )
+            parcial.replace(destino)
+            _arquivo_meta(parcial).unlink(missing_ok=True)
+
+        resultado["arquivo"] = str(destino)
+
+    except (OSError, LookupError, requests.RequestException) as e:
+        resultado["erro"] = f"{type(e).__name__}: {e}"
+
+    resultado["duracao"] = perf_counter() - inicio
+    if resultado["duracao"]:
+        resultado["vazao"] = resultado["baixados"] / resultado["duracao"]
+
+    return resultado
+
+
+def baixar_varios(
+    cliente: ClientePJe,
+    processos: Iterable[tuple[str, int]],
+    diretorio: Path,
+    max_workers: int = 4,
+    progresso: Progresso | None = None,
+) -> Iterator[ResultadoDownload]:
+    """Baixe várias íntegras em paralelo, entregando cada uma ao concluir.
+
+    Cada download ocupa uma vaga do host no `ClientePJe` enquanto
+    transfere, então o limite por TRT vale também aqui. Os pares são
+    lidos aos poucos, e pares repetidos são baixados uma única vez,
+    para que duas threads nunca gravem no mesmo `.part`.
+
+    Args:
+        cliente (ClientePJe): Cliente com as sessões das regiões.
+        processos (Iterable[tuple[str, int]]): Pares (região, id).
+        diretorio (Path): Pasta de destino.
+        max_workers (int): Downloads simultâneos.
+        progresso (Progresso | None): Chamada a cada bloco gravado.
+
+    Yields:
+        ResultadoDownload: Resultado de cada download concluído.
+
+    """
+    max_workers = max(1, max_workers)
+    processos = iter(processos)
+    vistos: set[tuple[str, int]] = set()
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="autenticapje-download",
+    ) as executor:
+        em_andamento: set[Future[ResultadoDownload]] = set()
+        while True:
+            while len(em_andamento) < max_workers * 2:
+                par = next(processos, None)
+                if par is None:
+                    break
+
+                if par in vistos:
+                    continue
+
+                vistos.add(par)
+                regiao, id_processo = par
+                em_andamento.add(
+                    executor.submit(
+                        baixar_integra,
+                        cliente,
+                        regiao,
+                        id_processo,
+                        diretorio,
+                        progresso,
+                    ),
+                )
+
+            if not em_andamento:
+                return
+
+            concluidos, em_andamento = wait(em_andamento, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                yield futuro.result()
+
+
+def _transferir(
+    cliente: ClientePJe,
+    regiao: str,
+    url: str,
+    parcial: Path,
+    registrar: Callable[[int, int, int | None], None],
+) -> int:
+    """Grave a resposta no `.part`, retomando após quedas de conexão.
+
+    Args:
+        cliente (ClientePJe): Cliente com a sessão da região.
+        regiao (str): Região do processo.
+        url (str): URL da íntegra.
+        parcial (Path): Arquivo `.part` de destino.
+        registrar (Callable[[int, int, int | None], None]): Recebe
+            os bytes do bloco, os bytes já no arquivo e o total.
+
+    Um `.part` sem validador no `.part.meta` (de origem desconhecida,
+    ou de um servidor que não informou ETag nem Last-Modified) não é
+    retomado: o download recomeça do zero.
+
+    Returns:
+        int: Tamanho final do arquivo.
+
+    Raises:
+        requests.HTTPError: Se o servidor recusar o download.
+        requests.ConnectionError: Se as tentativas se esgotarem.
+
+    """
+    meta = _arquivo_meta(parcial)
+    for tentativa in range(TENTATIVAS):
+        gravados = parcial.stat().st_size if parcial.exists() else 0
+        validador = meta.read_text() if meta.exists() else ""
+        # Sem compressão: o Range precisa se referir aos bytes gravados
+        cabecalhos = {"Accept-Encoding": "identity"}
+        # Sem validador não há como saber se o `.part` é do documento atual
+        if gravados and validador:
+            cabecalhos["Range"] = f"bytes={gravados}-"
+            # Se o documento mudou, o servidor devolve 200 com o novo inteiro
+            cabecalhos["If-Range"] = validador
+
+        try:
+            with cliente.conexao(regiao) as sessao:
+                resp = sessao.get(
+                    url,
+                    headers=cabecalhos,
+                    stream=True,
+                    timeout=(cliente.timeout, TIMEOUT_LEITURA),
+                )
+                with resp:
+                    if resp.status_code in STATUS_LIMITE:
+                        cliente.pausar(regiao, _espera(resp, tentativa))
+                        continue
+
+                    if resp.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                        if _total(resp) == gravados:
+                            return gravados
+
+                        _descartar(parcial)
+                        continue
+
+                    resp.raise_for_status()
+                    retomando = resp.status_code == HTTPStatus.PARTIAL_CONTENT
+                    if retomando and _inicio(resp) != gravados:
+                        _descartar(parcial)
+                        continue
+
+                    total = _total(resp) if retomando else _tamanho(resp)
+                    if not retomando:
+                        gravados = 0
+                        # Gravado antes dos dados: todo `.part` retomável tem o seu
+                        if validador := _validador(resp):
+                            meta.write_text(validador)
+                        else:
+                            meta.unlink(missing_ok=True)
+
+                    with parcial.open("ab" if retomando else "wb") as arquivo:
+                        for bloco in resp.iter_content(TAMANHO_BLOCO):
+                            arquivo.write(bloco)
+                            gravados += len(bloco)
+                            registrar(len(bloco), gravados, total)
+
+            if total is None or gravados >= total:
+                return gravados
+
+        except FALHAS_CONEXAO:
+            if tentativa == TENTATIVAS - 1:
+                raise
+
+        sleep(min(2**tentativa, 30))
+
+    msg = f"Download incompleto após {TENTATIVAS} tentativas: {url}"
+    raise requests.ConnectionError(msg)
+
+
+def _registrar(
+    resultado: ResultadoDownload,
+    bloco: int,
+    gravados: int,
+    total: int | None,
+    progresso: Progresso | None,
+) -> None:
+    """Contabilize um bloco gravado e avise o progresso.
+
+    Args:
+        resultado (ResultadoDownload): Resultado em andamento.
+        bloco (int): Bytes gravados no bloco.
+        gravados (int): Bytes já no arquivo, incluindo os retomados.
+        total (int | None): Tamanho final esperado.
+        progresso (Progresso | None): Callback de progresso.
+
+    """
+    resultado["baixados"] += bloco
+    if progresso:
+        progresso(resultado["id_processo"], gravados, total)
+
+
+def _arquivo_meta(parcial: Path) -> Path:
+    """Retorne o arquivo com o validador (ETag ou Last-Modified) do `.part`.
+
+    Args:
+        parcial (Path): Arquivo `.part`.
+
+    Returns:
+        Path: Arquivo `.part.meta` ao lado do `.part`.
+
+    """
+    return parcial.with_name(parcial.name + ".meta")
+
+
+def _descartar(parcial: Path) -> None:
+    """Apague o `.part` e o seu validador, para recomeçar do zero.
+
+    Args:
+        parcial (Path): Arquivo `.part`.
+
+    """
+    parcial.unlink(missing_ok=True)
+    _arquivo_meta(parcial).unlink(missing_ok=True)
+
+
+def _validador(resp: requests.Response) -> str:
+    """Escolha o validador da resposta completa para o `If-Range`.
+
+    O `If-Range` exige validador forte: ETags fracos (`W/`) são
+    trocados pelo Last-Modified.
+
+    Args:
+        resp (requests.Response): Resposta 200.
+
+    Returns:
+        str: ETag forte, Last-Modified ou vazio se não houver nenhum.
+
+    """
+    etag = resp.headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+
+    return resp.headers.get("Last-Modified", "")
+
+
+def _inicio(resp: requests.Response) -> int | None:
+    """Leia o primeiro byte da faixa informada no `Content-Range`.
+
+    Args:
+        resp (requests.Response): Resposta 206.
+
+    Returns:
+        int | None: Posição inicial, se informada.
+
+    """
+    correspondencia = CONTENT_RANGE.fullmatch(resp.headers.get("Content-Range", ""))
+    if not correspondencia or correspondencia.group(1) is None:
+        return None
+
+    return int(correspondencia.group(1))
+
+
+def _total(resp: requests.Response) -> int | None:
+    """Leia o tamanho completo informado no `Content-Range`.
+
+    Args:
+        resp (requests.Response): Resposta 206 ou 416.
+
+    Returns:
+        int | None: Tamanho total, se informado.
+
+    """
+    correspondencia = CONTENT_RANGE.fullmatch(resp.headers.get("Content-Range", ""))
+    if not correspondencia or correspondencia.group(2) == "*":
+        return None
+
+    return int(correspondencia.group(2))
+
+
+def _tamanho(resp: requests.Response) -> int | None:
+    """Leia o `Content-Length` de uma resposta completa.
+
+    Args:
+        resp (requests.Response): Resposta 200.
+
+    Returns:
+        int | None: Tamanho do corpo, se informado.
+
+    """
+    tamanho = resp.headers.get("Content-Length", "")
+    return int(tamanho) if tamanho.isdigit() else None
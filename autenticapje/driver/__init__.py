@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+from selenium.common import WebDriverException
 from selenium.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.driver_cache import DriverCacheManager
 
 from .constants import WORKDIR as WORKDIR
 from .constants.webdriver import (
@@ -15,19 +14,39 @@ from .constants.webdriver import (
     PREFERENCES,
     SETTINGS,
 )
-from .web_element import WebElementBot
+from .recursos import regras_hosts_permitidos
+from .resolver import esquecer_chromedriver, resolver_chromedriver
+from .web_element import PerfilEspera, WebElementBot
 
 
 class BotDriver:
     """Gerenciador do webdriver para a execução dos bots."""
 
-    def __init__(self) -> None:
-        """Inicialize o driver do bot com as configurações do sistema."""
+    def __init__(
+        self,
+        perfil_espera: PerfilEspera = "rapido",
+        *,
+        restringir_hosts: bool = False,
+    ) -> None:
+        """Inicialize o driver do bot com as configurações do sistema.
+
+        Args:
+            perfil_espera (PerfilEspera): "rapido" (esperas por
+                condição) ou "compatibilidade" (pausas fixas antigas)
+                nas interações com elementos.
+            restringir_hosts (bool): Resolva apenas os hosts de
+                `HOSTS_PERMITIDOS_LOGIN` e os do PJe/SSO; os demais
+                (CDNs, análise) falham sem tráfego de rede.
+
+        """
         options = Options()
 
         for argument in ARGUMENTS:
             options.add_argument(argument)
 
+        if restringir_hosts:
+            options.add_argument(regras_hosts_permitidos())
+
         preferences = PREFERENCES
         preferences.update({
             "printing.print_preview_sticky_settings.appState": SETTINGS,
@@ -35,14 +54,15 @@ class BotDriver:
 
         options.add_experimental_option("prefs", preferences)
 
-        cache_manager = DriverCacheManager()
-        driver_manager = ChromeDriverManager(
-            cache_manager=cache_manager,
-        )
-        service = Service(executable_path=driver_manager.install())
-        self.driver = Chrome(options=options, service=service)
+        service = Service(executable_path=resolver_chromedriver())
+        try:
+            self.driver = Chrome(options=options, service=service)
+        except WebDriverException:
+            # Ex.: Chrome atualizado e driver memorizado incompatível
+            esquecer_chromedriver()
+            raise
 
-        webelement = WebElementBot.set_driver(self.driver)
+        webelement = WebElementBot.set_driver(self.driver, perfil=perfil_espera)
 
         self.driver._web_element_cls = webelement
         self.wait = WebDriverWait(self.driver, 30)
@@ -0,0 +1,235 @@
+"""Aguarde as etapas do login por eventos do Chrome DevTools.
+
+Em vez de consultar a URL em intervalos fixos, a espera assina os
+eventos `Page.frameNavigated` e `Page.loadEventFired` e reavalia a
+página a cada navegação, resolvendo assim que a URL ou o elemento
+esperado aparece. Mensagens de erro do SSO (OTP inválido, certificado
+recusado) encerram a espera na hora, sem aguardar o timeout.
+
+Se a conexão com o DevTools não puder ser aberta (ou o trio, usado
+pela conexão BiDi do Selenium, não estiver instalado), a mesma
+verificação é feita por consulta periódica via WebDriver.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import suppress
+from time import monotonic
+from typing import TYPE_CHECKING, TypedDict
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    UnexpectedAlertPresentException,
+    WebDriverException,
+)
+from selenium.webdriver.support.wait import WebDriverWait
+
+from autenticapje.elements import pje as el
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+type AnyType = any
+
+# Reavaliação de segurança entre eventos, para páginas que exibem o
+# erro por script sem navegar
+INTERVALO_SEGURANCA = 0.5
+INTERVALO_CONSULTA = 0.3
+
+# Argumentos: trecho da URL, seletor do alvo e seletor de erro
+SCRIPT_ESTADO_PAGINA = """
+const [trecho, seletor, seletorErro] = arguments;
+const url = location.href;
+let erro = "";
+if (seletorErro) {
+    erro = Array.from(document.querySelectorAll(seletorErro))
+        .filter((elemento) => elemento.getClientRects().length > 0)
+        .map((elemento) => elemento.textContent.trim())
+        .filter(Boolean)
+        .join(" ");
+}
+return {
+    url: url,
+    pronto: (!trecho || url.includes(trecho))
+        && (!seletor || document.querySelector(seletor) !== null),
+    erro: erro || null,
+};
+"""
+
+
+class ErroSSO(Exception):
+    """Erro exibido pela página do SSO durante o login."""
+
+
+class EstadoPagina(TypedDict):
+    """Situação da página avaliada durante a espera.
+
+    Args:
+        url (str): URL atual da aba.
+        pronto (bool): Se a URL ou o elemento esperado apareceu.
+        erro (str | None): Mensagem de erro visível no SSO.
+
+    """
+
+    url: str
+    pronto: bool
+    erro: str | None
+
+
+def aguardar_pagina(
+    driver: WebDriver,
+    url_contem: str | None = None,
+    seletor: str | None = None,
+    timeout: float = 10.0,
+    seletor_erro: str | None = el.CSS_ERRO_SSO,
+) -> bool:
+    """Aguarde a URL ou o elemento esperado, reagindo às navegações.
+
+    Args:
+        driver (WebDriver): Driver com a aba do login.
+        url_contem (str | None): Trecho que a URL deve conter.
+        seletor (str | None): Seletor CSS que deve existir na página.
+        timeout (float): Tempo máximo de espera, em segundos.
+        seletor_erro (str | None): Seletor das mensagens de erro do
+            SSO; None desativa a detecção.
+
+    Returns:
+        bool: True se a página chegou ao estado esperado no prazo.
+
+    Raises:
+        ErroSSO: Se o SSO exibir uma mensagem de erro antes disso.
+
+    """
+    argumentos = [url_contem, seletor, seletor_erro]
+    limite = monotonic() + timeout
+
+    try:
+        import trio  # noqa: PLC0415
+
+        estado = trio.run(_aguardar_eventos, driver, argumentos, timeout)
+    except Exception:  # noqa: BLE001
+        # Sem trio ou sem DevTools (driver remoto, versão sem CDP):
+        # consulte via WebDriver
+        estado = _aguardar_consultando(
+            driver,
+            argumentos,
+            max(limite - monotonic(), 0.0),
+        )
+
+    if estado is None:
+        return False
+
+    if not estado["pronto"] and estado["erro"]:
+        raise ErroSSO(estado["erro"])
+
+    return estado["pronto"]
+
+
+async def _aguardar_eventos(
+    driver: WebDriver,
+    argumentos: list[str | None],
+    timeout: float,
+) -> EstadoPagina | None:
+    """Reavalie a página a cada evento de navegação do DevTools.
+
+    Args:
+        driver (WebDriver): Driver com a aba do login.
+        argumentos (list[str | None]): Argumentos do script de estado.
+        timeout (float): Tempo máximo de espera, em segundos.
+
+    Returns:
+        EstadoPagina | None: Estado final, ou None se o tempo esgotar.
+
+    """
+    import trio  # noqa: PLC0415
+
+    expressao = (
+        f"(function () {{{SCRIPT_ESTADO_PAGINA}}})"
+        f".apply(null, {json.dumps(argumentos)})"
+    )
+
+    async with driver.bidi_connection() as conexao:
+        sessao, devtools = conexao.session, conexao.devtools
+        eventos = sessao.listen(
+            devtools.page.FrameNavigated,
+            devtools.page.LoadEventFired,
+        )
+        await sessao.execute(devtools.page.enable())
+
+        with trio.move_on_after(timeout):
+            while True:
+                estado = await _avaliar(sessao, devtools, expressao)
+                if estado and (estado["pronto"] or estado["erro"]):
+                    return estado
+
+                with trio.move_on_after(INTERVALO_SEGURANCA):
+                    await eventos.receive()
+
+    return None
+
+
+async def _avaliar(
+    sessao: AnyType,
+    devtools: AnyType,
+    expressao: str,
+) -> EstadoPagina | None:
+    """Avalie o estado da página pelo `Runtime.evaluate`.
+
+    Args:
+        sessao (AnyType): Sessão CDP da aba.
+        devtools (AnyType): Módulo de domínios do DevTools.
+        expressao (str): Expressão que devolve o `EstadoPagina`.
+
+    Returns:
+        EstadoPagina | None: Estado atual, ou None se a página estiver
+            no meio de uma navegação.
+
+    """
+    with suppress(Exception):
+        resultado, excecao = await sessao.execute(
+            devtools.runtime.evaluate(expression=expressao, return_by_value=True),
+        )
+        if excecao is None:
+            return resultado.value
+
+    return None
+
+
+def _aguardar_consultando(
+    driver: WebDriver,
+    argumentos: list[str | None],
+    timeout: float,
+) -> EstadoPagina | None:
+    """Consulte o estado da página em intervalos fixos.
+
+    Args:
+        driver (WebDriver): Driver com a aba do login.
+        argumentos (list[str | None]): Argumentos do script de estado.
+        timeout (float): Tempo máximo de espera, em segundos.
+
+    Returns:
+        EstadoPagina | None: Estado final, ou None se o tempo esgotar.
+
+    """
+
+    def _consultar(driver: WebDriver) -> EstadoPagina | bool:
+        estado = driver.execute_script(SCRIPT_ESTADO_PAGINA, *argumentos)
+        if estado and (estado["pronto"] or estado["erro"]):
+            return estado
+
+        return False
+
+    with suppress(TimeoutException):
+        return WebDriverWait(
+            driver=driver,
+            timeout=timeout,
+            poll_frequency=INTERVALO_CONSULTA,
+            ignored_exceptions=(
+                UnexpectedAlertPresentException,
+                WebDriverException,
+            ),
+        ).until(_consultar)
+
+    return None
+
@@ -0,0 +1,299 @@
+"""Mantenha navegadores pré-iniciados para os autenticadores.
+
+O pool inicia os Chrome em segundo plano, empresta cada um para um
+login e limpa o estado (cookies, storage e abas extras) na
+devolução, tirando a abertura do navegador do tempo de login.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from queue import Empty, Queue
+from threading import Lock
+from typing import TYPE_CHECKING, Self
+from urllib.parse import urlparse
+
+from . import BotDriver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+BYTES_POR_MB = 1024 * 1024
+
+
+class PoolDrivers:
+    """Empreste instâncias de BotDriver já abertas e reaproveite-as.
+
+    Cada navegador é reciclado (encerrado e substituído) após
+    `max_usos` empréstimos, quando o heap JavaScript passa de
+    `limite_memoria_mb` ou se a limpeza na devolução falhar.
+    """
+
+    def __init__(
+        self,
+        tamanho: int = 2,
+        max_usos: int = 20,
+        limite_memoria_mb: float | None = None,
+        fabrica: Callable[[], BotDriver] = BotDriver,
+    ) -> None:
+        """Inicialize o pool e comece a abrir os navegadores.
+
+        Args:
+            tamanho (int): Quantidade de navegadores mantidos.
+            max_usos (int): Empréstimos antes de reciclar o navegador.
+            limite_memoria_mb (float | None): Heap JavaScript máximo,
+                em MB, para reaproveitar o navegador.
+            fabrica (Callable[[], BotDriver]): Cria novos drivers.
+
+        """
+        self.tamanho = tamanho
+        self.max_usos = max_usos
+        self.limite_memoria_mb = limite_memoria_mb
+        self._fabrica = fabrica
+
+        self._livres: Queue[BotDriver | Exception] = Queue()
+        self._usos: dict[int, int] = {}
+        self._trava = Lock()
+        self._encerrado = False
+        self._inicializador = ThreadPoolExecutor(
+            max_workers=tamanho,
+            thread_name_prefix="autenticapje-pool",
+        )
+
+        for _ in range(tamanho):
+            self._repor()
+
+    def alugar(self, timeout: float | None = None) -> BotDriver:
+        """Retire um navegador pronto do pool.
+
+        Args:
+            timeout (float | None): Tempo máximo de espera.
+
+        Returns:
+            BotDriver: Navegador limpo e pronto para uso.
+
+        Raises:
+            TimeoutError: Quando nenhum navegador fica livre a tempo.
+            Exception: Falha ao abrir o navegador em segundo plano.
+
+        """
+        try:
+            item = self._livres.get(timeout=timeout)
+        except Empty as e:
+            raise TimeoutError("Nenhum navegador disponível no pool") from e
+
+        if isinstance(item, Exception):
+            # Repõe a vaga para que o pool não perca capacidade
+            self._repor()
+            raise item
+
+        return item
+
+    def devolver(self, bot_driver: BotDriver) -> None:
+        """Limpe o navegador e devolva-o ao pool (ou recicle-o).
+
+        Args:
+            bot_driver (BotDriver): Navegador emprestado.
+
+        """
+        with self._trava:
+            usos = self._usos.get(id(bot_driver), 0) + 1
+            self._usos[id(bot_driver)] = usos
+
+        reaproveitar = (
+            not self._encerrado
+            and usos < self.max_usos
+            and not self._excede_memoria(bot_driver)
+            and self._limpar(bot_driver)
+        )
+        if reaproveitar:
+            self._livres.put(bot_driver)
+            return
+
+        self._descartar(bot_driver)
+        self._repor()
+
+    @contextmanager
+    def emprestar(self, timeout: float | None = None) -> Iterator[BotDriver]:
+        """Empreste um navegador e devolva-o ao final do bloco.
+
+        Args:
+            timeout (float | None): Tempo máximo de espera.
+
+        Yields:
+            BotDriver: Navegador emprestado.
+
+        """
+        bot_driver = self.alugar(timeout=timeout)
+        try:
+            yield bot_driver
+        finally:
+            self.devolver(bot_driver)
+
+    def encerrar(self) -> None:
+        """Feche todos os navegadores livres e pare o pool."""
+        with self._trava:
+            self._encerrado = True
+
+        self._inicializador.shutdown(wait=True)
+
+        while True:
+            try:
+                item = self._livres.get_nowait()
+            except Empty:
+                break
+
+            if not isinstance(item, Exception):
+                self._descartar(item)
+
+    def __enter__(self) -> Self:
+        """Retorne o próprio pool para uso em bloco `with`.
+
+        Returns:
+            Self: Este pool.
+
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Encerre o pool ao sair do bloco `with`.
+
+        Args:
+            *args (object): Informações da exceção, se houver.
+
+        """
+        self.encerrar()
+
+    def _repor(self) -> None:
+        """Agende a abertura de um navegador, se o pool não foi encerrado.
+
+        A verificação e o envio ficam sob a trava, para que nenhuma
+        abertura chegue ao inicializador depois do `shutdown`.
+        """
+        with self._trava:
+            if not self._encerrado:
+                self._inicializador.submit(self._iniciar_driver)
+
+    def _iniciar_driver(self) -> None:
+        """Abra um navegador e disponibilize-o no pool.
+
+        Falhas são entregues a quem alugar a vaga correspondente.
+        """
+        try:
+            bot_driver = self._fabrica()
+        except Exception as e:  # noqa: BLE001
+            self._livres.put(e)
+            return
+
+        if self._encerrado:
+            self._descartar(bot_driver)
+            return
+
+        self._livres.put(bot_driver)
+
+    def _limpar(self, bot_driver: BotDriver) -> bool:
+        """Remova cookies, storage e abas extras do navegador.
+
+        O storage (localStorage, IndexedDB, cache...) é apagado em
+        todas as origens do histórico de navegação das abas, o que
+        inclui o SSO e os demais TRTs visitados, não só a atual.
+
+        Args:
+            bot_driver (BotDriver): Navegador a limpar.
+
+        Returns:
+            bool: True se a limpeza foi concluída.
+
+        """
+        driver = bot_driver.driver
+        try:
+            principal, *extras = driver.window_handles
+            origens: set[str] = set()
+            for aba in extras:
+                driver.switch_to.window(aba)
+                origens.update(_origens_visitadas(driver))
+                driver.close()
+
+            driver.switch_to.window(principal)
+            origens.update(_origens_visitadas(driver))
+
+            for origem in sorted(origens):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origem, "storageTypes": "all"},
+                )
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+            driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+
+        except Exception:  # noqa: BLE001
+            return False
+
+        return True
+
+    def _excede_memoria(self, bot_driver: BotDriver) -> bool:
+        """Verifique se o heap JavaScript passou do limite.
+
+        Args:
+            bot_driver (BotDriver): Navegador a verificar.
+
+        Returns:
+            bool: True se o navegador deve ser reciclado.
+
+        """
+        if self.limite_memoria_mb is None:
+            return False
+
+        try:
+            bot_driver.driver.execute_cdp_cmd("Performance.enable", {})
+            metricas = bot_driver.driver.execute_cdp_cmd(
+                "Performance.getMetrics",
+                {},
+            )["metrics"]
+        except Exception:  # noqa: BLE001
+            return True
+
+        heap = next(
+            (m["value"] for m in metricas if m["name"] == "JSHeapTotalSize"),
+            0,
+        )
+        return heap / BYTES_POR_MB > self.limite_memoria_mb
+
+    def _descartar(self, bot_driver: BotDriver) -> None:
+        """Encerre o navegador e esqueça sua contagem de usos.
+
+        Args:
+            bot_driver (BotDriver): Navegador a encerrar.
+
+        """
+        with self._trava:
+            self._usos.pop(id(bot_driver), None)
+
+        with suppress(Exception):
+            bot_driver.driver.quit()
+
+
+def _origens_visitadas(driver: WebDriver) -> set[str]:
+    """Liste as origens HTTP(S) do histórico de navegação da aba.
+
+    Args:
+        driver (WebDriver): Driver com a aba selecionada.
+
+    Returns:
+        set[str]: Origens no formato `esquema://host[:porta]`.
+
+    """
+    historico = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    urls = [entrada["url"] for entrada in historico["entries"]]
+
+    origens = set()
+    for url in [*urls, driver.current_url]:
+        partes = urlparse(url)
+        if partes.scheme in {"http", "https"}:
+            origens.add(f"{partes.scheme}://{partes.netloc}")
+
+    return origens
@@ -0,0 +1,104 @@
+"""Carregue apenas o essencial das páginas do PJe e do SSO no login.
+
+Durante o login bastam o formulário `kc-form-login`, o campo OTP e os
+cookies finais; imagens, fontes, folhas de estilo e scripts de
+análise são bloqueados pelo DevTools (`Network.setBlockedURLs`) e
+liberados ao fim do login. As listas ficam em `elements/pje.py`.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from autenticapje.elements import pje as el
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def bloquear_recursos(
+    driver: WebDriver,
+    padroes: Iterable[str] = el.PADROES_BLOQUEADOS_LOGIN,
+) -> bool:
+    """Bloqueie as requisições cujas URLs casam com os padrões.
+
+    Args:
+        driver (WebDriver): Driver Chrome com suporte a CDP.
+        padroes (Iterable[str]): Padrões de URL (aceitam `*`).
+
+    Returns:
+        bool: True se o bloqueio foi aplicado; False se o driver não
+            oferece o DevTools (o login segue sem bloqueio).
+
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(padroes)})
+    except Exception:  # noqa: BLE001
+        return False
+
+    return True
+
+
+def liberar_recursos(driver: WebDriver) -> None:
+    """Desfaça o bloqueio aplicado por `bloquear_recursos`.
+
+    Args:
+        driver (WebDriver): Driver Chrome com suporte a CDP.
+
+    """
+    with suppress(Exception):
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        driver.execute_cdp_cmd("Network.disable", {})
+
+
+@contextmanager
+def carregamento_enxuto(
+    driver: WebDriver,
+    padroes: Iterable[str] = el.PADROES_BLOQUEADOS_LOGIN,
+) -> Iterator[bool]:
+    """Bloqueie recursos dispensáveis enquanto o bloco executa.
+
+    Args:
+        driver (WebDriver): Driver Chrome com suporte a CDP.
+        padroes (Iterable[str]): Padrões de URL (aceitam `*`).
+
+    Yields:
+        bool: Se o bloqueio está ativo.
+
+    """
+    ativo = bloquear_recursos(driver, padroes)
+    try:
+        yield ativo
+    finally:
+        if ativo:
+            liberar_recursos(driver)
+
+
+def regras_hosts_permitidos(
+    hosts: Iterable[str] = el.HOSTS_PERMITIDOS_LOGIN,
+) -> str:
+    """Monte o `--host-resolver-rules` que só resolve os hosts do login.
+
+    Os hosts de `URL_PJE` e `URL_SSO` (inclusive quando apontam para o
+    simulador) entram sempre na lista.
+
+    Args:
+        hosts (Iterable[str]): Hosts permitidos (aceitam `*`).
+
+    Returns:
+        str: Argumento de linha de comando do Chrome.
+
+    """
+    permitidos = dict.fromkeys(hosts)
+    for url in (el.URL_PJE.replace("{trt_id}", "0"), el.URL_SSO):
+        host = urlsplit(url).hostname
+        if host:
+            permitidos[host.replace("trt0", "trt*")] = None
+
+    excecoes = ", ".join(f"EXCLUDE {host}" for host in permitidos)
+    return f"--host-resolver-rules=MAP * ~NOTFOUND, {excecoes}"
@@ -0,0 +1,182 @@
+"""Resolva o chromedriver sem acessar a rede a cada execução.
+
+O caminho do driver fica fixado em um manifesto local junto com a
+versão do Chrome instalado. Enquanto a versão principal do Chrome
+não muda, o manifesto é usado diretamente; o webdriver-manager só é
+chamado quando o manifesto falta ou está desatualizado.
+
+O caminho resolvido também é memorizado no processo; se o Chrome for
+atualizado durante uma execução longa (ex.: `serve`), a falha ao
+abrir o driver descarta essa memória (`esquecer_chromedriver`) e a
+próxima resolução volta a conferir a versão.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from contextlib import suppress
+from os import environ
+from pathlib import Path
+from threading import Lock
+from typing import TypedDict
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+MANIFESTO_PADRAO = Path.home().joinpath(".autenticapje", "chromedriver.json")
+
+_trava = Lock()
+_resolvido: dict[Path, str] = {}
+
+
+class ManifestoChromedriver(TypedDict):
+    """Driver fixado para uma versão do Chrome.
+
+    Args:
+        versao_chrome (str | None): Versão do Chrome detectada.
+        caminho (str): Caminho do executável do chromedriver.
+
+    """
+
+    versao_chrome: str | None
+    caminho: str
+
+
+def versao_chrome_local() -> str | None:
+    """Detecte a versão do Chrome instalado, sem acessar a rede.
+
+    Returns:
+        str | None: Versão completa ou None se não encontrada.
+
+    """
+    with suppress(Exception):
+        return OperationSystemManager().get_browser_version_from_os(
+            ChromeType.GOOGLE,
+        )
+
+    return None
+
+
+def resolver_chromedriver(manifesto: Path | None = None) -> str:
+    """Retorne o caminho do chromedriver compatível com o Chrome.
+
+    A ordem de resolução é: variável `CHROMEDRIVER_PATH`, resultado
+    já resolvido neste processo, manifesto local e, por último, o
+    webdriver-manager (que atualiza o manifesto).
+
+    Args:
+        manifesto (Path | None): Arquivo do manifesto (padrão:
+            ~/.autenticapje/chromedriver.json).
+
+    Returns:
+        str: Caminho do executável do chromedriver.
+
+    """
+    fixado = environ.get("CHROMEDRIVER_PATH")
+    if fixado and Path(fixado).is_file():
+        return fixado
+
+    manifesto = manifesto or MANIFESTO_PADRAO
+
+    with _trava:
+        if manifesto in _resolvido:
+            return _resolvido[manifesto]
+
+        versao = versao_chrome_local()
+        caminho = _ler_manifesto(manifesto, versao)
+        if not caminho:
+            caminho = ChromeDriverManager(
+                cache_manager=DriverCacheManager(),
+            ).install()
+            _gravar_manifesto(
+                manifesto,
+                ManifestoChromedriver(versao_chrome=versao, caminho=caminho),
+            )
+
+        _resolvido[manifesto] = caminho
+        return caminho
+
+
+def esquecer_chromedriver(manifesto: Path | None = None) -> None:
+    """Descarte o driver memorizado no processo para o manifesto.
+
+    Chame quando o driver resolvido falhar ao iniciar: a próxima
+    resolução relê o manifesto e confere a versão do Chrome.
+
+    Args:
+        manifesto (Path | None): Arquivo do manifesto (padrão:
+            ~/.autenticapje/chromedriver.json).
+
+    """
+    with _trava:
+        _resolvido.pop(manifesto or MANIFESTO_PADRAO, None)
+
+
+def _ler_manifesto(manifesto: Path, versao: str | None) -> str | None:
+    """Leia o driver fixado se ainda for compatível com o Chrome.
+
+    Args:
+        manifesto (Path): Arquivo do manifesto.
+        versao (str | None): Versão atual do Chrome.
+
+    Returns:
+        str | None: Caminho do driver ou None se estiver ausente ou
+            desatualizado.
+
+    """
+    try:
+        dados: ManifestoChromedriver = json.loads(manifesto.read_text())
+    except (OSError, ValueError):
+        return None
+
+    caminho = dados.get("caminho")
+    if not caminho or not Path(caminho).is_file():
+        return None
+
+    # Sem versão detectável, confia no driver já fixado
+    if versao and _principal(versao) != _principal(dados.get("versao_chrome")):
+        return None
+
+    return caminho
+
+
+def _gravar_manifesto(manifesto: Path, dados: ManifestoChromedriver) -> None:
+    """Grave o manifesto de forma atômica.
+
+    Args:
+        manifesto (Path): Arquivo do manifesto.
+        dados (ManifestoChromedriver): Conteúdo a gravar.
+
+    """
+    with suppress(OSError):
+        manifesto.parent.mkdir(parents=True, exist_ok=True)
+        # Temporário próprio: outros processos podem gravar ao mesmo tempo
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=manifesto.parent,
+            prefix=manifesto.stem + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as temporario:
+            temporario.write(json.dumps(dados))
+
+        try:
+            Path(temporario.name).replace(manifesto)
+        except OSError:
+            Path(temporario.name).unlink(missing_ok=True)
+            raise
+
+
+def _principal(versao: str | None) -> str:
+    """Extraia a versão principal (ex.: "142" de "142.0.7444.59").
+
+    Args:
+        versao (str | None): Versão completa.
+
+    Returns:
+        str: Versão principal ou string vazia.
+
+    """
+    return (versao or "").split(".")[0]
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import platform
+import re
 from contextlib import suppress
 from pathlib import Path
-from time import sleep
-from typing import TYPE_CHECKING, Self, TypedDict
-
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Literal, Self, TypedDict
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.actions.wheel_input import ScrollOrigin
@@ -23,6 +29,142 @@ if TYPE_CHECKING:
 
 
 type AnyType = any
+type PerfilEspera = Literal["rapido", "compatibilidade"]
+type EstadoVisibilidade = Literal["visivel", "oculto"]
+
+INTERVALO_ESPERA = 0.05
+TIMEOUT_ESPERA = 10.0
+TIMEOUT_SCRIPT_PADRAO = 30.0
+
+TECLAS_ESPECIAIS = frozenset(
+    getattr(Keys, nome) for nome in dir(Keys) if not nome.startswith("_")
+)
+# Teclas do WebDriver ficam na área de uso privado do Unicode; quebras
+# de linha também precisam do send_keys (ENTER envia formulários)
+CARACTERES_TECLAS = re.compile(r"[\ue000-\uf8ff\r\n]")
+
+SCRIPT_FOCAR_FIM = """
+const elemento = arguments[0];
+elemento.focus();
+try {
+    const fim = elemento.value.length;
+    elemento.setSelectionRange(fim, fim);
+} catch (e) {}
+return document.activeElement === elemento;
+"""
+
+# Espera executada no navegador: a condição é reavaliada a cada
+# mutação do DOM (e a cada intervalo, para transições de CSS) até ser
+# atendida ou esgotar o tempo, com uma única chamada ao chromedriver.
+# Argumentos: alvo, parâmetro, timeout (ms), intervalo (ms), callback.
+MODELO_ESPERA = """
+const alvo = arguments[0];
+const parametro = arguments[1];
+const concluir = arguments[arguments.length - 1];
+const atendida = () => {
+    try {
+        return Boolean((() => { %s })());
+    } catch (e) {
+        return false;
+    }
+};
+if (atendida()) return concluir(true);
+
+let finalizado = false;
+const observador = new MutationObserver(() => verificar());
+const intervalo = setInterval(() => verificar(), arguments[3]);
+const limite = setTimeout(() => finalizar(false), arguments[2]);
+function finalizar(resultado) {
+    if (finalizado) return;
+    finalizado = true;
+    observador.disconnect();
+    clearInterval(intervalo);
+    clearTimeout(limite);
+    concluir(resultado);
+}
+function verificar() {
+    if (atendida()) finalizar(true);
+}
+observador.observe(document.documentElement, {
+    attributes: true,
+    childList: true,
+    subtree: true,
+    characterData: true,
+});
+"""
+
+# Documento carregado, sem AJAX do jQuery pendente e Angular estável
+CONDICAO_PAGINA_OCIOSA = """
+if (document.readyState !== "complete") return false;
+if (window.jQuery && window.jQuery.active > 0) return false;
+if (window.getAllAngularTestabilities) {
+    return window.getAllAngularTestabilities().every((t) => t.isStable());
+}
+if (window.angular) {
+    try {
+        const injector = window.angular.element(document.body).injector();
+        return !injector || injector.get("$http").pendingRequests.length === 0;
+    } catch (e) {
+        return true;
+    }
+}
+return true;
+"""
+
+# Estado calculado (display, visibility e caixas de layout, que cobrem
+# ancestrais ocultos); "visivel" ou "oculto" em `parametro`
+CONDICAO_VISIBILIDADE = """
+const estilo = alvo.isConnected ? getComputedStyle(alvo) : null;
+const visivel = Boolean(estilo)
+    && estilo.display !== "none"
+    && estilo.visibility !== "hidden"
+    && alvo.getClientRects().length > 0;
+return parametro === "visivel" ? visivel : !visivel;
+"""
+
+CONDICAO_INTERAGIVEL = """
+const estilo = getComputedStyle(alvo);
+return alvo.isConnected
+    && estilo.display !== "none"
+    && estilo.visibility !== "hidden"
+    && alvo.getClientRects().length > 0
+    && !alvo.disabled;
+"""
+
+CONDICAO_VALOR_VAZIO = """
+return !alvo.value;
+"""
+
+CONDICAO_NA_TELA = """
+const r = alvo.getBoundingClientRect();
+return r.bottom > 0 && r.right > 0
+    && r.top < (window.innerHeight || document.documentElement.clientHeight)
+    && r.left < (window.innerWidth || document.documentElement.clientWidth);
+"""
+
+# Mapa texto -> valor das opções, montado a cada chamada (sem cache:
+# selects recarregados podem trocar as opções mantendo a quantidade).
+# Com texto informado, seleciona a opção e dispara "change"; sem
+# texto, retorna o mapa.
+SCRIPT_SELECT2 = """
+const select = arguments[0];
+const busca = arguments[1];
+const mapa = {};
+for (const opcao of select.options) {
+    const texto = opcao.textContent.split(/\\s+/).filter(Boolean).join(" ");
+    mapa[texto.toUpperCase()] = opcao.value;
+}
+if (busca === null) return mapa;
+if (!Object.prototype.hasOwnProperty.call(mapa, busca)) return null;
+const valor = mapa[busca];
+if (window.jQuery) {
+    window.jQuery(select).val([valor]).trigger("change");
+} else {
+    select.value = valor;
+    select.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return valor;
+"""
 
 
 class RectWebElement(TypedDict):
@@ -35,10 +177,18 @@ class RectWebElement(TypedDict):
 
 
 class WebElementBot(WebElement):
-    """Gerencie e interaja com elementos web personalizados."""
+    """Gerencie e interaja com elementos web personalizados.
+
+    No perfil "rapido" (padrão) as interações aguardam condições
+    reais (elemento interagível, valor limpo, página sem AJAX
+    pendente); o perfil "compatibilidade" mantém as pausas fixas
+    antigas para páginas que dependem delas.
+    """
 
     _current_driver: WebDriver = None
     _action: ActionChains = None
+    _perfil: PerfilEspera = "rapido"
+    _timeout: float = TIMEOUT_ESPERA
     parent: WebDriver | Chrome
 
     def __call__(self, *args: AnyType, **kwargs: AnyType) -> None:
@@ -52,20 +202,38 @@ class WebElementBot(WebElement):
         return super().click()
 
     @classmethod
-    def set_driver(cls, _driver: WebDriver) -> type[Self]:
-        """Defina o driver atual para a classe e inicialize ActionChains.
+    def set_driver(
+        cls,
+        _driver: WebDriver,
+        perfil: PerfilEspera = "rapido",
+        timeout: float = TIMEOUT_ESPERA,
+    ) -> type[Self]:
+        """Crie uma subclasse vinculada ao driver informado.
+
+        Cada driver recebe sua própria subclasse, evitando que
+        navegadores simultâneos compartilhem o mesmo ActionChains.
 
         Args:
             _driver (WebDriver): Instância do driver a ser utilizada.
+            perfil (PerfilEspera): "rapido" (esperas por condição) ou
+                "compatibilidade" (pausas fixas).
+            timeout (float): Espera máxima por cada condição no
+                perfil "rapido".
 
         Returns:
-            type[Self]: Classe atual com driver configurado.
+            type[Self]: Subclasse com driver configurado.
 
         """
-        cls._current_driver = _driver
-        cls._action = ActionChains(_driver)
-
-        return cls
+        return type(
+            cls.__name__,
+            (cls,),
+            {
+                "_current_driver": _driver,
+                "_action": ActionChains(_driver),
+                "_perfil": perfil,
+                "_timeout": timeout,
+            },
+        )
 
     @property
     def rect(self) -> RectWebElement:
@@ -96,29 +264,169 @@ class WebElementBot(WebElement):
         Select(self).select_by_value(item)
 
     def click(self) -> None:
-        """Perform a click action on a web element with brief pauses.
-
-        Args:
-            element (WebElement): The target web element.
-
-        Implements a click with pre- and post-click delays.
+        """Clique no elemento quando ele estiver pronto.
 
+        No perfil "rapido" aguarda o elemento ficar visível e
+        habilitado e, após o clique, a página ficar ociosa; no
+        perfil "compatibilidade" usa pausas fixas.
         """
-        sleep(0.05)
+        if self._perfil == "compatibilidade":
+            sleep(0.05)
+            super().click()
+            sleep(0.05)
+            return
+
+        self.aguardar_interagivel()
         super().click()
-        sleep(0.05)
+        self.aguardar_pagina_ociosa()
 
     def clear(self) -> None:
-        """Limpe o conteúdo do elemento web após clicar e aguardar."""
+        """Limpe o conteúdo do elemento web após clicar nele."""
         self.click()
-        sleep(0.5)
+        if self._perfil == "compatibilidade":
+            sleep(0.5)
+            super().clear()
+            sleep(1)
+            return
+
         super().clear()
-        sleep(1)
+        self._aguardar_no_navegador(CONDICAO_VALOR_VAZIO)
 
     def scroll_to(self) -> None:
-        """Scroll the view to the specified web element."""
-        self._action.scroll_to_element(self)
-        sleep(0.5)
+        """Role a página até o elemento."""
+        self._action.scroll_to_element(self).perform()
+        if self._perfil == "compatibilidade":
+            sleep(0.5)
+            return
+
+        self._aguardar_no_navegador(CONDICAO_NA_TELA)
+
+    def aguardar_interagivel(self) -> bool:
+        """Aguarde o elemento ficar visível e habilitado.
+
+        Returns:
+            bool: True se a condição foi atendida antes do timeout.
+
+        """
+        return self._aguardar_no_navegador(CONDICAO_INTERAGIVEL)
+
+    def aguardar_pagina_ociosa(self) -> bool:
+        """Aguarde o fim do carregamento e das requisições AJAX.
+
+        Considera o `readyState` do documento, `jQuery.active` e a
+        estabilidade do Angular/AngularJS, quando presentes. Se o
+        documento for descarregado durante a espera (ex.: o clique
+        navegou), aguarda a nova página.
+
+        Returns:
+            bool: True se a página ficou ociosa antes do timeout.
+
+        """
+        try:
+            return self._aguardar_no_navegador(CONDICAO_PAGINA_OCIOSA)
+        except (JavascriptException, StaleElementReferenceException):
+            return self._aguardar_nova_pagina()
+
+    def _aguardar_nova_pagina(self) -> bool:
+        """Aguarde a página seguinte a uma navegação ficar ociosa.
+
+        A espera roda no documento, sem referência a este elemento
+        (que deixou de existir), e é refeita a cada novo descarte
+        (redirecionamentos em sequência) até esgotar o tempo.
+
+        Returns:
+            bool: True se a nova página ficou ociosa antes do timeout.
+
+        """
+        limite = monotonic() + self._timeout
+        while (restante := limite - monotonic()) > 0:
+            with suppress(JavascriptException):
+                return self._aguardar_no_navegador(
+                    CONDICAO_PAGINA_OCIOSA,
+                    timeout=restante,
+                    no_documento=True,
+                )
+
+            sleep(INTERVALO_ESPERA)
+
+        return False
+
+    def aguardar_visibilidade(
+        self,
+        estado: EstadoVisibilidade = "oculto",
+        timeout: float | None = None,
+    ) -> bool:
+        """Aguarde, no navegador, o elemento ficar visível ou oculto.
+
+        Usa o estilo calculado (display/visibility, inclusive de
+        ancestrais) e um MutationObserver, sem consultas repetidas
+        ao chromedriver. Elemento removido da página conta como
+        oculto.
+
+        Args:
+            estado (EstadoVisibilidade): "visivel" ou "oculto".
+            timeout (float | None): Espera máxima em segundos.
+
+        Returns:
+            bool: True se o estado foi atingido antes do timeout.
+
+        """
+        try:
+            return self._aguardar_no_navegador(
+                CONDICAO_VISIBILIDADE,
+                estado,
+                timeout=timeout,
+            )
+        except StaleElementReferenceException:
+            return estado == "oculto"
+
+    def _aguardar_no_navegador(
+        self,
+        condicao: str,
+        parametro: AnyType = None,
+        timeout: float | None = None,
+        *,
+        no_documento: bool = False,
+    ) -> bool:
+        """Aguarde a condição JavaScript em uma única chamada assíncrona.
+
+        Args:
+            condicao (str): Corpo de função que retorna a condição;
+                recebe `alvo` (este elemento) e `parametro`.
+            parametro (AnyType): Valor repassado à condição.
+            timeout (float | None): Espera máxima (padrão: a do
+                perfil).
+            no_documento (bool): Não repasse este elemento (`alvo`
+                fica nulo), para condições sobre o documento.
+
+        Returns:
+            bool: True se a condição foi atendida.
+
+        """
+        timeout = timeout or self._timeout
+        anterior = None
+        if timeout >= TIMEOUT_SCRIPT_PADRAO:
+            # O driver é compartilhado: o timeout volta ao valor anterior
+            anterior = self.parent.timeouts.script
+            self.parent.set_script_timeout(timeout + 5)
+
+        try:
+            with suppress(TimeoutException):
+                return bool(
+                    self.parent.execute_async_script(
+                        MODELO_ESPERA % condicao,
+                        None if no_documento else self,
+                        parametro,
+                        int(timeout * 1000),
+                        int(INTERVALO_ESPERA * 1000),
+                    ),
+                )
+
+        finally:
+            if anterior is not None:
+                self.parent.set_script_timeout(anterior)
+
+        return False
 
     def find_element(
         self,
@@ -154,25 +462,62 @@ class WebElementBot(WebElement):
         """
         return super().find_elements(by=by, value=value)
 
-    def send_keys(self, word: AnyType) -> None:
+    def send_keys(self, word: AnyType, por_caractere: bool | None = None) -> None:
         """Envie teclas ou texto para o elemento web.
 
+        Texto comum é inserido em um único comando; o envio de um
+        caractere por vez fica para campos que realmente precisam.
+
         Args:
             word (AnyType): Tecla ou texto a ser enviado.
+            por_caractere (bool | None): Digite um caractere por vez,
+                com pausa entre eles (padrão: apenas no perfil
+                "compatibilidade").
 
         """
-        send = False
-        for key in dir(Keys):
-            if getattr(Keys, key) == word:
-                send = True
-                super().send_keys(word)
-                break
-
-        if not send:
-            for c in str(word):
+        if isinstance(word, str) and word in TECLAS_ESPECIAIS:
+            super().send_keys(word)
+            return
+
+        texto = str(word)
+        if por_caractere is None:
+            por_caractere = self._perfil == "compatibilidade"
+
+        if por_caractere:
+            for c in texto:
                 sleep(0.01)
                 super().send_keys(c)
 
+            return
+
+        if not self._inserir_texto(texto):
+            super().send_keys(texto)
+
+    def _inserir_texto(self, texto: str) -> bool:
+        """Insira o texto de uma vez pelo CDP (`Input.insertText`).
+
+        O Chrome dispara os eventos `beforeinput`/`input`, como na
+        digitação, então formulários Angular percebem o valor.
+
+        Args:
+            texto (str): Texto sem teclas especiais.
+
+        Returns:
+            bool: False quando o CDP não está disponível, o texto tem
+                teclas especiais/quebras de linha ou o elemento não
+                recebe foco; nesses casos use o `send_keys` padrão.
+
+        """
+        executar_cdp = getattr(self.parent, "execute_cdp_cmd", None)
+        if not executar_cdp or not texto or CARACTERES_TECLAS.search(texto):
+            return False
+
+        if not self.parent.execute_script(SCRIPT_FOCAR_FIM, self):
+            return False
+
+        executar_cdp("Input.insertText", {"text": texto})
+        return True
+
     def send_file(self, file: str | Path) -> None:
         """Envie um arquivo para o elemento input do tipo file.
 
@@ -194,60 +539,53 @@ class WebElementBot(WebElement):
             },
         )
 
-    def display_none(self) -> None:
-        """Wait for an element's display style to change to 'none'.
+    def display_none(self, timeout: float | None = None) -> bool:
+        """Aguarde o elemento deixar de ser exibido (display: none).
 
         Args:
-            elemento (WebElement): The element to monitor.
+            timeout (float | None): Espera máxima em segundos.
+
+        Returns:
+            bool: True se o elemento ficou oculto antes do timeout.
 
         """
-        while True:
-            style = self.get_attribute("style")
-            if "display: none;" not in style:
-                sleep(0.01)
-                break
+        return self.aguardar_visibilidade("oculto", timeout=timeout)
 
     def select2(self, to_search: str) -> None:
         r"""Select an option from a Select2 dropdown based on a search text.
 
+        Lê as opções, escolhe a de texto correspondente e dispara o
+        "change" em uma única chamada de script.
+
         Args:
             to_search (str): The option text to search and select.
 
         """
-        items = self.find_elements(By.TAG_NAME, "option")
-        opt_itens: dict[str, str] = {}
-
-        id_select = self.get_attribute("id")
+        value_opt = self.parent.execute_script(
+            SCRIPT_SELECT2,
+            self,
+            _normalizar_opcao(to_search),
+        )
 
-        for item in items:
-            value_item = item.get_attribute("value")
+        if value_opt is not None:
+            if self._perfil == "compatibilidade":
+                sleep(5)
+                return
 
-            cms = f"select[id='{id_select}'] > option[value='{value_item}']"
-            text_item = self.parent.execute_script(
-                f'return $("{cms}").text();',
-            )
+            # Os handlers de "change" do jQuery rodam de forma síncrona;
+            # resta aguardar o AJAX que eles disparam
+            self.aguardar_pagina_ociosa()
+            return
 
-            text_item = " ".join([
-                item for item in str(text_item).strip().split(" ") if item
-            ]).upper()
-            opt_itens.update({text_item: value_item})
+    def opcoes_select(self) -> dict[str, str]:
+        """Obtenha as opções do select em uma única chamada.
 
-        to_search = " ".join(to_search.split(" ")).upper()
-        value_opt = opt_itens.get(to_search)
+        Returns:
+            dict[str, str]: Texto normalizado (maiúsculo, espaços
+                simples) -> valor de cada opção.
 
-        if value_opt:
-            select_element = self.parent.find_element(
-                By.CSS_SELECTOR,
-                f"select[id='{id_select}']",
-            )
-            command = """
-            const selector = $(arguments[0]);
-            selector.val([arguments[1]]);
-            selector.trigger("change");
-            """
-            self.parent.execute_script(command, select_element, value_opt)
-            sleep(5)
-            return
+        """
+        return self.parent.execute_script(SCRIPT_SELECT2, self, None)
 
     def scroll_from_origin(
         self,
@@ -302,3 +640,16 @@ class WebElementBot(WebElement):
         """
         command = "arguments[0].blur();"
         self.parent.execute_script(command, self)
+
+
+def _normalizar_opcao(texto: str) -> str:
+    """Normalize o texto de uma opção para comparação.
+
+    Args:
+        texto (str): Texto informado ou exibido na opção.
+
+    Returns:
+        str: Texto em maiúsculas com espaços simples.
+
+    """
+    return " ".join(texto.split()).upper()
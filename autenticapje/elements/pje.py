@@ -1,8 +1,14 @@
 """Defina constantes de elementos e URLs do sistema PJe.
 
 Este módulo contém seletores, padrões e links usados para automação.
+
+Os endereços base podem ser trocados pelas variáveis de ambiente
+`AUTENTICAPJE_URL_PJE` (com o marcador `{trt_id}`) e
+`AUTENTICAPJE_URL_SSO`, por exemplo para apontar ao simulador local.
 """
 
+from os import environ
+
 url_login = "https://pje.trt11.jus.br/primeirograu/login.seam"
 chk_login = "https://pje.trt11.jus.br/pjekz/painel/usuario-externo"
 login_input = 'input[id="username"]'
@@ -17,13 +23,56 @@ pattern_url = (
     r"\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}\/\d+(#[a-zA-Z0-9]+)?$"
 )
 
+# Com ou sem barra final nas variáveis: o PJe fica sem, o SSO com
+URL_PJE = environ.get(
+    "AUTENTICAPJE_URL_PJE",
+    "https://pje.trt{trt_id}.jus.br",
+).rstrip("/")
+URL_SSO = (
+    environ.get("AUTENTICAPJE_URL_SSO", "https://sso.cloud.pje.jus.br/").rstrip("/")
+    + "/"
+)
+ENDPOINT_DESAFIO = URL_SSO + "auth/realms/pje/pjeoffice-rest"
 COMMAND = "document.getElementById(arguments[0]).value = arguments[1];"
 CSS_FORM_LOGIN = 'form[id="kc-form-login"]'
+CSS_INPUT_OTP = 'input[id="otp"]'
+# Mensagens de erro do Keycloak (OTP inválido, certificado recusado);
+# `.kc-feedback-text` sozinho também casa avisos e informações
+CSS_ERRO_SSO = (
+    "#input-error, #kc-error-message, "
+    ".alert-error .kc-feedback-text, .pf-m-danger .kc-feedback-text"
+)
+TRECHO_URL_AUTENTICADO = "pjekz"
+
+# Recursos dispensáveis no login (Network.setBlockedURLs aceita `*`):
+# só o formulário e os cookies finais importam
+PADROES_BLOQUEADOS_LOGIN = (
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.svg*",
+    "*.ico*",
+    "*.webp*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*.css*",
+    "*.mp4*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+)
+# Únicos hosts resolvidos quando o navegador restringe a rede ao login
+HOSTS_PERMITIDOS_LOGIN = ("*.jus.br", "localhost")
 ID_CODIGO_PJE = "pjeoffice-code"
 ID_INPUT_DESAFIO = "phrase"
 
 LINK_AUTENTICACAO_SSO = (
-    "https://pje.trt{regiao}.jus.br/primeirograu/authenticateSSO.seam"
+    URL_PJE.format(trt_id="{regiao}") + "/primeirograu/authenticateSSO.seam"
 )
 OL_LIST_ANEXOS = '//*[@id="cdk-drop-list-3"]'
 XPATH_BTN_ASSINAR = (
@@ -47,10 +96,11 @@ XPATH_SALVA_ARQUIVO = (
     "pje-duas-colunas/div/div[1]/form/div/div[1]/button"
 )
 
-LINK_DADOS_BASICOS = "https://pje.trt{trt_id}.jus.br/pje-consulta-api/api/processos/dadosbasicos/{numero_processo}"
-LINK_CONSULTA_PROCESSO = "https://pje.trt{trt_id}.jus.br/pje-comum-api/api/processos/id/{id_processo}"
-LINK_DOWNLOAD_INTEGRA = "https://pje.trt{trt_id}.jus.br/pje-comum-api/api/processos/id/{id_processo}/documentos/agrupados?processoCompleto=true"
-LINK_CONSULTA_PARTES = "https://pje.trt{trt_id}.jus.br/pje-comum-api/api/processos/id/{id_processo}/partes"
-LINK_CONSULTA_ASSUNTOS = "https://pje.trt{trt_id}.jus.br/pje-comum-api/api/processos/id/{id_processo}/assuntos"
-LINK_AUDIENCIAS = "https://pje.trt{trt_id}.jus.br/pje-comum-api/api/processos/id/{id_processo}/audiencias"
+LINK_DADOS_BASICOS = URL_PJE + "/pje-consulta-api/api/processos/dadosbasicos/{numero_processo}"
+LINK_CONSULTA_PROCESSO = URL_PJE + "/pje-comum-api/api/processos/id/{id_processo}"
+LINK_DOWNLOAD_INTEGRA = URL_PJE + "/pje-comum-api/api/processos/id/{id_processo}/documentos/agrupados?processoCompleto=true"
+LINK_CONSULTA_PARTES = URL_PJE + "/pje-comum-api/api/processos/id/{id_processo}/partes"
+LINK_CONSULTA_ASSUNTOS = URL_PJE + "/pje-comum-api/api/processos/id/{id_processo}/assuntos"
+LINK_AUDIENCIAS = URL_PJE + "/pje-comum-api/api/processos/id/{id_processo}/audiencias"
 LINK_AUDIENCIAS_CANCELADAS = str(LINK_AUDIENCIAS + "?canceladas=true")
+LINK_VERIFICA_SESSAO = URL_PJE + "/pje-comum-api/api/usuarios/logado"
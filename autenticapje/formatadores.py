@@ -6,6 +6,7 @@ especiais, tornando textos seguros para nomes de arquivos.
 
 from __future__ import annotations
 
+import re
 import secrets
 from traceback import format_exception_only
 
@@ -29,6 +30,19 @@ def random_base36() -> str:
     return "0." + result or "0.0"
 
 
+def somente_digitos(valor: str) -> str:
+    """Remova pontuação de CPF/CNPJ.
+
+    Args:
+        valor (str): Documento formatado.
+
+    Returns:
+        str: Apenas os dígitos do documento.
+
+    """
+    return re.sub(r"\D", "", valor)
+
+
 def formata_msg(exc: Exception | None = None) -> str:
     """Formata mensagem de erro detalhada a partir de uma exceção fornecida ao bot.
 
@@ -1,10 +1,17 @@
 """Keepass wrapper."""
 
+from __future__ import annotations
+
+import hashlib
 from os import environ as env
-from typing import TYPE_CHECKING, TypedDict
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
 
 from pykeepass import Entry, PyKeePass
 
+from autenticapje.formatadores import somente_digitos
+
 if TYPE_CHECKING:
     import uuid as pyuuid
 
@@ -76,8 +83,8 @@ class KeyStore(PyKeePass):
             senha_kbdx (str | None): Senha do arquivo KeePass.
 
         """
-        arquivo_kbdx = env.get("KBDX_PATH")
-        senha_kbdx = env.get("KBDX_PASSWORD")
+        arquivo_kbdx = arquivo_kbdx or env.get("KBDX_PATH")
+        senha_kbdx = senha_kbdx or env.get("KBDX_PASSWORD")
 
         super().__init__(filename=arquivo_kbdx, password=senha_kbdx)
 
@@ -102,3 +109,112 @@ class KeyStore(PyKeePass):
 
         """
         return super().find_entries(recursive, path, group, **kwargs)
+
+
+class _IndiceCarregado(NamedTuple):
+    """Índice OTP de uma versão específica do arquivo KDBX.
+
+    Args:
+        versao (tuple[int, int, str]): mtime, tamanho e hash da senha.
+        otp_por_usuario (dict[str, str]): Mapa usuário -> URI OTP.
+
+    """
+
+    versao: tuple[int, int, str]
+    otp_por_usuario: dict[str, str]
+
+
+class IndiceOTP:
+    """Mantenha um índice somente leitura de URIs OTP por usuário.
+
+    O KDBX é aberto (e o KDF executado) uma única vez por versão do
+    arquivo; quando o mtime ou o tamanho mudam, o índice é refeito
+    na próxima consulta. Consultas simultâneas compartilham o mesmo
+    índice e aguardam uma única recarga.
+    """
+
+    def __init__(self) -> None:
+        """Inicialize o índice vazio."""
+        self._trava = Lock()
+        self._indices: dict[str, _IndiceCarregado] = {}
+
+    def obter(
+        self,
+        username: str | None,
+        arquivo_kbdx: str | None = None,
+        senha_kbdx: str | None = None,
+    ) -> str | None:
+        """Retorne a URI OTP do usuário (ou CPF) informado.
+
+        Args:
+            username (str | None): Usuário como salvo no KeePass; CPF
+                com ou sem pontuação também é aceito.
+            arquivo_kbdx (str | None): Caminho do arquivo KeePass.
+            senha_kbdx (str | None): Senha do arquivo KeePass.
+
+        Returns:
+            str | None: URI OTP ou None se não houver entrada (ou
+                se o usuário não foi informado, ex.: `CPF` ausente).
+
+        """
+        if not username:
+            return None
+
+        arquivo_kbdx = arquivo_kbdx or env.get("KBDX_PATH")
+        senha_kbdx = senha_kbdx or env.get("KBDX_PASSWORD")
+
+        caminho = Path(arquivo_kbdx).resolve()
+        estado = caminho.stat()
+        versao = (
+            estado.st_mtime_ns,
+            estado.st_size,
+            hashlib.sha256(senha_kbdx.encode()).hexdigest(),
+        )
+
+        with self._trava:
+            carregado = self._indices.get(str(caminho))
+            if not carregado or carregado.versao != versao:
+                carregado = _IndiceCarregado(
+                    versao=versao,
+                    otp_por_usuario=_indexar(KeyStore(str(caminho), senha_kbdx)),
+                )
+                self._indices[str(caminho)] = carregado
+
+        otp_por_usuario = carregado.otp_por_usuario
+        if username in otp_por_usuario:
+            return otp_por_usuario[username]
+
+        return otp_por_usuario.get(somente_digitos(username) or username)
+
+    def invalidar(self) -> None:
+        """Descarte os índices carregados."""
+        with self._trava:
+            self._indices.clear()
+
+
+def _indexar(keystore: KeyStore) -> dict[str, str]:
+    """Monte o mapa usuário -> URI OTP das entradas do banco.
+
+    Em usuários repetidos prevalece a última entrada com OTP, como
+    na busca linear original.
+
+    Args:
+        keystore (KeyStore): Banco KeePass aberto.
+
+    Returns:
+        dict[str, str]: URIs OTP por usuário e por CPF sem pontuação.
+
+    """
+    otp_por_usuario: dict[str, str] = {}
+    for entry in keystore.find_entries({}):
+        if not entry.username or not entry.otp:
+            continue
+
+        otp_por_usuario[entry.username] = entry.otp
+        if digitos := somente_digitos(entry.username):
+            otp_por_usuario[digitos] = entry.otp
+
+    return otp_por_usuario
+
+
+indice_otp = IndiceOTP()
@@ -0,0 +1,295 @@
+"""Meça a duração de cada fase do login e exporte as medições.
+
+Cada autenticador registra spans nomeados (abertura do driver,
+página do SSO, assinatura, desafio, OTP, redirecionamento...) em um
+`Medidor`. As durações seguem no ResultadoAutenticacao e podem ser
+gravadas em JSON lines ou no formato texto do Prometheus, com
+histogramas de latência por região.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+    from autenticapje.regioes import ResultadoAutenticacao
+
+BUCKETS_PADRAO = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class FaseLogin(TypedDict):
+    """Span de uma fase do login.
+
+    Args:
+        nome (str): Nome da fase (ex.: "assinatura").
+        inicio (float): Segundos desde a criação do medidor.
+        duracao (float): Duração da fase em segundos.
+
+    """
+
+    nome: str
+    inicio: float
+    duracao: float
+
+
+class Medidor:
+    """Registre a duração das fases de um login."""
+
+    def __init__(self) -> None:
+        """Inicialize o medidor sem fases registradas."""
+        self._inicio = perf_counter()
+        self.fases: list[FaseLogin] = []
+
+    @contextmanager
+    def fase(self, nome: str) -> Iterator[None]:
+        """Meça o bloco como a fase informada.
+
+        A fase é registrada mesmo quando o bloco levanta exceção,
+        mostrando onde o login falhou.
+
+        Args:
+            nome (str): Nome da fase.
+
+        Yields:
+            None: Controle para o bloco medido.
+
+        """
+        inicio = perf_counter()
+        try:
+            yield
+        finally:
+            self.fases.append(
+                FaseLogin(
+                    nome=nome,
+                    inicio=inicio - self._inicio,
+                    duracao=perf_counter() - inicio,
+                ),
+            )
+
+    def duracoes(self) -> dict[str, float]:
+        """Some a duração das fases pelo nome, na ordem de execução.
+
+        Returns:
+            dict[str, float]: Mapa fase -> segundos.
+
+        """
+        duracoes: dict[str, float] = {}
+        for fase in self.fases:
+            duracoes[fase["nome"]] = duracoes.get(fase["nome"], 0.0) + fase["duracao"]
+
+        return duracoes
+
+
+def gravar_jsonl(resultado: ResultadoAutenticacao, arquivo: Path) -> None:
+    """Acrescente a medição da região como uma linha JSON.
+
+    Os arquivos de cookies e o traceback não são gravados, apenas
+    os dados de desempenho.
+
+    Args:
+        resultado (ResultadoAutenticacao): Resultado da região.
+        arquivo (Path): Arquivo JSON lines de destino.
+
+    """
+    linha = {
+        "regiao": resultado["regiao"],
+        "sucesso": resultado["sucesso"],
+        "origem": resultado["origem"],
+        "tempo": resultado["tempo"],
+        "fases": resultado["fases"],
+    }
+    with arquivo.open("a", encoding="utf-8") as saida:
+        saida.write(json.dumps(linha) + "\n")
+
+
+class _Histograma:
+    """Histograma cumulativo no formato do Prometheus."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Inicialize o histograma vazio.
+
+        Args:
+            buckets (tuple[float, ...]): Limites superiores.
+
+        """
+        self.buckets = buckets
+        self.contagens = [0] * len(buckets)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float) -> None:
+        """Registre uma observação.
+
+        Args:
+            valor (float): Duração em segundos.
+
+        """
+        self.soma += valor
+        self.total += 1
+        for posicao, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.contagens[posicao] += 1
+
+
+class ExportadorPrometheus:
+    """Acumule histogramas de latência por região e fase."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_PADRAO) -> None:
+        """Inicialize o exportador sem observações.
+
+        Args:
+            buckets (tuple[float, ...]): Limites dos histogramas, em
+                segundos.
+
+        """
+        self.buckets = buckets
+        self._trava = Lock()
+        self._logins: dict[tuple[str, str], _Histograma] = {}
+        self._fases: dict[tuple[str, str], _Histograma] = {}
+        self._resultados: defaultdict[tuple[str, str], int] = defaultdict(int)
+
+    def registrar(self, resultado: ResultadoAutenticacao) -> None:
+        """Inclua o resultado de uma região nos histogramas.
+
+        Args:
+            resultado (ResultadoAutenticacao): Resultado da região.
+
+        """
+        regiao = resultado["regiao"]
+        situacao = "sucesso" if resultado["sucesso"] else "falha"
+        with self._trava:
+            self._resultados[regiao, situacao] += 1
+            self._histograma(self._logins, (regiao, resultado["origem"])).observar(
+                resultado["tempo"],
+            )
+            for fase, duracao in resultado["fases"].items():
+                self._histograma(self._fases, (regiao, fase)).observar(duracao)
+
+    def texto(self) -> str:
+        """Gere as métricas no formato de exposição do Prometheus.
+
+        Returns:
+            str: Métricas em formato texto.
+
+        """
+        with self._trava:
+            linhas = [
+                "# HELP autenticapje_logins_total Logins por região e situação.",
+                "# TYPE autenticapje_logins_total counter",
+            ]
+            linhas.extend(
+                "autenticapje_logins_total"
+                f"{_rotulos(('regiao', regiao), ('situacao', situacao))} {quantidade}"
+                for (regiao, situacao), quantidade in sorted(self._resultados.items())
+            )
+            linhas += _linhas_histograma(
+                "autenticapje_login_segundos",
+                "Duração total da autenticação por região.",
+                {
+                    (("regiao", regiao), ("origem", origem)): histograma
+                    for (regiao, origem), histograma in self._logins.items()
+                },
+            )
+            linhas += _linhas_histograma(
+                "autenticapje_fase_segundos",
+                "Duração de cada fase do login por região.",
+                {
+                    (("regiao", regiao), ("fase", fase)): histograma
+                    for (regiao, fase), histograma in self._fases.items()
+                },
+            )
+
+        return "\n".join(linhas) + "\n"
+
+    def gravar(self, arquivo: Path) -> None:
+        """Grave as métricas em arquivo (ex.: textfile do node_exporter).
+
+        Args:
+            arquivo (Path): Arquivo de destino.
+
+        """
+        temporario = arquivo.with_name(arquivo.name + ".tmp")
+        temporario.write_text(self.texto(), encoding="utf-8")
+        temporario.replace(arquivo)
+
+    def _histograma(
+        self,
+        histogramas: dict[tuple[str, str], _Histograma],
+        chave: tuple[str, str],
+    ) -> _Histograma:
+        """Obtenha (ou crie) o histograma da chave.
+
+        Args:
+            histogramas (dict[tuple[str, str], _Histograma]): Grupo.
+            chave (tuple[str, str]): Rótulos do histograma.
+
+        Returns:
+            _Histograma: Histograma correspondente.
+
+        """
+        if chave not in histogramas:
+            histogramas[chave] = _Histograma(self.buckets)
+
+        return histogramas[chave]
+
+
+def _linhas_histograma(
+    nome: str,
+    ajuda: str,
+    histogramas: Mapping[tuple[tuple[str, str], ...], _Histograma],
+) -> list[str]:
+    """Formate um grupo de histogramas no formato do Prometheus.
+
+    Args:
+        nome (str): Nome da métrica.
+        ajuda (str): Texto do HELP.
+        histogramas (Mapping[tuple[tuple[str, str], ...], _Histograma]):
+            Histogramas por conjunto de rótulos.
+
+    Returns:
+        list[str]: Linhas da métrica.
+
+    """
+    linhas = [f"# HELP {nome} {ajuda}", f"# TYPE {nome} histogram"]
+    for rotulos in sorted(histogramas):
+        histograma = histogramas[rotulos]
+        for limite, contagem in zip(
+            histograma.buckets,
+            histograma.contagens,
+            strict=True,
+        ):
+            linhas.append(
+                f"{nome}_bucket{_rotulos(*rotulos, ('le', f'{limite:g}'))} {contagem}",
+            )
+
+        linhas.append(
+            f"{nome}_bucket{_rotulos(*rotulos, ('le', '+Inf'))} {histograma.total}",
+        )
+        linhas.append(f"{nome}_sum{_rotulos(*rotulos)} {histograma.soma:.6f}")
+        linhas.append(f"{nome}_count{_rotulos(*rotulos)} {histograma.total}")
+
+    return linhas
+
+
+def _rotulos(*pares: tuple[str, str]) -> str:
+    """Formate os rótulos de uma amostra do Prometheus.
+
+    Args:
+        *pares (tuple[str, str]): Pares nome/valor dos rótulos.
+
+    Returns:
+        str: Rótulos entre chaves, com valores escapados.
+
+    """
+    conteudo = ",".join(
+        f"{nome}={json.dumps(valor, ensure_ascii=False)}" for nome, valor in pares
+    )
+    return "{" + conteudo + "}"
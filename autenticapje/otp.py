@@ -0,0 +1,69 @@
+"""Gere códigos TOTP considerando o tempo restante da janela.
+
+Um código gerado no fim da janela de 30 s pode expirar antes de ser
+submetido, derrubando o login inteiro. Aqui o código só é entregue
+quando ainda resta uma margem mínima de validade.
+"""
+
+from __future__ import annotations
+
+from time import sleep, time
+from typing import Literal, NamedTuple
+
+import pyotp
+
+type EstrategiaOTP = Literal["aguardar", "proxima"]
+
+MARGEM_MINIMA = 5.0
+
+
+class CodigoOTP(NamedTuple):
+    """Código OTP e a validade restante no momento da geração.
+
+    Args:
+        codigo (str): Código a ser submetido.
+        segundos_restantes (float): Segundos até o fim da janela do
+            código.
+
+    """
+
+    codigo: str
+    segundos_restantes: float
+
+
+def gerar_otp(
+    otp_uri: str,
+    margem_minima: float = MARGEM_MINIMA,
+    estrategia: EstrategiaOTP = "aguardar",
+) -> CodigoOTP:
+    """Gere o código OTP garantindo validade mínima para o envio.
+
+    Quando a janela atual está para terminar, "aguardar" segura a
+    geração até a próxima janela começar, e "proxima" entrega de
+    imediato o código da janela seguinte (o servidor precisa
+    aceitar uma janela de tolerância).
+
+    Args:
+        otp_uri (str): URI `otpauth://totp/...` do usuário.
+        margem_minima (float): Validade mínima, em segundos, exigida
+            para o código entregue.
+        estrategia (EstrategiaOTP): Como tratar o fim da janela.
+
+    Returns:
+        CodigoOTP: Código e segundos restantes de validade.
+
+    """
+    totp = pyotp.parse_uri(uri=otp_uri)
+    intervalo = totp.interval
+
+    agora = time()
+    restante = intervalo - (agora % intervalo)
+    if restante >= margem_minima:
+        return CodigoOTP(totp.at(agora), restante)
+
+    if estrategia == "proxima":
+        return CodigoOTP(totp.at(agora + intervalo), restante + intervalo)
+
+    sleep(restante)
+    agora = time()
+    return CodigoOTP(totp.at(agora), intervalo - (agora % intervalo))
@@ -0,0 +1,152 @@
+"""Codifique cadeias de certificados no formato PkiPath.
+
+PkiPath é apenas uma SEQUENCE DER com os certificados em ordem
+inversa à da cadeia (raiz primeiro, certificado final por último),
+exatamente como `CertPath.getEncoded("PkiPath")` do Java gera.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+TAG_SEQUENCE = 0x30
+LIMITE_FORMA_CURTA = 0x80
+
+
+def codificar_pkipath(cadeia_der: Iterable[bytes]) -> bytes:
+    """Codifique a cadeia em PkiPath sem depender da JVM.
+
+    Args:
+        cadeia_der (Iterable[bytes]): Certificados em DER, na ordem
+            da cadeia (certificado final primeiro).
+
+    Returns:
+        bytes: Estrutura PkiPath em DER.
+
+    """
+    conteudo = b"".join(reversed(list(cadeia_der)))
+    return bytes([TAG_SEQUENCE]) + _comprimento_der(len(conteudo)) + conteudo
+
+
+def decodificar_pkipath(pkipath: bytes) -> list[bytes]:
+    """Separe os certificados DER contidos em um PkiPath.
+
+    Args:
+        pkipath (bytes): Estrutura PkiPath em DER.
+
+    Returns:
+        list[bytes]: Certificados na ordem da cadeia (certificado
+            final primeiro).
+
+    Raises:
+        ValueError: Quando os bytes não formam um PkiPath válido.
+
+    """
+    if not pkipath or pkipath[0] != TAG_SEQUENCE:
+        raise ValueError("PkiPath inválido: SEQUENCE esperada")
+
+    tamanho, inicio = _ler_comprimento(pkipath, 1)
+    if inicio + tamanho != len(pkipath):
+        raise ValueError("PkiPath inválido: comprimento inconsistente")
+
+    certificados = []
+    posicao = inicio
+    while posicao < len(pkipath):
+        if pkipath[posicao] != TAG_SEQUENCE:
+            raise ValueError("PkiPath inválido: certificado esperado")
+
+        tamanho, corpo = _ler_comprimento(pkipath, posicao + 1)
+        certificados.append(pkipath[posicao : corpo + tamanho])
+        posicao = corpo + tamanho
+
+    if posicao != len(pkipath):
+        raise ValueError("PkiPath inválido: certificado truncado")
+
+    return certificados[::-1]
+
+
+def codificar_pkipath_java(cadeia_der: Iterable[bytes]) -> bytes:
+    """Codifique a cadeia em PkiPath usando a JVM (referência).
+
+    Requer o extra opcional `java` (JPype). Útil apenas para
+    comparar a saída com `codificar_pkipath`.
+
+    Args:
+        cadeia_der (Iterable[bytes]): Certificados em DER, na ordem
+            da cadeia (certificado final primeiro).
+
+    Returns:
+        bytes: Estrutura PkiPath gerada pelo Java.
+
+    Raises:
+        ImportError: Quando o JPype não está instalado.
+
+    """
+    import jpype  # noqa: PLC0415
+    from jpype import JArray, JByte, JClass  # noqa: PLC0415
+
+    if not jpype.isJVMStarted():
+        jpype.startJVM()
+
+    byte_array_input_stream = JClass("java.io.ByteArrayInputStream")
+    certificate_factory = JClass("java.security.cert.CertificateFactory")
+    array_list = JClass("java.util.ArrayList")
+
+    cf = certificate_factory.getInstance("X.509")
+    java_chain = array_list()
+    for der in cadeia_der:
+        bais = byte_array_input_stream(JArray(JByte)(der))
+        java_chain.add(cf.generateCertificate(bais))
+
+    cert_path = cf.generateCertPath(java_chain)
+    return bytes(cert_path.getEncoded("PkiPath"))
+
+
+def _comprimento_der(tamanho: int) -> bytes:
+    """Codifique o campo de comprimento DER.
+
+    Args:
+        tamanho (int): Quantidade de bytes do conteúdo.
+
+    Returns:
+        bytes: Comprimento na forma curta ou longa.
+
+    """
+    if tamanho < LIMITE_FORMA_CURTA:
+        return bytes([tamanho])
+
+    octetos = tamanho.to_bytes((tamanho.bit_length() + 7) // 8, "big")
+    return bytes([LIMITE_FORMA_CURTA | len(octetos)]) + octetos
+
+
+def _ler_comprimento(dados: bytes, posicao: int) -> tuple[int, int]:
+    """Leia o campo de comprimento DER na posição informada.
+
+    Args:
+        dados (bytes): Estrutura DER.
+        posicao (int): Índice do primeiro byte do comprimento.
+
+    Returns:
+        tuple[int, int]: Comprimento lido e índice do conteúdo.
+
+    Raises:
+        ValueError: Quando o comprimento está truncado.
+
+    """
+    if posicao >= len(dados):
+        raise ValueError("PkiPath inválido: comprimento ausente")
+
+    primeiro = dados[posicao]
+    if primeiro < LIMITE_FORMA_CURTA:
+        return primeiro, posicao + 1
+
+    quantidade = primeiro & 0x7F
+    inicio = posicao + 1
+    if not quantidade or inicio + quantidade > len(dados):
+        raise ValueError("PkiPath inválido: comprimento truncado")
+
+    tamanho = int.from_bytes(dados[inicio : inicio + quantidade], "big")
+    return tamanho, inicio + quantidade
@@ -0,0 +1,288 @@
+"""Autentique várias regiões do PJe de forma concorrente.
+
+Este módulo distribui os logins entre um número configurável de
+navegadores simultâneos e entrega o resultado de cada região
+assim que ela termina.
+"""
+
+from __future__ import annotations
+
+import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import environ
+from pathlib import Path
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+from autenticapje import AutenticadorBase, AutenticadorPJe
+from autenticapje.driver.pool import PoolDrivers
+from autenticapje.sessao import CacheSessoes, SessaoArmazenada
+from autenticapje.sso import AutenticadorHTTP
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+type ModoLogin = Literal["navegador", "http"]
+
+TOTAL_REGIOES = 24
+MODOS_LOGIN: dict[ModoLogin, type[AutenticadorBase]] = {
+    "navegador": AutenticadorPJe,
+    "http": AutenticadorHTTP,
+}
+
+
+class ResultadoAutenticacao(TypedDict):
+    """Resultado da autenticação de uma região.
+
+    Args:
+        regiao (str): Região autenticada (ex.: "1" para TRT1).
+        sucesso (bool): Indica se o login foi concluído.
+        origem (Literal["cache", "login"]): Se os cookies vieram do
+            cache de sessões ou de um novo login.
+        tempo (float): Duração total em segundos.
+        fases (dict[str, float]): Duração de cada fase do login
+            (driver, pagina_sso, assinatura, desafio, otp_keystore,
+            otp_envio, redirecionamento...), em segundos.
+        cookies_requests (str | None): Arquivo com cookies "Py".
+        cookies_navegador (str | None): Arquivo com cookies do
+            navegador.
+        erro (str | None): Traceback da falha, se houver.
+
+    """
+
+    regiao: str
+    sucesso: bool
+    origem: Literal["cache", "login"]
+    tempo: float
+    fases: dict[str, float]
+    cookies_requests: str | None
+    cookies_navegador: str | None
+    erro: str | None
+
+
+def interpretar_regioes(valor: str) -> list[str]:
+    """Converta a expressão de regiões em uma lista ordenada.
+
+    Aceita números isolados, intervalos e a palavra "todas",
+    separados por vírgula (ex.: "1-3,5,24").
+
+    Args:
+        valor (str): Expressão informada pelo usuário.
+
+    Returns:
+        list[str]: Regiões sem repetição, em ordem crescente.
+
+    Raises:
+        ValueError: Quando a expressão contém região inválida.
+
+    """
+    regioes: set[int] = set()
+    for parte in valor.replace(" ", "").split(","):
+        if not parte:
+            continue
+
+        if parte.lower() == "todas":
+            regioes.update(range(1, TOTAL_REGIOES + 1))
+            continue
+
+        inicio, _, fim = parte.partition("-")
+        if not inicio.isdigit() or (fim and not fim.isdigit()):
+            raise ValueError("Região inválida: " + parte)
+
+        primeira, ultima = int(inicio), int(fim or inicio)
+        if not 1 <= primeira <= ultima <= TOTAL_REGIOES:
+            raise ValueError("Região fora do intervalo: " + parte)
+
+        regioes.update(range(primeira, ultima + 1))
+
+    return [str(regiao) for regiao in sorted(regioes)]
+
+
+def salvar_cookies(
+    cookies_requests: dict[str, str],
+    cookies_navegador: list[dict],
+    diretorio: Path | None = None,
+    sufixo: str = "",
+) -> tuple[Path, Path]:
+    """Grave os cookies da sessão em arquivos JSON.
+
+    Args:
+        cookies_requests (dict[str, str]): Cookies "Py".
+        cookies_navegador (list[dict]): Cookies do navegador.
+        diretorio (Path | None): Pasta de destino (padrão: home).
+        sufixo (str): Sufixo adicionado ao nome dos arquivos.
+
+    Returns:
+        tuple[Path, Path]: Arquivos de cookies "Py" e do navegador.
+
+    """
+    diretorio = diretorio or Path.home()
+
+    arquivo_requests = diretorio.joinpath(f"cookies_requests{sufixo}.json")
+    arquivo_requests.write_text(json.dumps(cookies_requests))
+
+    arquivo_navegador = diretorio.joinpath(f"cookies_navegador{sufixo}.json")
+    arquivo_navegador.write_text(json.dumps(cookies_navegador))
+
+    return arquivo_requests, arquivo_navegador
+
+
+def autenticar_regiao(
+    regiao: str,
+    diretorio: Path | None = None,
+    sufixo: str | None = None,
+    cache: CacheSessoes | None = None,
+    modo: ModoLogin = "navegador",
+    pool: PoolDrivers | None = None,
+) -> ResultadoAutenticacao:
+    """Autentique uma região e grave seus cookies em disco.
+
+    Quando há cache, uma sessão ainda válida é reaproveitada sem
+    abrir o navegador. Caso contrário o login é feito e o navegador
+    é sempre encerrado ao final, com ou sem sucesso.
+
+    Args:
+        regiao (str): Região do PJe a autenticar.
+        diretorio (Path | None): Pasta de destino dos cookies.
+        sufixo (str | None): Sufixo dos arquivos; por padrão usa
+            "_trt<regiao>".
+        cache (CacheSessoes | None): Cache de sessões consultado
+            antes do login e atualizado após o sucesso.
+        modo (ModoLogin): "navegador" (Chrome) ou "http" (sem
+            navegador).
+        pool (PoolDrivers | None): Pool de navegadores pré-iniciados
+            usado no modo "navegador".
+
+    Returns:
+        ResultadoAutenticacao: Resultado consolidado da região.
+
+    """
+    inicio = perf_counter()
+    resultado = ResultadoAutenticacao(
+        regiao=regiao,
+        sucesso=False,
+        origem="login",
+        tempo=0.0,
+        fases={},
+        cookies_requests=None,
+        cookies_navegador=None,
+        erro=None,
+    )
+    sufixo = f"_trt{regiao}" if sufixo is None else sufixo
+    cpf = environ.get("CPF", "")
+
+    autenticador = None
+    bot_driver = None
+    try:
+        sessao = None
+        if cache:
+            inicio_cache = perf_counter()
+            sessao = cache.obter(regiao, cpf)
+            resultado["fases"]["cache_sessao"] = perf_counter() - inicio_cache
+
+        if sessao:
+            resultado["origem"] = "cache"
+
+        elif pool and modo == "navegador":
+            inicio_driver = perf_counter()
+            bot_driver = pool.alugar()
+            resultado["fases"]["driver"] = perf_counter() - inicio_driver
+            autenticador = AutenticadorPJe(regiao, bot_driver=bot_driver)
+
+        else:
+            autenticador = MODOS_LOGIN[modo](regiao)
+
+        if autenticador and autenticador.autenticar():
+            sessao = SessaoArmazenada(
+                regiao=regiao,
+                cpf=cpf,
+                emitido_em=time(),
+                cookies_requests=autenticador.get_cookies_for_requests(),
+                cookies_navegador=autenticador.get_cookies_browser(),
+            )
+            if cache:
+                cache.salvar(
+                    regiao,
+                    cpf,
+                    sessao["cookies_requests"],
+                    sessao["cookies_navegador"],
+                )
+
+        if sessao:
+            arquivo_requests, arquivo_navegador = salvar_cookies(
+                sessao["cookies_requests"],
+                sessao["cookies_navegador"],
+                diretorio=diretorio,
+                sufixo=sufixo,
+            )
+            resultado["sucesso"] = True
+            resultado["cookies_requests"] = str(arquivo_requests)
+            resultado["cookies_navegador"] = str(arquivo_navegador)
+
+    except Exception as e:  # noqa: BLE001
+        resultado["erro"] = "\n".join(traceback.format_exception(e))
+
+    finally:
+        if autenticador:
+            resultado["fases"].update(autenticador.medidor.duracoes())
+            autenticador.fechar()
+
+        if bot_driver:
+            pool.devolver(bot_driver)
+
+    resultado["tempo"] = perf_counter() - inicio
+    return resultado
+
+
+def autenticar_regioes(
+    regioes: Iterable[str],
+    max_workers: int = 4,
+    diretorio: Path | None = None,
+    cache: CacheSessoes | None = None,
+    modo: ModoLogin = "navegador",
+    pool: PoolDrivers | None = None,
+) -> Iterator[ResultadoAutenticacao]:
+    """Autentique várias regiões com navegadores simultâneos.
+
+    Os resultados são entregues na ordem em que cada região
+    termina, permitindo acompanhar a varredura em tempo real.
+
+    Args:
+        regioes (Iterable[str]): Regiões a autenticar.
+        max_workers (int): Quantidade máxima de navegadores abertos
+            ao mesmo tempo.
+        diretorio (Path | None): Pasta de destino dos cookies.
+        cache (CacheSessoes | None): Cache de sessões compartilhado
+            pelas regiões.
+        modo (ModoLogin): "navegador" (Chrome) ou "http" (sem
+            navegador).
+        pool (PoolDrivers | None): Pool de navegadores reaproveitados
+            entre as regiões no modo "navegador".
+
+    Yields:
+        ResultadoAutenticacao: Resultado de cada região concluída.
+
+    """
+    regioes = list(regioes)
+    if not regioes:
+        return
+
+    max_workers = max(1, min(max_workers, len(regioes)))
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="autenticapje",
+    ) as executor:
+        futuros = [
+            executor.submit(
+                autenticar_regiao,
+                regiao,
+                diretorio=diretorio,
+                cache=cache,
+                modo=modo,
+                pool=pool,
+            )
+            for regiao in regioes
+        ]
+        for futuro in as_completed(futuros):
+            yield futuro.result()
@@ -0,0 +1,633 @@
+"""Mantenha sessões do PJe vivas e sirva os cookies a outros processos.
+
+O servidor autentica as regiões uma vez, verifica cada sessão em
+intervalos regulares (a própria verificação mantém a sessão ativa no
+PJe) e refaz o login antes da idade máxima ou quando o PJe recusa os
+cookies. Os consumidores leem os cookies atuais por HTTP em
+localhost ou por um socket Unix, sem nunca disparar um login.
+
+Toda requisição precisa do cabeçalho `Authorization: Bearer <token>`,
+com o token gerado na partida e gravado (permissão 0600) em
+`ARQUIVO_TOKEN`. Em HTTP, o `Host` precisa ser `127.0.0.1:<porta>` ou
+`localhost:<porta>`, o que barra páginas abertas no navegador que
+tentem alcançar a API por DNS rebinding.
+
+Rotas:
+    GET /sessoes: situação de cada região.
+    GET /cookies/<regiao>: cookies "Py" (nome -> valor).
+    GET /cookies/<regiao>/navegador: cookies do navegador.
+    POST /renovar/<regiao>: força um novo login da região.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import re
+import secrets
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import environ
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import time
+from typing import TYPE_CHECKING, Self, TypedDict
+from urllib.parse import urlparse
+
+from autenticapje.driver.pool import PoolDrivers
+from autenticapje.regioes import ModoLogin, autenticar_regiao
+from autenticapje.sessao import CacheSessoes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from socketserver import BaseServer
+
+    from autenticapje.sessao import SessaoArmazenada
+
+PORTA_PADRAO = 8765
+ARQUIVO_TOKEN = Path.home().joinpath(".autenticapje", "servidor.token")
+# Sessões do Keycloak do PJe expiram por inatividade em ~30 minutos
+IDADE_RENOVACAO = 25 * 60
+INTERVALO_VERIFICACAO = 60.0
+ESPERA_RENOVACAO = 5
+
+
+class SituacaoSessao(TypedDict):
+    """Situação de uma região mantida pelo servidor.
+
+    Args:
+        regiao (str): Região mantida.
+        disponivel (bool): Se há cookies prontos para entrega.
+        emitido_em (float | None): Horário do login (epoch).
+        idade (float | None): Segundos desde o login.
+        renovando (bool): Se há um login em andamento.
+        erro (str | None): Falha do último login, se houver.
+
+    """
+
+    regiao: str
+    disponivel: bool
+    emitido_em: float | None
+    idade: float | None
+    renovando: bool
+    erro: str | None
+
+
+class ServidorSessoes:
+    """Autentique, verifique e renove sessões de várias regiões.
+
+    Os logins rodam em segundo plano (no máximo `workers` ao mesmo
+    tempo) e nunca bloqueiam a entrega de cookies: enquanto uma
+    sessão é renovada por idade, os cookies anteriores continuam
+    disponíveis.
+    """
+
+    def __init__(
+        self,
+        regioes: Iterable[str],
+        modo: ModoLogin = "navegador",
+        workers: int = 1,
+        cache: CacheSessoes | None = None,
+        idade_renovacao: float = IDADE_RENOVACAO,
+        intervalo_verificacao: float = INTERVALO_VERIFICACAO,
+        diretorio: Path | None = None,
+        arquivo_token: Path = ARQUIVO_TOKEN,
+    ) -> None:
+        """Inicialize o servidor sem começar os logins.
+
+        Args:
+            regioes (Iterable[str]): Regiões mantidas.
+            modo (ModoLogin): "navegador" (Chrome) ou "http".
+            workers (int): Logins simultâneos.
+            cache (CacheSessoes | None): Cache de sessões salvas,
+                reaproveitadas na partida se ainda válidas.
+            idade_renovacao (float): Idade, em segundos, a partir da
+                qual a sessão é renovada preventivamente.
+            intervalo_verificacao (float): Segundos entre as
+                verificações de cada sessão.
+            diretorio (Path | None): Pasta onde os arquivos de cookies
+                de cada região continuam sendo gravados.
+            arquivo_token (Path): Onde gravar o token exigido pela API.
+
+        """
+        self.regioes = list(dict.fromkeys(regioes))
+        self.modo = modo
+        self.cache = cache or CacheSessoes()
+        self.idade_renovacao = idade_renovacao
+        self.intervalo_verificacao = intervalo_verificacao
+        self.diretorio = diretorio
+        self.arquivo_token = arquivo_token
+        self.token = secrets.token_urlsafe(32)
+
+        self._trava = Lock()
+        self._sessoes: dict[str, SessaoArmazenada] = {}
+        self._renovando: set[str] = set()
+        self._erros: dict[str, str] = {}
+        self._parar = Event()
+        self._thread: Thread | None = None
+        self._servidores: list[BaseServer] = []
+
+        workers = max(1, workers)
+        self._pool = PoolDrivers(tamanho=workers) if modo == "navegador" else None
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="autenticapje-servidor",
+        )
+
+    def iniciar(self) -> Self:
+        """Dispare os logins iniciais e a verificação periódica.
+
+        Returns:
+            Self: O próprio servidor.
+
+        """
+        for regiao in self.regioes:
+            self.solicitar_renovacao(regiao, forcar=False)
+
+        self._thread = Thread(
+            target=self._manter,
+            name="autenticapje-manutencao",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def encerrar(self) -> None:
+        """Pare a verificação, os servidores e os navegadores."""
+        self._parar.set()
+        for servidor in self._servidores:
+            servidor.shutdown()
+            servidor.server_close()
+
+        if self._servidores:
+            self.arquivo_token.unlink(missing_ok=True)
+
+        if self._thread:
+            self._thread.join()
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._pool:
+            self._pool.encerrar()
+
+    def __enter__(self) -> Self:
+        """Inicie o servidor ao entrar no bloco `with`.
+
+        Returns:
+            Self: O próprio servidor.
+
+        """
+        return self.iniciar()
+
+    def __exit__(self, *args: object) -> None:
+        """Encerre o servidor ao sair do bloco `with`.
+
+        Args:
+            *args (object): Informações da exceção, se houver.
+
+        """
+        self.encerrar()
+
+    def obter(self, regiao: str) -> SessaoArmazenada | None:
+        """Retorne a sessão atual da região, sem acessar a rede.
+
+        Args:
+            regiao (str): Região desejada.
+
+        Returns:
+            SessaoArmazenada | None: Sessão pronta ou None.
+
+        """
+        with self._trava:
+            return self._sessoes.get(regiao)
+
+    def situacao(self) -> list[SituacaoSessao]:
+        """Resuma a situação de todas as regiões mantidas.
+
+        Returns:
+            list[SituacaoSessao]: Uma entrada por região.
+
+        """
+        agora = time()
+        with self._trava:
+            return [
+                SituacaoSessao(
+                    regiao=regiao,
+                    disponivel=regiao in self._sessoes,
+                    emitido_em=(
+                        self._sessoes[regiao]["emitido_em"]
+                        if regiao in self._sessoes
+                        else None
+                    ),
+                    idade=(
+                        agora - self._sessoes[regiao]["emitido_em"]
+                        if regiao in self._sessoes
+                        else None
+                    ),
+                    renovando=regiao in self._renovando,
+                    erro=self._erros.get(regiao),
+                )
+                for regiao in self.regioes
+            ]
+
+    def solicitar_renovacao(self, regiao: str, *, forcar: bool = True) -> bool:
+        """Agende o login da região, se ainda não houver um em andamento.
+
+        Args:
+            regiao (str): Região a renovar.
+            forcar (bool): Ignore a sessão salva e faça novo login.
+
+        Returns:
+            bool: False se a região não é mantida pelo servidor.
+
+        """
+        if regiao not in self.regioes:
+            return False
+
+        with self._trava:
+            if regiao in self._renovando or self._parar.is_set():
+                return True
+
+            self._renovando.add(regiao)
+
+        self._executor.submit(self._renovar, regiao, forcar)
+        return True
+
+    def servir_http(self, host: str = "127.0.0.1", porta: int = PORTA_PADRAO) -> str:
+        """Atenda a API em HTTP, em uma thread de segundo plano.
+
+        Args:
+            host (str): Endereço de escuta (mantenha em localhost: a
+                API entrega credenciais).
+            porta (int): Porta de escuta (0 escolhe uma livre).
+
+        Returns:
+            str: URL base da API.
+
+        """
+        servidor = _ServidorHTTP((host, porta), _TratadorSessoes)
+        self._atender(servidor)
+        host, porta = servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def servir_unix(self, caminho: Path) -> Path:
+        """Atenda a API por um socket Unix, restrito ao usuário atual.
+
+        Args:
+            caminho (Path): Arquivo do socket (recriado se existir).
+
+        Returns:
+            Path: Arquivo do socket.
+
+        """
+        from socketserver import ThreadingUnixStreamServer  # noqa: PLC0415
+
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.unlink(missing_ok=True)
+
+        # O socket já nasce 0600: um chmod após o bind deixaria uma janela
+        umask_anterior = os.umask(0o177)
+        try:
+            servidor = ThreadingUnixStreamServer(str(caminho), _TratadorSessoes)
+        finally:
+            os.umask(umask_anterior)
+
+        servidor.daemon_threads = True
+        self._atender(servidor)
+        return caminho
+
+    def aguardar(self) -> None:
+        """Bloqueie a thread atual até o servidor ser encerrado."""
+        self._parar.wait()
+
+    def _atender(self, servidor: BaseServer) -> None:
+        """Comece a atender as requisições em segundo plano.
+
+        Args:
+            servidor (BaseServer): Servidor HTTP ou Unix.
+
+        """
+        if not self._servidores:
+            self._gravar_token()
+
+        servidor.sessoes = self
+        self._servidores.append(servidor)
+        Thread(
+            target=servidor.serve_forever,
+            name="autenticapje-api",
+            daemon=True,
+        ).start()
+
+    def _gravar_token(self) -> None:
+        """Grave o token da API em um arquivo legível só pelo usuário."""
+        self.arquivo_token.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.arquivo_token.unlink(missing_ok=True)
+        descritor = os.open(
+            self.arquivo_token,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            0o600,
+        )
+        with os.fdopen(descritor, "w") as arquivo:
+            arquivo.write(self.token)
+
+    def _manter(self) -> None:
+        """Verifique as sessões periodicamente até o encerramento."""
+        while not self._parar.wait(self.intervalo_verificacao):
+            for regiao in self.regioes:
+                if self._parar.is_set():
+                    return
+
+                self._verificar(regiao)
+
+    def _verificar(self, regiao: str) -> None:
+        """Mantenha a sessão ativa ou agende sua renovação.
+
+        Args:
+            regiao (str): Região a verificar.
+
+        """
+        sessao = self.obter(regiao)
+        if sessao is None:
+            # Login anterior falhou: tenta de novo a cada verificação
+            self.solicitar_renovacao(regiao, forcar=False)
+            return
+
+        if time() - sessao["emitido_em"] >= self.idade_renovacao:
+            self.solicitar_renovacao(regiao)
+            return
+
+        if not self.cache.verificar(sessao):
+            with self._trava:
+                self._sessoes.pop(regiao, None)
+
+            self.solicitar_renovacao(regiao)
+
+    def _renovar(self, regiao: str, forcar: bool) -> None:
+        """Autentique a região e publique a nova sessão.
+
+        Args:
+            regiao (str): Região a autenticar.
+            forcar (bool): Descarte a sessão salva antes do login.
+
+        """
+        cpf = environ.get("CPF", "")
+        try:
+            if forcar:
+                self.cache.invalidar(regiao, cpf)
+
+            resultado = autenticar_regiao(
+                regiao,
+                diretorio=self.diretorio,
+                cache=self.cache,
+                modo=self.modo,
+                pool=self._pool,
+            )
+            sessao = self.cache.carregar(regiao, cpf) if resultado["sucesso"] else None
+
+            with self._trava:
+                if sessao:
+                    self._sessoes[regiao] = sessao
+                    self._erros.pop(regiao, None)
+                else:
+                    self._erros[regiao] = resultado["erro"] or "Login não confirmado"
+
+        finally:
+            with self._trava:
+                self._renovando.discard(regiao)
+
+
+class _ServidorHTTP(ThreadingHTTPServer):
+    """ThreadingHTTPServer com referência ao servidor de sessões."""
+
+    daemon_threads = True
+    request_queue_size = 128
+    sessoes: ServidorSessoes
+
+
+class _TratadorSessoes(BaseHTTPRequestHandler):
+    """Atenda as rotas da API de sessões."""
+
+    server: _ServidorHTTP
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Despache as requisições GET."""
+        self._despachar(
+            {
+                r"/sessoes": self._situacao,
+                r"/cookies/(\d+)": self._cookies,
+                r"/cookies/(\d+)/(navegador)": self._cookies,
+            },
+        )
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Despache as requisições POST."""
+        self._despachar({r"/renovar/(\d+)": self._renovar})
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silencie o log de acesso padrão."""
+
+    def _despachar(self, rotas: dict[str, Callable[..., None]]) -> None:
+        """Encaminhe a requisição para a rota correspondente.
+
+        Args:
+            rotas (dict[str, Callable[..., None]]): Padrão -> método.
+
+        """
+        if not self._host_permitido():
+            self._responder(HTTPStatus.FORBIDDEN, {"erro": "Host não permitido"})
+            return
+
+        if not self._token_valido():
+            self._responder(
+                HTTPStatus.UNAUTHORIZED,
+                {"erro": "Token ausente ou inválido"},
+                cabecalhos={"WWW-Authenticate": "Bearer"},
+            )
+            return
+
+        caminho = urlparse(self.path).path.rstrip("/")
+        for padrao, rota in rotas.items():
+            if correspondencia := re.fullmatch(padrao, caminho):
+                rota(*correspondencia.groups())
+                return
+
+        self._responder(HTTPStatus.NOT_FOUND, {"erro": "Rota não encontrada"})
+
+    def _host_permitido(self) -> bool:
+        """Confira se o `Host` aponta para a própria porta em localhost.
+
+        Returns:
+            bool: True no socket Unix ou com um `Host` de loopback.
+
+        """
+        endereco = self.server.server_address
+        if not isinstance(endereco, tuple):
+            return True
+
+        porta = endereco[1]
+        return self.headers.get("Host", "") in {
+            f"127.0.0.1:{porta}",
+            f"localhost:{porta}",
+        }
+
+    def _token_valido(self) -> bool:
+        """Confira o token `Bearer` da requisição.
+
+        Returns:
+            bool: True se o token for o gerado na partida.
+
+        """
+        esquema, _, token = self.headers.get("Authorization", "").partition(" ")
+        return esquema.lower() == "bearer" and hmac.compare_digest(
+            token.strip().encode(),
+            self.server.sessoes.token.encode(),
+        )
+
+    def _situacao(self) -> None:
+        """Responda com a situação de cada região."""
+        self._responder(HTTPStatus.OK, self.server.sessoes.situacao())
+
+    def _cookies(self, regiao: str, formato: str = "requests") -> None:
+        """Entregue os cookies atuais da região.
+
+        Args:
+            regiao (str): Região da URL.
+            formato (str): "requests" ou "navegador".
+
+        """
+        sessoes = self.server.sessoes
+        if regiao not in sessoes.regioes:
+            self._responder(
+                HTTPStatus.NOT_FOUND,
+                {"erro": f"TRT{regiao} não é mantido por este servidor"},
+            )
+            return
+
+        sessao = sessoes.obter(regiao)
+        if sessao is None:
+            self._responder(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"erro": f"Sessão do TRT{regiao} ainda não disponível"},
+                cabecalhos={"Retry-After": str(ESPERA_RENOVACAO)},
+            )
+            return
+
+        self._responder(
+            HTTPStatus.OK,
+            sessao[f"cookies_{formato}"],
+            cabecalhos={"X-Emitido-Em": f"{sessao['emitido_em']:.0f}"},
+        )
+
+    def _renovar(self, regiao: str) -> None:
+        """Agende um novo login da região.
+
+        Args:
+            regiao (str): Região da URL.
+
+        """
+        if not self.server.sessoes.solicitar_renovacao(regiao):
+            self._responder(
+                HTTPStatus.NOT_FOUND,
+                {"erro": f"TRT{regiao} não é mantido por este servidor"},
+            )
+            return
+
+        self._responder(HTTPStatus.ACCEPTED, {"regiao": regiao})
+
+    def _responder(
+        self,
+        status: HTTPStatus,
+        corpo: object,
+        cabecalhos: dict[str, str] | None = None,
+    ) -> None:
+        """Envie a resposta em JSON.
+
+        Args:
+            status (HTTPStatus): Código HTTP.
+            corpo (object): Conteúdo serializável em JSON.
+            cabecalhos (dict[str, str] | None): Cabeçalhos extras.
+
+        """
+        dados = json.dumps(corpo).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(dados)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+
+        self.end_headers()
+        self.wfile.write(dados)
+
+
+class _ConexaoUnix(HTTPConnection):
+    """HTTPConnection que conecta a um socket Unix."""
+
+    def __init__(self, caminho: Path, timeout: float) -> None:
+        """Inicialize a conexão com o arquivo do socket.
+
+        Args:
+            caminho (Path): Arquivo do socket.
+            timeout (float): Tempo máximo da requisição.
+
+        """
+        super().__init__("localhost", timeout=timeout)
+        self.caminho = caminho
+
+    def connect(self) -> None:
+        """Conecte ao socket Unix em vez de TCP."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self.caminho))
+
+
+def obter_cookies(
+    regiao: str,
+    porta: int = PORTA_PADRAO,
+    caminho_socket: Path | None = None,
+    timeout: float = 5,
+    arquivo_token: Path = ARQUIVO_TOKEN,
+) -> dict[str, str] | None:
+    """Leia os cookies "Py" atuais de um servidor de sessões.
+
+    Args:
+        regiao (str): Região desejada.
+        porta (int): Porta do servidor em localhost.
+        caminho_socket (Path | None): Socket Unix, se usado no lugar
+            da porta.
+        timeout (float): Tempo máximo da requisição.
+        arquivo_token (Path): Arquivo com o token gravado pelo servidor.
+
+    Returns:
+        dict[str, str] | None: Cookies da região, ou None se a sessão
+            ainda não estiver disponível.
+
+    Raises:
+        OSError: Se o servidor não estiver no ar (sem token ou sem
+            conexão).
+
+    """
+    token = arquivo_token.read_text().strip()
+    conexao = (
+        _ConexaoUnix(caminho_socket, timeout)
+        if caminho_socket
+        else HTTPConnection("127.0.0.1", porta, timeout=timeout)
+    )
+    try:
+        conexao.request(
+            "GET",
+            f"/cookies/{regiao}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        resposta = conexao.getresponse()
+        corpo = resposta.read()
+    finally:
+        conexao.close()
+
+    if resposta.status != HTTPStatus.OK:
+        return None
+
+    return json.loads(corpo)
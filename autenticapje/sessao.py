@@ -0,0 +1,231 @@
+"""Armazene sessões autenticadas do PJe entre execuções.
+
+As sessões são guardadas por região e CPF, junto com o horário de
+emissão, e validadas com uma requisição leve antes de serem
+reaproveitadas, evitando abrir o navegador quando os cookies
+ainda são aceitos pelo PJe.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from time import time
+from typing import TypedDict
+
+import requests
+
+from .elements import pje as el
+from .formatadores import somente_digitos
+
+HTTP_OK_STATUS = 200
+DIRETORIO_PADRAO = Path.home().joinpath(".autenticapje", "sessoes")
+
+
+class SessaoArmazenada(TypedDict):
+    """Sessão autenticada persistida em disco.
+
+    Args:
+        regiao (str): Região da sessão.
+        cpf (str): CPF (somente dígitos) do usuário autenticado.
+        emitido_em (float): Horário do login (epoch, segundos).
+        cookies_requests (dict[str, str]): Cookies "Py".
+        cookies_navegador (list[dict]): Cookies do navegador.
+
+    """
+
+    regiao: str
+    cpf: str
+    emitido_em: float
+    cookies_requests: dict[str, str]
+    cookies_navegador: list[dict]
+
+
+class CacheSessoes:
+    """Gerencie o cache de sessões por região e CPF.
+
+    Cada sessão fica em um arquivo JSON próprio, gravado de forma
+    atômica e com permissão restrita ao usuário.
+    """
+
+    def __init__(
+        self,
+        diretorio: Path | None = None,
+        timeout_verificacao: float = 5,
+    ) -> None:
+        """Inicialize o cache no diretório informado.
+
+        Args:
+            diretorio (Path | None): Pasta das sessões (padrão:
+                ~/.autenticapje/sessoes).
+            timeout_verificacao (float): Tempo máximo, em segundos,
+                da requisição de verificação.
+
+        """
+        self.diretorio = diretorio or DIRETORIO_PADRAO
+        self.timeout_verificacao = timeout_verificacao
+
+    def salvar(
+        self,
+        regiao: str,
+        cpf: str,
+        cookies_requests: dict[str, str],
+        cookies_navegador: list[dict],
+    ) -> SessaoArmazenada:
+        """Grave a sessão recém-autenticada no cache.
+
+        Args:
+            regiao (str): Região autenticada.
+            cpf (str): CPF do usuário.
+            cookies_requests (dict[str, str]): Cookies "Py".
+            cookies_navegador (list[dict]): Cookies do navegador.
+
+        Returns:
+            SessaoArmazenada: Sessão gravada.
+
+        """
+        sessao = SessaoArmazenada(
+            regiao=regiao,
+            cpf=somente_digitos(cpf),
+            emitido_em=time(),
+            cookies_requests=cookies_requests,
+            cookies_navegador=cookies_navegador,
+        )
+
+        arquivo = self._arquivo(regiao, cpf)
+        arquivo.parent.mkdir(parents=True, exist_ok=True)
+
+        # Grava em arquivo temporário próprio (criado com 0600) e troca
+        # para evitar leitura parcial e disputa entre gravações simultâneas
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=arquivo.parent,
+            prefix=arquivo.stem + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as temporario:
+            temporario.write(json.dumps(sessao))
+
+        try:
+            Path(temporario.name).replace(arquivo)
+        except OSError:
+            Path(temporario.name).unlink(missing_ok=True)
+            raise
+
+        return sessao
+
+    def carregar(self, regiao: str, cpf: str) -> SessaoArmazenada | None:
+        """Leia a sessão do cache sem verificar a validade.
+
+        Args:
+            regiao (str): Região desejada.
+            cpf (str): CPF do usuário.
+
+        Returns:
+            SessaoArmazenada | None: Sessão gravada ou None.
+
+        """
+        arquivo = self._arquivo(regiao, cpf)
+        with suppress(OSError, ValueError):
+            return json.loads(arquivo.read_text())
+
+        return None
+
+    def obter(
+        self,
+        regiao: str,
+        cpf: str,
+        idade_maxima: float | None = None,
+    ) -> SessaoArmazenada | None:
+        """Retorne a sessão do cache se ainda for aceita pelo PJe.
+
+        Sessões expiradas ou recusadas pelo PJe são removidas do
+        cache. Se o PJe não puder ser consultado (falha de rede), a
+        sessão não é usada, mas continua no cache.
+
+        Args:
+            regiao (str): Região desejada.
+            cpf (str): CPF do usuário.
+            idade_maxima (float | None): Idade máxima, em segundos,
+                para reaproveitar a sessão sem novo login.
+
+        Returns:
+            SessaoArmazenada | None: Sessão válida ou None.
+
+        """
+        sessao = self.carregar(regiao, cpf)
+        if not sessao:
+            return None
+
+        expirada = idade_maxima is not None and (
+            time() - sessao["emitido_em"] > idade_maxima
+        )
+        status = None if expirada else self._consultar(sessao)
+        if expirada or (status is not None and status != HTTP_OK_STATUS):
+            self.invalidar(regiao, cpf)
+            return None
+
+        return sessao if status == HTTP_OK_STATUS else None
+
+    def verificar(self, sessao: SessaoArmazenada) -> bool:
+        """Verifique a sessão com uma requisição leve ao PJe.
+
+        Args:
+            sessao (SessaoArmazenada): Sessão a verificar.
+
+        Returns:
+            bool: True se o PJe aceitar os cookies da sessão.
+
+        """
+        return self._consultar(sessao) == HTTP_OK_STATUS
+
+    def _consultar(self, sessao: SessaoArmazenada) -> int | None:
+        """Consulte o PJe com os cookies da sessão.
+
+        Args:
+            sessao (SessaoArmazenada): Sessão a verificar.
+
+        Returns:
+            int | None: Status HTTP da resposta, ou None se o PJe não
+                respondeu (DNS, conexão recusada, timeout).
+
+        """
+        url = el.LINK_VERIFICA_SESSAO.format(trt_id=sessao["regiao"])
+        try:
+            resp = requests.get(
+                url,
+                cookies=sessao["cookies_requests"],
+                allow_redirects=False,
+                timeout=self.timeout_verificacao,
+            )
+        except requests.RequestException:
+            return None
+
+        return resp.status_code
+
+    def invalidar(self, regiao: str, cpf: str) -> None:
+        """Remova a sessão do cache.
+
+        Args:
+            regiao (str): Região da sessão.
+            cpf (str): CPF do usuário.
+
+        """
+        self._arquivo(regiao, cpf).unlink(missing_ok=True)
+
+    def _arquivo(self, regiao: str, cpf: str) -> Path:
+        """Monte o caminho do arquivo da sessão.
+
+        Args:
+            regiao (str): Região da sessão.
+            cpf (str): CPF do usuário.
+
+        Returns:
+            Path: Arquivo JSON da sessão.
+
+        """
+        return self.diretorio.joinpath(
+            f"trt{regiao}_{somente_digitos(cpf)}.json",
+        )
@@ -0,0 +1,807 @@
+"""Simule localmente o PJe e o Keycloak do SSO para testes de carga.
+
+O servidor reproduz o caminho percorrido pelo login: o
+`authenticateSSO.seam` de cada região, a página `kc-form-login` com
+os campos `phrase` e `pjeoffice-code`, o endpoint `pjeoffice-rest`
+(que confere a assinatura e a cadeia PkiPath), a página do OTP, o
+retorno ao PJe e o painel `pjekz`.
+
+Todas as regiões ficam no mesmo host, sob `/trt<regiao>`, e o SSO
+sob `/sso/`. Use `apontar_urls` (ou as variáveis de ambiente de
+`elements/pje.py`) para que os autenticadores usem o simulador.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import importlib
+import json
+import re
+import secrets
+from contextlib import suppress
+from html import escape
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import pairwise
+from os import environ
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Self
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import pyotp
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.x509 import load_der_x509_certificate
+
+from autenticapje.assinador import Assinador
+from autenticapje.elements import pje as el
+from autenticapje.pkipath import decodificar_pkipath
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+COOKIE_SESSAO_SSO = "AUTH_SESSION_ID"
+COOKIE_SESSAO_PJE = "PJE_SESSAO"
+CAMINHO_REALM = "/sso/auth/realms/pje"
+CAMINHO_INTEGRA = (
+    r"/trt(\d+)/pje-comum-api/api/processos/id/(\d+)/documentos/agrupados"
+)
+TAMANHO_INTEGRA = 3 * 1024 * 1024
+
+PAGINA_LOGIN = """<!DOCTYPE html>
+<html><head><title>PJe - Acesso</title></head><body>
+{erro}
+<form id="kc-form-login" action="{action}" method="post">
+<input type="hidden" id="phrase" name="phrase" value="">
+<input type="hidden" id="pjeoffice-code" name="pjeoffice-code" value="">
+<input type="text" id="username" name="username" value="">
+<input type="password" id="password" name="password" value="">
+<input type="submit" id="kc-login" name="login" value="Entrar">
+</form>
+</body></html>
+"""
+
+PAGINA_OTP = """<!DOCTYPE html>
+<html><head><title>PJe - Código de verificação</title></head><body>
+{erro}
+<form id="kc-otp-login-form" action="{action}" method="post">
+<input type="text" id="otp" name="otp" value="" autocomplete="off">
+<input type="submit" id="kc-login" name="login" value="Entrar">
+</form>
+</body></html>
+"""
+
+PAGINA_PAINEL = """<!DOCTYPE html>
+<html><head><title>PJe - Painel</title></head><body>
+<h1>Painel do usuário externo - TRT{regiao}</h1>
+</body></html>
+"""
+
+ERRO_FORMULARIO = (
+    '<div class="alert-error"><span id="input-error" '
+    'class="kc-feedback-text">{mensagem}</span></div>'
+)
+
+
+class ServidorSimulado:
+    """Servidor HTTP local que emula o PJe e o Keycloak do SSO.
+
+    O estado (desafios validados, logins em andamento e sessões do
+    PJe) fica em memória e é compartilhado entre as threads que
+    atendem as requisições.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        porta: int = 0,
+        otp_uri: str | None = None,
+        latencia: float = 0.0,
+    ) -> None:
+        """Inicialize o servidor sem começar a atender.
+
+        Args:
+            host (str): Endereço de escuta.
+            porta (int): Porta de escuta (0 escolhe uma livre).
+            otp_uri (str | None): URI OTP aceita; None aceita qualquer
+                código de 6 dígitos.
+            latencia (float): Atraso, em segundos, aplicado a cada
+                resposta para emular a rede.
+
+        """
+        self.otp = pyotp.parse_uri(otp_uri) if otp_uri else None
+        self.latencia = latencia
+
+        self._trava = Lock()
+        self._desafios: dict[str, str] = {}
+        self._logins: dict[str, dict[str, str]] = {}
+        self._codigos: dict[str, str] = {}
+        self._sessoes_pje: dict[str, str] = {}
+        self._limitadas = 0
+        self._retry_after = "1"
+        self.chamadas_api: list[tuple[float, int]] = []
+
+        self._servidor = _ServidorHTTP((host, porta), _TratadorSimulado)
+        self._servidor.simulador = self
+        self._thread: Thread | None = None
+
+    @property
+    def url_base(self) -> str:
+        """Endereço raiz do simulador (ex.: http://127.0.0.1:8080)."""
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    @property
+    def url_pje(self) -> str:
+        """Base do PJe com o marcador `{trt_id}`."""
+        return self.url_base + "/trt{trt_id}"
+
+    @property
+    def url_sso(self) -> str:
+        """Base do SSO, terminada em barra."""
+        return self.url_base + "/sso/"
+
+    def iniciar(self) -> Self:
+        """Comece a atender em uma thread de segundo plano.
+
+        Returns:
+            Self: O próprio servidor.
+
+        """
+        self._thread = Thread(
+            target=self._servidor.serve_forever,
+            name="autenticapje-simulador",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def servir(self) -> None:
+        """Atenda na thread atual até ser interrompido."""
+        self._servidor.serve_forever()
+
+    def encerrar(self) -> None:
+        """Pare o servidor e libere a porta."""
+        if self._thread:
+            self._servidor.shutdown()
+            self._thread.join()
+
+        self._servidor.server_close()
+
+    def __enter__(self) -> Self:
+        """Inicie o servidor ao entrar no bloco `with`.
+
+        Returns:
+            Self: O próprio servidor.
+
+        """
+        return self.iniciar()
+
+    def __exit__(self, *args: object) -> None:
+        """Encerre o servidor ao sair do bloco `with`.
+
+        Args:
+            *args (object): Informações da exceção, se houver.
+
+        """
+        self.encerrar()
+
+    def registrar_desafio(self, dados: dict[str, str]) -> bool:
+        """Confira a assinatura do desafio e registre-o se válida.
+
+        Args:
+            dados (dict[str, str]): Corpo enviado ao `pjeoffice-rest`.
+
+        Returns:
+            bool: True se a cadeia e a assinatura conferem.
+
+        """
+        try:
+            cadeia = [
+                load_der_x509_certificate(der)
+                for der in decodificar_pkipath(base64.b64decode(dados["certChain"]))
+            ]
+            for certificado, emissor in pairwise(cadeia):
+                certificado.verify_directly_issued_by(emissor)
+
+            assinatura = base64.b64decode(dados["assinatura"])
+            mensagem = dados["mensagem"].encode()
+        except (KeyError, TypeError, ValueError, InvalidSignature):
+            return False
+
+        if not cadeia:
+            return False
+
+        chave_publica = cadeia[0].public_key()
+        for algoritmo in Assinador.algoritmos_suportados.values():
+            with suppress(InvalidSignature):
+                chave_publica.verify(
+                    assinatura,
+                    mensagem,
+                    padding.PKCS1v15(),
+                    algoritmo,
+                )
+                with self._trava:
+                    self._desafios[dados["uuid"]] = dados["mensagem"]
+
+                return True
+
+        return False
+
+    def confirmar_certificado(self, sessao: str, campos: dict[str, str]) -> bool:
+        """Avance o login se o desafio informado foi validado.
+
+        Args:
+            sessao (str): Identificador do login no SSO.
+            campos (dict[str, str]): Campos do `kc-form-login`.
+
+        Returns:
+            bool: True se o login pode seguir para o OTP.
+
+        """
+        with self._trava:
+            login = self._logins.get(sessao)
+            mensagem = self._desafios.pop(campos.get(el.ID_CODIGO_PJE, ""), None)
+            if not login or mensagem is None:
+                return False
+
+            if mensagem != campos.get(el.ID_INPUT_DESAFIO):
+                return False
+
+            login["etapa"] = "otp"
+            return True
+
+    def confirmar_otp(self, sessao: str, codigo: str) -> str | None:
+        """Valide o OTP e emita o código de retorno ao PJe.
+
+        Args:
+            sessao (str): Identificador do login no SSO.
+            codigo (str): Código OTP informado.
+
+        Returns:
+            str | None: URL de retorno ao PJe ou None se inválido.
+
+        """
+        valido = (
+            self.otp.verify(codigo, valid_window=1)
+            if self.otp
+            else bool(re.fullmatch(r"\d{6}", codigo))
+        )
+        with self._trava:
+            login = self._logins.get(sessao)
+            if not valido or not login or login["etapa"] != "otp":
+                return None
+
+            del self._logins[sessao]
+            codigo_retorno = secrets.token_urlsafe(16)
+            self._codigos[codigo_retorno] = login["regiao"]
+
+        return (
+            f"{self.url_base}/trt{login['regiao']}/primeirograu/callback?"
+            + urlencode({"code": codigo_retorno})
+        )
+
+    def iniciar_login(self, regiao: str) -> str:
+        """Abra um login no SSO para a região.
+
+        Args:
+            regiao (str): Região que solicitou o login.
+
+        Returns:
+            str: Identificador do login.
+
+        """
+        sessao = secrets.token_urlsafe(16)
+        with self._trava:
+            self._logins[sessao] = {"regiao": regiao, "etapa": "certificado"}
+
+        return sessao
+
+    def criar_sessao_pje(self, codigo: str, regiao: str) -> str | None:
+        """Troque o código de retorno por uma sessão do PJe.
+
+        Args:
+            codigo (str): Código emitido após o OTP.
+            regiao (str): Região que recebeu o retorno.
+
+        Returns:
+            str | None: Token da sessão ou None se o código é inválido.
+
+        """
+        with self._trava:
+            if self._codigos.pop(codigo, None) != regiao:
+                return None
+
+            token = secrets.token_urlsafe(24)
+            self._sessoes_pje[token] = regiao
+            return token
+
+    def limitar_api(self, respostas: int, retry_after: float = 1) -> None:
+        """Responda 429 às próximas chamadas de API, como um PJe saturado.
+
+        Args:
+            respostas (int): Quantas chamadas recebem 429.
+            retry_after (float): Valor do `Retry-After`, em segundos.
+
+        """
+        with self._trava:
+            self._limitadas = respostas
+            self._retry_after = f"{retry_after:g}"
+
+    def registrar_chamada_api(self) -> str | None:
+        """Registre uma chamada de API e consuma um 429 pendente.
+
+        Returns:
+            str | None: `Retry-After` a enviar, se a chamada for limitada.
+
+        """
+        with self._trava:
+            limitada = self._limitadas > 0
+            if limitada:
+                self._limitadas -= 1
+
+            status = HTTPStatus.TOO_MANY_REQUESTS if limitada else HTTPStatus.OK
+            self.chamadas_api.append((monotonic(), status))
+            return self._retry_after if limitada else None
+
+    def sessao_valida(self, token: str | None, regiao: str) -> bool:
+        """Verifique se o token pertence a uma sessão da região.
+
+        Args:
+            token (str | None): Valor do cookie de sessão.
+            regiao (str): Região consultada.
+
+        Returns:
+            bool: True se a sessão existe.
+
+        """
+        with self._trava:
+            return bool(token) and self._sessoes_pje.get(token) == regiao
+
+
+class _ServidorHTTP(ThreadingHTTPServer):
+    """ThreadingHTTPServer com referência ao simulador."""
+
+    daemon_threads = True
+    request_queue_size = 128
+    simulador: ServidorSimulado
+
+
+class _TratadorSimulado(BaseHTTPRequestHandler):
+    """Atenda as rotas do PJe e do SSO simulados."""
+
+    server: _ServidorHTTP
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Despache as requisições GET."""
+        self._despachar(
+            {
+                r"/trt(\d+)/primeirograu/authenticateSSO\.seam": self._autenticar_sso,
+                r"/trt(\d+)/primeirograu/callback": self._retorno_sso,
+                r"/trt(\d+)/pjekz(?:/.*)?": self._painel,
+                r"/trt(\d+)/pje-comum-api/api/usuarios/logado": self._usuario_logado,
+                r"/trt(\d+)/pje-consulta-api/api/processos/dadosbasicos/([\d.-]+)": (
+                    self._dados_basicos
+                ),
+                r"/trt(\d+)/pje-comum-api/api/processos/id/(\d+)/(\w+)": (
+                    self._detalhe_processo
+                ),
+                CAMINHO_INTEGRA: self._integra,
+                CAMINHO_REALM + r"/protocol/openid-connect/auth": self._pagina_login,
+            },
+        )
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Despache as requisições POST."""
+        self._despachar(
+            {
+                CAMINHO_REALM + r"/pjeoffice-rest": self._pjeoffice_rest,
+                CAMINHO_REALM + r"/login-actions/authenticate": self._enviar_login,
+                CAMINHO_REALM + r"/login-actions/otp": self._enviar_otp,
+            },
+        )
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silencie o log de acesso padrão."""
+
+    def _despachar(self, rotas: dict[str, Callable[..., None]]) -> None:
+        """Encaminhe a requisição para a rota correspondente.
+
+        Args:
+            rotas (dict[str, Callable[..., None]]): Padrão -> método.
+
+        """
+        if self.server.simulador.latencia:
+            sleep(self.server.simulador.latencia)
+
+        caminho = urlparse(self.path).path
+        for padrao, rota in rotas.items():
+            if correspondencia := re.fullmatch(padrao, caminho):
+                rota(*correspondencia.groups())
+                return
+
+        self._responder(HTTPStatus.NOT_FOUND, "Não encontrado")
+
+    def _autenticar_sso(self, regiao: str) -> None:
+        """Redirecione ao painel se logado, senão ao SSO.
+
+        Args:
+            regiao (str): Região da URL.
+
+        """
+        simulador = self.server.simulador
+        if simulador.sessao_valida(self._cookie(COOKIE_SESSAO_PJE), regiao):
+            self._redirecionar(f"/trt{regiao}/pjekz/painel/usuario-externo")
+            return
+
+        self._redirecionar(
+            f"{CAMINHO_REALM}/protocol/openid-connect/auth?"
+            + urlencode({"client_id": f"pje-trt{regiao}", "regiao": regiao}),
+        )
+
+    def _pagina_login(self) -> None:
+        """Abra um login e exiba o formulário `kc-form-login`."""
+        regiao = self._consulta().get("regiao", "1")
+        sessao = self.server.simulador.iniciar_login(regiao)
+        self._responder(
+            HTTPStatus.OK,
+            PAGINA_LOGIN.format(
+                erro="",
+                action=escape(
+                    f"{CAMINHO_REALM}/login-actions/authenticate?sessao={sessao}",
+                ),
+            ),
+            cookies={COOKIE_SESSAO_SSO: (sessao, "/sso/")},
+        )
+
+    def _pjeoffice_rest(self) -> None:
+        """Confira o desafio assinado enviado pelo PJeOffice."""
+        try:
+            dados = json.loads(self._corpo())
+        except ValueError:
+            dados = {}
+
+        if self.server.simulador.registrar_desafio(dados):
+            self._responder(HTTPStatus.NO_CONTENT)
+            return
+
+        self._responder(HTTPStatus.BAD_REQUEST, "Assinatura inválida")
+
+    def _enviar_login(self) -> None:
+        """Receba o `kc-form-login` e exiba a página do OTP."""
+        sessao = self._consulta().get("sessao", "")
+        campos = self._formulario()
+        if not self.server.simulador.confirmar_certificado(sessao, campos):
+            self._responder(
+                HTTPStatus.OK,
+                PAGINA_LOGIN.format(
+                    erro=ERRO_FORMULARIO.format(mensagem="Desafio inválido."),
+                    action=escape(
+                        f"{CAMINHO_REALM}/login-actions/authenticate?sessao={sessao}",
+                    ),
+                ),
+            )
+            return
+
+        self._responder(
+            HTTPStatus.OK,
+            PAGINA_OTP.format(
+                erro="",
+                action=escape(f"{CAMINHO_REALM}/login-actions/otp?sessao={sessao}"),
+            ),
+        )
+
+    def _enviar_otp(self) -> None:
+        """Valide o OTP e redirecione de volta ao PJe."""
+        sessao = self._consulta().get("sessao", "")
+        codigo = self._formulario().get("otp", "")
+        retorno = self.server.simulador.confirmar_otp(sessao, codigo)
+        if not retorno:
+            self._responder(
+                HTTPStatus.OK,
+                PAGINA_OTP.format(
+                    erro=ERRO_FORMULARIO.format(mensagem="Código inválido."),
+                    action=escape(
+                        f"{CAMINHO_REALM}/login-actions/otp?sessao={sessao}",
+                    ),
+                ),
+            )
+            return
+
+        self._redirecionar(retorno)
+
+    def _retorno_sso(self, regiao: str) -> None:
+        """Crie a sessão do PJe e siga para o painel.
+
+        Args:
+            regiao (str): Região da URL.
+
+        """
+        codigo = self._consulta().get("code", "")
+        token = self.server.simulador.criar_sessao_pje(codigo, regiao)
+        if not token:
+            self._responder(HTTPStatus.UNAUTHORIZED, "Código de retorno inválido")
+            return
+
+        self._redirecionar(
+            f"/trt{regiao}/pjekz/painel/usuario-externo",
+            cookies={COOKIE_SESSAO_PJE: (token, f"/trt{regiao}")},
+        )
+
+    def _painel(self, regiao: str) -> None:
+        """Exiba o painel do usuário autenticado.
+
+        Args:
+            regiao (str): Região da URL.
+
+        """
+        if not self.server.simulador.sessao_valida(
+            self._cookie(COOKIE_SESSAO_PJE),
+            regiao,
+        ):
+            self._redirecionar(f"/trt{regiao}/primeirograu/authenticateSSO.seam")
+            return
+
+        self._responder(HTTPStatus.OK, PAGINA_PAINEL.format(regiao=regiao))
+
+    def _usuario_logado(self, regiao: str) -> None:
+        """Responda como a API que valida sessões salvas.
+
+        Args:
+            regiao (str): Região da URL.
+
+        """
+        if self.server.simulador.sessao_valida(
+            self._cookie(COOKIE_SESSAO_PJE),
+            regiao,
+        ):
+            self._responder(
+                HTTPStatus.OK,
+                json.dumps({"regiao": regiao}),
+                tipo="application/json",
+            )
+            return
+
+        self._responder(HTTPStatus.UNAUTHORIZED, "Sessão inválida")
+
+    def _dados_basicos(self, regiao: str, numero: str) -> None:
+        """Responda como o `dadosbasicos`, com id derivado do número.
+
+        Args:
+            regiao (str): Região da URL.
+            numero (str): Número CNJ consultado.
+
+        """
+        if not self._autorizado(regiao):
+            return
+
+        id_processo = int(re.sub(r"\D", "", numero)[:7] or 0)
+        self._responder(
+            HTTPStatus.OK,
+            json.dumps([{"id": id_processo, "numero": numero}]),
+            tipo="application/json",
+        )
+
+    def _detalhe_processo(self, regiao: str, id_processo: str, detalhe: str) -> None:
+        """Responda partes, assuntos ou audiências de um processo.
+
+        Args:
+            regiao (str): Região da URL.
+            id_processo (str): Id do processo.
+            detalhe (str): "partes", "assuntos" ou "audiencias".
+
+        """
+        if not self._autorizado(regiao):
+            return
+
+        if detalhe not in {"partes", "assuntos", "audiencias"}:
+            self._responder(HTTPStatus.NOT_FOUND, "Não encontrado")
+            return
+
+        self._responder(
+            HTTPStatus.OK,
+            json.dumps([{"idProcesso": int(id_processo), "tipo": detalhe}]),
+            tipo="application/json",
+        )
+
+    def _integra(self, regiao: str, id_processo: str) -> None:
+        """Entregue um PDF fictício da íntegra, aceitando `Range` e `If-Range`.
+
+        Args:
+            regiao (str): Região da URL.
+            id_processo (str): Id do processo.
+
+        """
+        if not self._autorizado(regiao):
+            return
+
+        conteudo = integra_simulada(int(id_processo))
+        etag = f'"{hashlib.sha256(conteudo).hexdigest()[:16]}"'
+        intervalo = self.headers.get("Range", "")
+        # Com `If-Range` de outra versão, o Range é ignorado (RFC 9110)
+        if self.headers.get("If-Range", etag) != etag:
+            intervalo = ""
+
+        inicio = 0
+        if correspondencia := re.fullmatch(r"bytes=(\d+)-", intervalo):
+            inicio = int(correspondencia.group(1))
+            if inicio >= len(conteudo):
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{len(conteudo)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+        parte = conteudo[inicio:]
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if inicio else HTTPStatus.OK)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(parte)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        if inicio:
+            self.send_header(
+                "Content-Range",
+                f"bytes {inicio}-{len(conteudo) - 1}/{len(conteudo)}",
+            )
+
+        self.end_headers()
+        self.wfile.write(parte)
+
+    def _autorizado(self, regiao: str) -> bool:
+        """Recuse as chamadas de API limitadas (429) ou sem sessão (401).
+
+        Args:
+            regiao (str): Região da URL.
+
+        Returns:
+            bool: True se a chamada pode ser atendida.
+
+        """
+        if retry_after := self.server.simulador.registrar_chamada_api():
+            self._responder(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                "Limite de requisições",
+                cabecalhos={"Retry-After": retry_after},
+            )
+            return False
+
+        if self.server.simulador.sessao_valida(
+            self._cookie(COOKIE_SESSAO_PJE),
+            regiao,
+        ):
+            return True
+
+        self._responder(HTTPStatus.UNAUTHORIZED, "Sessão inválida")
+        return False
+
+    def _consulta(self) -> dict[str, str]:
+        """Leia os parâmetros da query string.
+
+        Returns:
+            dict[str, str]: Primeiro valor de cada parâmetro.
+
+        """
+        consulta = parse_qs(urlparse(self.path).query)
+        return {nome: valores[0] for nome, valores in consulta.items()}
+
+    def _corpo(self) -> str:
+        """Leia o corpo da requisição.
+
+        Returns:
+            str: Corpo decodificado.
+
+        """
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(tamanho).decode()
+
+    def _formulario(self) -> dict[str, str]:
+        """Leia o corpo como formulário urlencoded.
+
+        Returns:
+            dict[str, str]: Primeiro valor de cada campo.
+
+        """
+        campos = parse_qs(self._corpo(), keep_blank_values=True)
+        return {nome: valores[0] for nome, valores in campos.items()}
+
+    def _cookie(self, nome: str) -> str | None:
+        """Obtenha o valor de um cookie da requisição.
+
+        Args:
+            nome (str): Nome do cookie.
+
+        Returns:
+            str | None: Valor ou None se ausente.
+
+        """
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookies[nome].value if nome in cookies else None
+
+    def _redirecionar(
+        self,
+        destino: str,
+        cookies: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        """Responda com redirecionamento 302.
+
+        Args:
+            destino (str): URL ou caminho de destino.
+            cookies (dict[str, tuple[str, str]] | None): Cookies a
+                definir (nome -> (valor, path)).
+
+        """
+        self._responder(
+            HTTPStatus.FOUND,
+            cabecalhos={"Location": destino},
+            cookies=cookies,
+        )
+
+    def _responder(
+        self,
+        status: HTTPStatus,
+        corpo: str = "",
+        tipo: str = "text/html; charset=utf-8",
+        cabecalhos: dict[str, str] | None = None,
+        cookies: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        """Envie a resposta completa.
+
+        Args:
+            status (HTTPStatus): Código HTTP.
+            corpo (str): Conteúdo da resposta.
+            tipo (str): Content-Type.
+            cabecalhos (dict[str, str] | None): Cabeçalhos extras.
+            cookies (dict[str, tuple[str, str]] | None): Cookies a
+                definir (nome -> (valor, path)).
+
+        """
+        dados = corpo.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(dados)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+
+        for nome, (valor, caminho) in (cookies or {}).items():
+            self.send_header(
+                "Set-Cookie",
+                f"{nome}={valor}; Path={caminho}; HttpOnly; SameSite=Lax",
+            )
+
+        self.end_headers()
+        self.wfile.write(dados)
+
+
+def integra_simulada(id_processo: int) -> bytes:
+    """Gere o conteúdo determinístico da íntegra de um processo.
+
+    Args:
+        id_processo (int): Id do processo.
+
+    Returns:
+        bytes: PDF fictício, sempre igual para o mesmo id.
+
+    """
+    bloco = f"%PDF-1.7 processo {id_processo}\n".encode()
+    tamanho = TAMANHO_INTEGRA + id_processo % 1000
+    return (bloco * (tamanho // len(bloco) + 1))[:tamanho]
+
+
+def apontar_urls(url_pje: str, url_sso: str) -> None:
+    """Faça os autenticadores deste processo usarem outras URLs.
+
+    Atualiza as variáveis de ambiente e recarrega `elements.pje`,
+    que é o mesmo módulo referenciado por todos os autenticadores.
+
+    Args:
+        url_pje (str): Base do PJe com o marcador `{trt_id}`.
+        url_sso (str): Base do SSO (a barra final é opcional).
+
+    """
+    environ["AUTENTICAPJE_URL_PJE"] = url_pje
+    environ["AUTENTICAPJE_URL_SSO"] = url_sso
+    importlib.reload(el)
@@ -0,0 +1,107 @@
+"""Suba o simulador do PJe/SSO ou dispare uma carga de logins contra ele."""
+
+from __future__ import annotations
+
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Annotated
+
+from tqdm import tqdm
+from typer import Option, Typer
+
+from autenticapje.benchmark.fixtures import gerar_fixtures
+from autenticapje.regioes import MODOS_LOGIN, interpretar_regioes
+from autenticapje.simulador import ServidorSimulado, apontar_urls
+from autenticapje.simulador.carga import gerar_carga
+
+app = Typer()
+
+PASTA_FIXTURES = Path.home().joinpath(".autenticapje", "simulador")
+
+
+@app.command()
+def servir(
+    porta: Annotated[int, Option(help="Porta de escuta.")] = 8080,
+    latencia: Annotated[
+        float,
+        Option(help="Atraso por resposta, em segundos."),
+    ] = 0.0,
+    fixtures: Annotated[
+        Path,
+        Option(help="Pasta onde o certificado e o KDBX de teste são gerados."),
+    ] = PASTA_FIXTURES,
+) -> None:
+    """Atenda o simulador em primeiro plano até Ctrl+C."""
+    gerados = gerar_fixtures(fixtures)
+    servidor = ServidorSimulado(
+        porta=porta,
+        otp_uri=gerados.otp_uri,
+        latencia=latencia,
+    )
+
+    variaveis = gerados.variaveis_ambiente()
+    variaveis["AUTENTICAPJE_URL_PJE"] = servidor.url_pje
+    variaveis["AUTENTICAPJE_URL_SSO"] = servidor.url_sso
+    tqdm.write(f"Simulador em {servidor.url_base}. Para usá-lo, exporte:\n")
+    for nome, valor in variaveis.items():
+        tqdm.write(f'export {nome}="{valor}"')
+
+    try:
+        servidor.servir()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.encerrar()
+
+
+@app.command()
+def carga(
+    logins: Annotated[int, Option(help="Total de logins.")] = 50,
+    concorrencia: Annotated[int, Option(help="Logins simultâneos.")] = 4,
+    modo: Annotated[
+        str,
+        Option(help='"navegador" (Chrome) ou "http" (sem navegador).'),
+    ] = "navegador",
+    regiao: Annotated[str, Option(help='Regiões em rodízio (ex.: "1-24").')] = "1",
+    latencia: Annotated[
+        float,
+        Option(help="Atraso por resposta do simulador, em segundos."),
+    ] = 0.0,
+) -> None:
+    """Dispare logins simultâneos contra um simulador em processo."""
+    if modo not in MODOS_LOGIN:
+        tqdm.write(f'Modo "{modo}" inválido! Use "navegador" ou "http".')
+        return
+
+    with TemporaryDirectory(prefix="autenticapje-simulador-") as temporario:
+        gerados = gerar_fixtures(Path(temporario))
+        environ.update(gerados.variaveis_ambiente())
+
+        with ServidorSimulado(otp_uri=gerados.otp_uri, latencia=latencia) as servidor:
+            apontar_urls(servidor.url_pje, servidor.url_sso)
+            relatorio = gerar_carga(
+                logins,
+                concorrencia=concorrencia,
+                modo=modo,
+                regioes=interpretar_regioes(regiao),
+            )
+
+    tqdm.write(f"""
+======================================
+Logins: {relatorio["sucessos"]}/{relatorio["logins"]} \
+(concorrência {relatorio["concorrencia"]})
+Duração: {relatorio["duracao"]:.2f}s
+Vazão: {relatorio["vazao"]:.2f} logins/s
+Latência p50: {relatorio["p50"]:.3f}s
+Latência p90: {relatorio["p90"]:.3f}s
+Latência p99: {relatorio["p99"]:.3f}s
+Latência máx: {relatorio["maximo"]:.3f}s
+======================================
+""")
+    for erro in relatorio["erros"]:
+        tqdm.write(erro)
+
+
+if __name__ == "__main__":
+    app()
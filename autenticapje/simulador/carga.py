@@ -0,0 +1,150 @@
+"""Dispare logins simultâneos e meça vazão e latência.
+
+Pensado para rodar contra o `ServidorSimulado`, mas funciona com
+qualquer destino configurado em `elements/pje.py`.
+"""
+
+from __future__ import annotations
+
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from math import ceil
+from time import perf_counter
+from typing import TYPE_CHECKING, TypedDict
+
+from autenticapje.regioes import MODOS_LOGIN, ModoLogin
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class RelatorioCarga(TypedDict):
+    """Resumo de uma rodada de carga.
+
+    Args:
+        logins (int): Logins disparados.
+        concorrencia (int): Logins simultâneos.
+        sucessos (int): Logins concluídos.
+        falhas (int): Logins que falharam.
+        duracao (float): Tempo total da rodada, em segundos.
+        vazao (float): Logins concluídos por segundo.
+        p50 (float): Latência mediana, em segundos.
+        p90 (float): Percentil 90 da latência.
+        p99 (float): Percentil 99 da latência.
+        maximo (float): Maior latência observada.
+        erros (list[str]): Tracebacks das falhas (até 5).
+
+    """
+
+    logins: int
+    concorrencia: int
+    sucessos: int
+    falhas: int
+    duracao: float
+    vazao: float
+    p50: float
+    p90: float
+    p99: float
+    maximo: float
+    erros: list[str]
+
+
+def gerar_carga(
+    logins: int,
+    concorrencia: int = 4,
+    modo: ModoLogin = "navegador",
+    regioes: Iterable[str] = ("1",),
+) -> RelatorioCarga:
+    """Execute logins simultâneos e consolide as latências.
+
+    A latência de cada login inclui a criação do autenticador (no
+    modo "navegador", a abertura do Chrome) até o fim de
+    `autenticar`.
+
+    Args:
+        logins (int): Total de logins a executar.
+        concorrencia (int): Logins simultâneos.
+        modo (ModoLogin): "navegador" (Chrome) ou "http".
+        regioes (Iterable[str]): Regiões usadas em rodízio.
+
+    Returns:
+        RelatorioCarga: Vazão e percentis de latência.
+
+    """
+    alvos = list(islice(cycle(list(regioes)), logins))
+    concorrencia = max(1, min(concorrencia, logins or 1))
+
+    inicio = perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=concorrencia,
+        thread_name_prefix="autenticapje-carga",
+    ) as executor:
+        execucoes = list(executor.map(lambda regiao: _login(regiao, modo), alvos))
+
+    duracao = perf_counter() - inicio
+
+    latencias = sorted(tempo for sucesso, tempo, _ in execucoes if sucesso)
+    erros = [erro for _, _, erro in execucoes if erro]
+    return RelatorioCarga(
+        logins=logins,
+        concorrencia=concorrencia,
+        sucessos=len(latencias),
+        falhas=logins - len(latencias),
+        duracao=duracao,
+        vazao=len(latencias) / duracao if duracao else 0.0,
+        p50=percentil(latencias, 0.5),
+        p90=percentil(latencias, 0.9),
+        p99=percentil(latencias, 0.99),
+        maximo=latencias[-1] if latencias else 0.0,
+        erros=erros[:5],
+    )
+
+
+def percentil(ordenados: list[float], fracao: float) -> float:
+    """Calcule o percentil pelo método do posto mais próximo.
+
+    Args:
+        ordenados (list[float]): Valores em ordem crescente.
+        fracao (float): Percentil desejado (0.9 = p90).
+
+    Returns:
+        float: Valor do percentil (0.0 se não houver valores).
+
+    """
+    if not ordenados:
+        return 0.0
+
+    posicao = max(1, ceil(fracao * len(ordenados)))
+    return ordenados[posicao - 1]
+
+
+def _login(regiao: str, modo: ModoLogin) -> tuple[bool, float, str | None]:
+    """Execute um login completo e encerre o autenticador.
+
+    Args:
+        regiao (str): Região a autenticar.
+        modo (ModoLogin): Modo de login.
+
+    Returns:
+        tuple[bool, float, str | None]: Sucesso, duração e traceback
+            da falha, se houver.
+
+    """
+    inicio = perf_counter()
+    autenticador = None
+    try:
+        autenticador = MODOS_LOGIN[modo](regiao)
+        # Sem esperar a virada da janela do OTP, que mediria o relógio
+        # e não o login
+        autenticador.estrategia_otp = "proxima"
+        sucesso = autenticador.autenticar()
+        erro = None if sucesso else f"TRT{regiao}: login não confirmado"
+    except Exception as e:  # noqa: BLE001
+        sucesso = False
+        erro = "\n".join(traceback.format_exception(e))
+    finally:
+        if autenticador:
+            autenticador.fechar()
+
+    return sucesso, perf_counter() - inicio, erro
@@ -0,0 +1,360 @@
+"""Autentique no PJe sem navegador, apenas com requisições HTTP.
+
+O fluxo reproduz o que o navegador faz no Keycloak do PJe: segue
+os redirecionamentos de `LINK_AUTENTICACAO_SSO`, preenche o
+formulário `kc-form-login` com o desafio assinado, envia o código
+OTP e retorna os mesmos cookies do modo com navegador.
+"""
+
+from __future__ import annotations
+
+import traceback
+from contextlib import suppress
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, TypedDict
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from autenticapje import AutenticadorBase, _auth_error
+
+from .elements import pje as el
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+type AnyType = any
+
+ID_FORM_LOGIN = "kc-form-login"
+NOME_CAMPO_OTP = "otp"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
+)
+
+
+class FormularioHTML(TypedDict):
+    """Formulário extraído de uma página HTML.
+
+    Args:
+        id (str): Atributo id do formulário.
+        action (str): URL de envio, como escrita na página.
+        method (str): Método HTTP em minúsculas.
+        campos (dict[str, str]): Campos enviados no submit.
+        botoes (dict[str, str]): Botões de envio nomeados.
+
+    """
+
+    id: str
+    action: str
+    method: str
+    campos: dict[str, str]
+    botoes: dict[str, str]
+
+
+class _LeitorFormularios(HTMLParser):
+    """Colete formulários e seus campos de uma página HTML."""
+
+    def __init__(self) -> None:
+        """Inicialize o leitor sem formulários coletados."""
+        super().__init__()
+        self.formularios: list[FormularioHTML] = []
+        self._atual: FormularioHTML | None = None
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, str | None]],
+    ) -> None:
+        """Registre formulários e campos conforme aparecem.
+
+        Args:
+            tag (str): Nome da tag aberta.
+            attrs (list[tuple[str, str | None]]): Atributos da tag.
+
+        """
+        atributos = {nome: valor or "" for nome, valor in attrs}
+
+        if tag == "form":
+            self._atual = FormularioHTML(
+                id=atributos.get("id", ""),
+                action=atributos.get("action", ""),
+                method=atributos.get("method", "get").lower(),
+                campos={},
+                botoes={},
+            )
+            self.formularios.append(self._atual)
+            return
+
+        nome = atributos.get("name")
+        if self._atual is None or not nome:
+            return
+
+        tipo = atributos.get("type", "text").lower()
+        if tag == "button" or tipo in {"submit", "image"}:
+            self._atual["botoes"][nome] = atributos.get("value", "")
+
+        elif tag in {"input", "textarea", "select"} and tipo != "button":
+            # Caixas de seleção só são enviadas quando marcadas
+            if tipo in {"checkbox", "radio"} and "checked" not in atributos:
+                return
+
+            self._atual["campos"][nome] = atributos.get("value", "")
+
+    def handle_endtag(self, tag: str) -> None:
+        """Encerre o formulário corrente ao fechar a tag.
+
+        Args:
+            tag (str): Nome da tag fechada.
+
+        """
+        if tag == "form":
+            self._atual = None
+
+
+def extrair_formularios(html: str) -> list[FormularioHTML]:
+    """Extraia todos os formulários de uma página HTML.
+
+    Args:
+        html (str): Conteúdo da página.
+
+    Returns:
+        list[FormularioHTML]: Formulários na ordem do documento.
+
+    """
+    leitor = _LeitorFormularios()
+    leitor.feed(html)
+    leitor.close()
+    return leitor.formularios
+
+
+class AutenticadorHTTP(AutenticadorBase):
+    """Autentique no PJe usando apenas `requests.Session`.
+
+    Mantém a mesma interface do AutenticadorPJe, mas dispensa o
+    Chrome: os formulários do Keycloak são lidos e enviados
+    diretamente por HTTP.
+    """
+
+    def __init__(self, regiao: str = "1", timeout: float = 30) -> None:
+        """Inicialize o autenticador com uma sessão HTTP própria.
+
+        Args:
+            regiao (str): Identificador da região do PJe.
+            timeout (float): Tempo máximo de cada requisição.
+
+        """
+        super().__init__(regiao)
+        self.timeout = timeout
+        self.sessao = requests.Session()
+        self.sessao.headers["User-Agent"] = USER_AGENT
+        self.url_atual = ""
+
+    def autenticar(self) -> bool:
+        """Realize o login no PJe e retorne True se bem-sucedido.
+
+        Returns:
+            bool: Indica se o login foi realizado com sucesso.
+
+        """
+        sucesso_login = False
+        try:
+            url = el.LINK_AUTENTICACAO_SSO.format(regiao=self.regiao)
+            with self.medidor.fase("pagina_sso"):
+                resp = self._requisitar("get", url)
+
+            if el.URL_SSO not in resp.url:
+                return True
+
+            resp = self._login_certificado(resp)
+            resp = self._desafio_duplo_fator(resp)
+            sucesso_login = el.TRECHO_URL_AUTENTICADO in resp.url
+
+        except Exception as e:  # noqa: BLE001
+            exc = "\n".join(traceback.format_exception(e))
+            self.print_message(
+                message=f"Erro ao realizar autenticação: {exc}",
+                message_type="error",
+            )
+
+        return sucesso_login
+
+    def _login_certificado(
+        self,
+        pagina_login: requests.Response,
+    ) -> requests.Response:
+        """Envie o desafio assinado pelo formulário do Keycloak.
+
+        Args:
+            pagina_login (requests.Response): Página com o
+                formulário `kc-form-login`.
+
+        Returns:
+            requests.Response: Resposta após enviar o formulário.
+
+        """
+        formulario = _localizar_formulario(
+            pagina_login.text,
+            lambda form: form["id"] == ID_FORM_LOGIN,
+        )
+
+        desafio, uuid_tarefa = self._enviar_desafio()
+
+        campos = dict(formulario["campos"])
+        campos[el.ID_INPUT_DESAFIO] = desafio
+        campos[el.ID_CODIGO_PJE] = uuid_tarefa
+
+        with self.medidor.fase("envio_formulario"):
+            return self._submeter(pagina_login, formulario, campos)
+
+    def _desafio_duplo_fator(
+        self,
+        pagina_otp: requests.Response,
+    ) -> requests.Response:
+        """Preencha e envie o token OTP para confirmar login.
+
+        Args:
+            pagina_otp (requests.Response): Página com o campo OTP.
+
+        Returns:
+            requests.Response: Resposta final do login.
+
+        """
+        formulario = _localizar_formulario(
+            pagina_otp.text,
+            lambda form: NOME_CAMPO_OTP in form["campos"],
+        )
+
+        campos = dict(formulario["campos"])
+        campos[NOME_CAMPO_OTP] = self._gerar_otp()
+
+        # Envio implícito (ENTER) inclui o primeiro botão de submit
+        campos.update(list(formulario["botoes"].items())[:1])
+
+        # Com requests, o envio do OTP já segue o redirecionamento final
+        with self.medidor.fase("otp_envio"):
+            return self._submeter(pagina_otp, formulario, campos)
+
+    def _confirmar_login(self) -> bool:
+        """Verifique se a última página indica sessão autenticada.
+
+        Returns:
+            bool: True se a URL indicar sessão autenticada.
+
+        """
+        return el.TRECHO_URL_AUTENTICADO in self.url_atual
+
+    def _submeter(
+        self,
+        pagina: requests.Response,
+        formulario: FormularioHTML,
+        campos: dict[str, str],
+    ) -> requests.Response:
+        """Envie o formulário relativo à página de origem.
+
+        Args:
+            pagina (requests.Response): Página que contém o form.
+            formulario (FormularioHTML): Formulário a enviar.
+            campos (dict[str, str]): Valores a submeter.
+
+        Returns:
+            requests.Response: Resposta após os redirecionamentos.
+
+        """
+        action = urljoin(pagina.url, formulario["action"] or pagina.url)
+        if formulario["method"] == "post":
+            return self._requisitar("post", action, data=campos)
+
+        return self._requisitar("get", action, params=campos)
+
+    def _requisitar(
+        self,
+        metodo: str,
+        url: str,
+        **kwargs: AnyType,
+    ) -> requests.Response:
+        """Execute a requisição seguindo redirecionamentos.
+
+        Args:
+            metodo (str): Método HTTP.
+            url (str): Endereço de destino.
+            **kwargs (AnyType): Dados, parâmetros, etc.
+
+        Returns:
+            requests.Response: Resposta final.
+
+        """
+        resp = self.sessao.request(metodo, url, timeout=self.timeout, **kwargs)
+        resp.raise_for_status()
+        self.url_atual = resp.url
+        return resp
+
+    def get_cookies_for_requests(self) -> dict[str, str]:
+        """Retorne os cookies do domínio atual do PJe.
+
+        Returns:
+            dict[str, str]: Mapa nome -> valor dos cookies.
+
+        """
+        return {
+            cookie["name"]: cookie["value"]
+            for cookie in self.get_cookies_browser()
+        }
+
+    def get_cookies_browser(self) -> list[dict]:
+        """Retorne os cookies no mesmo formato do Selenium.
+
+        Apenas os cookies visíveis ao domínio atual são incluídos,
+        como faz `driver.get_cookies()`.
+
+        Returns:
+            list[dict]: Cookies do domínio atual.
+
+        """
+        host = urlparse(self.url_atual).hostname or ""
+        cookies = []
+        for cookie in self.sessao.cookies:
+            dominio = cookie.domain.lstrip(".")
+            if host != dominio and not host.endswith("." + dominio):
+                continue
+
+            dados = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": bool(cookie.secure),
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            if cookie.expires:
+                dados["expiry"] = int(cookie.expires)
+
+            cookies.append(dados)
+
+        return cookies
+
+    def fechar(self) -> None:
+        """Encerre a sessão HTTP e suas conexões."""
+        with suppress(Exception):
+            self.sessao.close()
+
+
+def _localizar_formulario(
+    html: str,
+    criterio: Callable[[FormularioHTML], bool],
+) -> FormularioHTML:
+    """Encontre o formulário que atende ao critério informado.
+
+    Args:
+        html (str): Conteúdo da página.
+        criterio (Callable[[FormularioHTML], bool]): Filtro.
+
+    Returns:
+        FormularioHTML: Primeiro formulário compatível.
+
+    """
+    for formulario in extrair_formularios(html):
+        if criterio(formulario):
+            return formulario
+
+    _auth_error()
@@ -0,0 +1,71 @@
+"""Fixtures compartilhadas pelos testes."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from autenticapje import AutenticadorBase
+from autenticapje.benchmark.fixtures import Fixtures, gerar_fixtures
+from autenticapje.elements import pje as el
+from autenticapje.simulador import ServidorSimulado
+from autenticapje.sso import AutenticadorHTTP
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def fixtures(tmp_path_factory: pytest.TempPathFactory) -> Fixtures:
+    """Certificado com cadeia de três níveis e KeePass com o OTP.
+
+    Returns:
+        Fixtures: Arquivos e credenciais descartáveis.
+
+    """
+    diretorio: Path = tmp_path_factory.mktemp("fixtures")
+    return gerar_fixtures(diretorio, entradas=5)
+
+
+@pytest.fixture
+def simulador(fixtures: Fixtures) -> Iterator[ServidorSimulado]:
+    """PJe/SSO simulado, com os autenticadores apontados para ele.
+
+    O OTP usa a estratégia "proxima" para não esperar a virada da
+    janela; o simulador aceita uma janela de tolerância.
+
+    Yields:
+        ServidorSimulado: Servidor em execução.
+
+    """
+    with ServidorSimulado(otp_uri=fixtures.otp_uri) as servidor:
+        with pytest.MonkeyPatch.context() as mp:
+            for nome, valor in fixtures.variaveis_ambiente().items():
+                mp.setenv(nome, valor)
+
+            mp.setenv("AUTENTICAPJE_URL_PJE", servidor.url_pje)
+            mp.setenv("AUTENTICAPJE_URL_SSO", servidor.url_sso)
+            mp.setattr(AutenticadorBase, "estrategia_otp", "proxima")
+            importlib.reload(el)
+            yield servidor
+
+        importlib.reload(el)
+
+
+@pytest.fixture
+def cookies(simulador: ServidorSimulado) -> dict[str, str]:
+    """Cookies de uma sessão real do TRT3 no simulador.
+
+    Returns:
+        dict[str, str]: Cookies "Py" da sessão.
+
+    """
+    autenticador = AutenticadorHTTP("3")
+    try:
+        assert autenticador.autenticar()
+        return autenticador.get_cookies_for_requests()
+    finally:
+        autenticador.fechar()
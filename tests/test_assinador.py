@@ -0,0 +1,255 @@
+"""Testes do Assinador e do cache de certificados."""
+
+from __future__ import annotations
+
+import base64
+import os
+import shutil
+from time import sleep
+from typing import TYPE_CHECKING
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from autenticapje import assinador
+from autenticapje.assinador import TAMANHO_BLOCO, Assinador, CacheCertificados
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from autenticapje.assinador import Algoritmos
+    from autenticapje.benchmark.fixtures import Fixtures
+
+ALGORITMO: Algoritmos = "SHA256withRSA"
+TAMANHO_LOTE = 6
+
+
+@pytest.fixture
+def certificado(fixtures: Fixtures, tmp_path: Path) -> Path:
+    """Cópia do certificado fixture, que o teste pode alterar.
+
+    Returns:
+        Path: Arquivo PKCS#12.
+
+    """
+    return shutil.copy(fixtures.certificado, tmp_path.joinpath("certificado.pfx"))
+
+
+@pytest.fixture
+def senha(fixtures: Fixtures) -> bytes:
+    """Senha do certificado fixture.
+
+    Returns:
+        bytes: Senha codificada.
+
+    """
+    return fixtures.senha_certificado.encode()
+
+
+def test_cache_reaproveita_certificado(certificado: Path, senha: bytes) -> None:
+    cache = CacheCertificados()
+
+    primeiro = cache.obter(certificado, senha)
+
+    assert cache.obter(str(certificado), senha) is primeiro
+    assert not cache._travas_carga  # noqa: SLF001
+
+
+def test_cache_recusa_senha_errada(certificado: Path, senha: bytes) -> None:
+    cache = CacheCertificados()
+    cache.obter(certificado, senha)
+
+    # A senha faz parte da chave: a entrada em cache não é entregue
+    with pytest.raises(ValueError, match="password"):
+        cache.obter(certificado, b"errada")
+
+    assert not cache._travas_carga  # noqa: SLF001
+
+
+# O PKCS#12 com um byte a mais ainda abre (como BER), com aviso
+@pytest.mark.filterwarnings("ignore:PKCS#12 bundle could not be parsed as DER")
+def test_cache_rele_arquivo_alterado(certificado: Path, senha: bytes) -> None:
+    cache = CacheCertificados()
+    primeiro = cache.obter(certificado, senha)
+
+    estado = certificado.stat()
+    os.utime(certificado, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+    segundo = cache.obter(certificado, senha)
+
+    assert segundo is not primeiro
+    assert len(cache._entradas) == 1  # noqa: SLF001
+
+    # Mesmo mtime, outro tamanho: também é relido
+    estado = certificado.stat()
+    with certificado.open("ab") as arquivo:
+        arquivo.write(b"\0")
+    os.utime(certificado, ns=(estado.st_atime_ns, estado.st_mtime_ns))
+
+    assert cache.obter(certificado, senha) is not segundo
+
+
+def test_cache_expira_pelo_ttl(
+    certificado: Path,
+    senha: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agora = 1000.0
+    monkeypatch.setattr(assinador, "monotonic", lambda: agora)
+    cache = CacheCertificados(ttl=60)
+    primeiro = cache.obter(certificado, senha)
+
+    agora += 59
+    assert cache.obter(certificado, senha) is primeiro
+
+    agora += 2
+    assert cache.obter(certificado, senha) is not primeiro
+
+
+def test_cache_invalidar(certificado: Path, senha: bytes, fixtures: Fixtures) -> None:
+    cache = CacheCertificados()
+    primeiro = cache.obter(certificado, senha)
+    outro = cache.obter(fixtures.certificado, senha)
+
+    cache.invalidar(certificado)
+    assert cache.obter(fixtures.certificado, senha) is outro
+    assert cache.obter(certificado, senha) is not primeiro
+
+    cache.invalidar()
+    assert cache.obter(fixtures.certificado, senha) is not outro
+
+
+@pytest.fixture
+def assinador_teste(fixtures: Fixtures) -> Assinador:
+    """Assinador com o certificado fixture.
+
+    Returns:
+        Assinador: Assinador pronto.
+
+    """
+    return Assinador(fixtures.certificado, fixtures.senha_certificado)
+
+
+def _lote(tamanho: int = TAMANHO_LOTE) -> list[bytes]:
+    return [str(indice).encode() for indice in range(tamanho)]
+
+
+def _esperadas(assinador_teste: Assinador, conteudos: list[bytes]) -> list[str]:
+    return [
+        assinador_teste.assinar_conteudo(conteudo, ALGORITMO).conteudo_assinado_base64
+        for conteudo in conteudos
+    ]
+
+
+def _inverter_conclusao(
+    assinador_teste: Assinador,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Faça as assinaturas do lote terminarem na ordem inversa da entrada."""
+    assinar = assinador_teste._assinar  # noqa: SLF001
+
+    def assinar_lento(conteudo: bytes, algoritmo: Algoritmos) -> bytes:
+        sleep(0.05 * (TAMANHO_LOTE - int(conteudo)))
+        return assinar(conteudo, algoritmo)
+
+    monkeypatch.setattr(assinador_teste, "_assinar", assinar_lento)
+
+
+def test_lote_ordenado(
+    assinador_teste: Assinador,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    esperadas = _esperadas(assinador_teste, _lote())
+    _inverter_conclusao(assinador_teste, monkeypatch)
+
+    entregues = list(
+        assinador_teste.assinar_lote(_lote(), ALGORITMO, max_workers=TAMANHO_LOTE),
+    )
+
+    assert [indice for indice, _ in entregues] == list(range(TAMANHO_LOTE))
+    assert [c.conteudo_assinado_base64 for _, c in entregues] == esperadas
+
+
+def test_lote_na_ordem_de_conclusao(
+    assinador_teste: Assinador,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    esperadas = _esperadas(assinador_teste, _lote())
+    _inverter_conclusao(assinador_teste, monkeypatch)
+
+    entregues = list(
+        assinador_teste.assinar_lote(
+            _lote(),
+            ALGORITMO,
+            max_workers=TAMANHO_LOTE,
+            ordenado=False,
+        ),
+    )
+
+    indices = [indice for indice, _ in entregues]
+    assert indices[0] == TAMANHO_LOTE - 1
+    assert sorted(indices) == list(range(TAMANHO_LOTE))
+    for indice, conteudo in entregues:
+        assert conteudo.conteudo_assinado_base64 == esperadas[indice]
+
+
+def test_lote_le_a_entrada_aos_poucos(assinador_teste: Assinador) -> None:
+    lidos = 0
+
+    def conteudos() -> Iterator[bytes]:
+        nonlocal lidos
+        for conteudo in _lote(20):
+            lidos += 1
+            yield conteudo
+
+    entregues = assinador_teste.assinar_lote(conteudos(), ALGORITMO, max_workers=2)
+
+    next(entregues)
+    assert lidos == 4  # noqa: PLR2004
+    assert len(list(entregues)) == 19  # noqa: PLR2004
+
+
+def test_lote_em_processos(assinador_teste: Assinador, tmp_path: Path) -> None:
+    arquivo = tmp_path.joinpath("documento.pdf")
+    arquivo.write_bytes(b"%PDF-1.7 " * 1000)
+    conteudos = [*_lote(), arquivo]
+
+    em_threads = [
+        c.conteudo_assinado_base64
+        for _, c in assinador_teste.assinar_lote(conteudos, ALGORITMO)
+    ]
+    em_processos = list(
+        assinador_teste.assinar_lote(
+            conteudos,
+            ALGORITMO,
+            max_workers=2,
+            processos=True,
+        ),
+    )
+
+    assert [indice for indice, _ in em_processos] == list(range(len(conteudos)))
+    assert [c.conteudo_assinado_base64 for _, c in em_processos] == em_threads
+
+
+@pytest.mark.parametrize("algoritmo", ["SHA256withRSA", "SHA1withRSA", "MD5withRSA"])
+def test_arquivo_igual_em_memoria(
+    assinador_teste: Assinador,
+    tmp_path: Path,
+    algoritmo: Algoritmos,
+) -> None:
+    # Dois blocos e meio: o resumo atravessa a fronteira dos blocos
+    conteudo = os.urandom(TAMANHO_BLOCO * 5 // 2)
+    arquivo = tmp_path.joinpath("documento.pdf")
+    arquivo.write_bytes(conteudo)
+
+    em_blocos = assinador_teste.assinar_arquivo(arquivo, algoritmo)
+    em_memoria = assinador_teste.assinar_conteudo(conteudo, algoritmo)
+
+    assinatura = base64.b64decode(em_blocos.conteudo_assinado_base64)
+    assert assinatura == base64.b64decode(em_memoria.conteudo_assinado_base64)
+    assinador_teste.certficado.public_key().verify(
+        assinatura,
+        conteudo,
+        padding.PKCS1v15(),
+        Assinador.algoritmos_suportados[algoritmo],
+    )
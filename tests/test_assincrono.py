@@ -0,0 +1,238 @@
+"""Testes do AsyncAutenticadorPJe, com navegadores falsos."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+
+from autenticapje import assincrono
+from autenticapje.assincrono import AsyncAutenticadorPJe, executor_padrao
+from autenticapje.elements import pje as el
+from autenticapje.simulador import COOKIE_SESSAO_PJE
+from autenticapje.sso import ID_FORM_LOGIN, AutenticadorHTTP, _localizar_formulario
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import requests
+
+    from autenticapje.driver import BotDriver
+    from autenticapje.simulador import ServidorSimulado
+
+pytest.importorskip("httpx")
+
+TOTAL_LOGINS = 6
+
+
+class NavegadorHTTP(AutenticadorHTTP):
+    """Etapas do AutenticadorPJe percorridas por HTTP, sem Chrome."""
+
+    def __init__(
+        self,
+        regiao: str = "1",
+        bot_driver: BotDriver | None = None,  # noqa: ARG002
+        *,
+        login_enxuto: bool = True,
+    ) -> None:
+        """Inicialize o navegador falso sem driver.
+
+        Args:
+            regiao (str): Identificador da região do PJe.
+            bot_driver (BotDriver | None): Ignorado.
+            login_enxuto (bool): Ignorado (não há recursos a bloquear).
+
+        """
+        super().__init__(regiao)
+        self.login_enxuto = login_enxuto
+        self.driver = None
+        self._pagina: requests.Response | None = None
+
+    def _abrir_pagina_sso(self) -> bool:
+        url = el.LINK_AUTENTICACAO_SSO.format(regiao=self.regiao)
+        self._pagina = self._requisitar("get", url)
+        return el.URL_SSO not in self._pagina.url
+
+    def _submeter_desafio(self, desafio: str, uuid_tarefa: str) -> None:
+        formulario = _localizar_formulario(
+            self._pagina.text,
+            lambda form: form["id"] == ID_FORM_LOGIN,
+        )
+        campos = dict(formulario["campos"])
+        campos[el.ID_INPUT_DESAFIO] = desafio
+        campos[el.ID_CODIGO_PJE] = uuid_tarefa
+        self._pagina = self._submeter(self._pagina, formulario, campos)
+
+    def _desafio_duplo_fator(self) -> None:
+        self._pagina = super()._desafio_duplo_fator(self._pagina)
+
+    def _aguardar_redirecionamento(self) -> bool:
+        return self._confirmar_login()
+
+
+class NavegadorLento:
+    """Navegador cujas etapas só terminam quando liberadas ou fechadas."""
+
+    abertura = Event()
+    espera = 5.0
+    fechados: ClassVar[list[NavegadorLento]] = []
+    simultaneos = 0
+    maximo_simultaneos = 0
+    trava = Lock()
+
+    def __init__(self, regiao: str = "1", **_: object) -> None:
+        """Aguarde a abertura ser liberada, como o Chrome ao iniciar.
+
+        Args:
+            regiao (str): Identificador da região do PJe.
+            **_ (object): Argumentos do AutenticadorPJe, ignorados.
+
+        """
+        self.regiao = regiao
+        self.driver = None
+        self.etapas = Event()
+        self.abertura.wait(timeout=5)
+
+    def _abrir_pagina_sso(self) -> bool:
+        cls = type(self)
+        with cls.trava:
+            cls.simultaneos += 1
+            cls.maximo_simultaneos = max(cls.maximo_simultaneos, cls.simultaneos)
+
+        # Segura a thread até o fechamento, como o Selenium numa página lenta
+        self.etapas.wait(timeout=self.espera)
+        with cls.trava:
+            cls.simultaneos -= 1
+
+        return True
+
+    def fechar(self) -> None:
+        """Registre o fechamento e interrompa a etapa em andamento."""
+        self.fechados.append(self)
+        self.etapas.set()
+
+
+@pytest.fixture
+def navegador_lento(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[NavegadorLento]]:
+    """NavegadorLento no lugar do AutenticadorPJe, com estado zerado.
+
+    Yields:
+        type[NavegadorLento]: Classe instalada no módulo.
+
+    """
+    monkeypatch.setattr(assincrono, "AutenticadorPJe", NavegadorLento)
+    monkeypatch.setattr(NavegadorLento, "espera", 5.0)
+    NavegadorLento.abertura.set()
+    NavegadorLento.fechados = []
+    NavegadorLento.simultaneos = NavegadorLento.maximo_simultaneos = 0
+    yield NavegadorLento
+    # Nenhuma thread deve ficar presa a um teste que já terminou
+    NavegadorLento.abertura.set()
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Executor próprio do teste, encerrado ao final.
+
+    Yields:
+        ThreadPoolExecutor: Executor das etapas bloqueantes.
+
+    """
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+async def _cancelar_login(autenticador: AsyncAutenticadorPJe) -> None:
+    tarefa = asyncio.create_task(autenticador.autenticar())
+    await asyncio.sleep(0.2)
+    tarefa.cancel()
+    await tarefa
+
+
+def test_login_no_simulador(
+    simulador: ServidorSimulado,
+    executor: ThreadPoolExecutor,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(assincrono, "AutenticadorPJe", NavegadorHTTP)
+
+    async def logar() -> tuple[bool, dict[str, str]]:
+        async with AsyncAutenticadorPJe("3", executor=executor) as autenticador:
+            sucesso = await autenticador.autenticar(timeout=30)
+            return sucesso, await autenticador.cookies_requests()
+
+    sucesso, cookies = asyncio.run(logar())
+
+    assert sucesso
+    assert simulador.sessao_valida(cookies[COOKIE_SESSAO_PJE], "3")
+
+
+def test_timeout_fecha_o_navegador(
+    navegador_lento: type[NavegadorLento],
+    executor: ThreadPoolExecutor,
+) -> None:
+    autenticador = AsyncAutenticadorPJe("1", executor=executor, login_enxuto=False)
+
+    assert not asyncio.run(autenticador.autenticar(timeout=0.2))
+    assert navegador_lento.fechados == [autenticador._autenticador]  # noqa: SLF001
+
+
+def test_cancelamento_fecha_o_navegador(
+    navegador_lento: type[NavegadorLento],
+    executor: ThreadPoolExecutor,
+) -> None:
+    autenticador = AsyncAutenticadorPJe("1", executor=executor, login_enxuto=False)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_cancelar_login(autenticador))
+
+    assert navegador_lento.fechados == [autenticador._autenticador]  # noqa: SLF001
+
+
+def test_cancelamento_durante_a_abertura(
+    navegador_lento: type[NavegadorLento],
+    executor: ThreadPoolExecutor,
+) -> None:
+    navegador_lento.abertura.clear()
+    autenticador = AsyncAutenticadorPJe("1", executor=executor, login_enxuto=False)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_cancelar_login(autenticador))
+
+    assert autenticador._autenticador is None  # noqa: SLF001
+    assert not navegador_lento.fechados
+
+    # O navegador termina de abrir depois do cancelamento e é fechado
+    navegador_lento.abertura.set()
+    executor.shutdown(wait=True)
+    assert len(navegador_lento.fechados) == 1
+
+
+def test_executor_padrao_limita_as_threads(
+    navegador_lento: type[NavegadorLento],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limite = 2
+    monkeypatch.setattr(assincrono, "LIMITE_THREADS", limite)
+    monkeypatch.setattr(assincrono, "_executor_padrao", None)
+    # Cada etapa segura a thread por um instante, sem esperar o fechamento
+    monkeypatch.setattr(navegador_lento, "espera", 0.05)
+
+    async def logar() -> list[bool]:
+        return await asyncio.gather(
+            *(
+                AsyncAutenticadorPJe("1", login_enxuto=False).autenticar()
+                for _ in range(TOTAL_LOGINS)
+            ),
+        )
+
+    try:
+        assert asyncio.run(logar()) == [True] * TOTAL_LOGINS
+        assert executor_padrao() is executor_padrao()
+        assert navegador_lento.maximo_simultaneos == limite
+    finally:
+        executor_padrao().shutdown(wait=True)
@@ -0,0 +1,64 @@
+"""Testes do ClientePJe contra as APIs do PJe simulado."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from autenticapje.cliente import ClientePJe
+
+if TYPE_CHECKING:
+    from autenticapje.simulador import ServidorSimulado
+
+NUMEROS = [f"000000{i}-12.2024.5.03.0001" for i in range(1, 4)]
+
+
+def test_consultar_varios(cookies: dict[str, str]) -> None:
+    with ClientePJe({"3": cookies}) as cliente:
+        resultados = {r["numero"]: r for r in cliente.consultar_varios(NUMEROS)}
+
+    assert set(resultados) == set(NUMEROS)
+    for numero, resultado in resultados.items():
+        assert resultado["erro"] is None
+        assert resultado["id_processo"] == int(numero[:7])
+        assert resultado["partes"] == [
+            {"idProcesso": resultado["id_processo"], "tipo": "partes"},
+        ]
+
+
+def test_falha_na_fonte_de_cookies() -> None:
+    def cookies(regiao: str) -> dict[str, str]:
+        raise OSError(f"servidor de sessões indisponível (TRT{regiao})")
+
+    with ClientePJe(cookies) as cliente:
+        resultados = list(cliente.consultar_varios(NUMEROS))
+
+    assert sorted(r["numero"] for r in resultados) == sorted(NUMEROS)
+    for resultado in resultados:
+        assert resultado["regiao"] == "3"
+        assert resultado["erro"] == "OSError: servidor de sessões indisponível (TRT3)"
+
+
+def test_pausa_por_retry_after(
+    simulador: ServidorSimulado,
+    cookies: dict[str, str],
+) -> None:
+    simulador.limitar_api(1, retry_after=1)
+
+    # Uma vaga por host: as threads na fila do semáforo também respeitam a pausa
+    with ClientePJe({"3": cookies}, limite_por_host=1) as cliente:
+        resultados = list(cliente.consultar_varios(NUMEROS))
+
+    assert all(resultado["erro"] is None for resultado in resultados)
+
+    chamadas = simulador.chamadas_api
+    limitadas = [
+        i
+        for i, (_, status) in enumerate(chamadas)
+        if status == HTTPStatus.TOO_MANY_REQUESTS
+    ]
+    assert len(limitadas) == 1
+
+    indice = limitadas[0]
+    assert len(chamadas) == 1 + len(NUMEROS) * 4
+    assert chamadas[indice + 1][0] - chamadas[indice][0] >= 0.9  # noqa: PLR2004
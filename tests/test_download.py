@@ -0,0 +1,87 @@
+"""Testes do download da íntegra contra o PJe simulado."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from autenticapje.cliente import ClientePJe
+from autenticapje.download import baixar_integra, baixar_varios
+from autenticapje.elements import pje as el
+from autenticapje.simulador import integra_simulada
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+ID_PROCESSO = 1234
+RETOMADOS = 1000
+
+
+@pytest.fixture
+def cliente(cookies: dict[str, str]) -> Iterator[ClientePJe]:
+    """Cliente com a sessão do TRT3 no simulador.
+
+    Yields:
+        ClientePJe: Cliente aberto.
+
+    """
+    with ClientePJe({"3": cookies}) as cliente:
+        yield cliente
+
+
+def _parcial(diretorio: Path, validador: str | None) -> Path:
+    destino = diretorio.joinpath(f"integra_trt3_{ID_PROCESSO}.pdf")
+    parcial = destino.with_name(destino.name + ".part")
+    parcial.write_bytes(integra_simulada(ID_PROCESSO)[:RETOMADOS])
+    if validador is not None:
+        parcial.with_name(parcial.name + ".meta").write_text(validador)
+
+    return destino
+
+
+def _etag(cliente: ClientePJe) -> str:
+    url = el.LINK_DOWNLOAD_INTEGRA.format(trt_id="3", id_processo=ID_PROCESSO)
+    with cliente.conexao("3") as sessao:
+        return sessao.get(url, timeout=5).headers["ETag"]
+
+
+def test_retoma_com_if_range(cliente: ClientePJe, tmp_path: Path) -> None:
+    destino = _parcial(tmp_path, _etag(cliente))
+
+    resultado = baixar_integra(cliente, "3", ID_PROCESSO, tmp_path)
+
+    conteudo = integra_simulada(ID_PROCESSO)
+    assert resultado["erro"] is None
+    assert resultado["retomado"]
+    assert resultado["baixados"] == len(conteudo) - RETOMADOS
+    assert destino.read_bytes() == conteudo
+    assert not destino.with_name(destino.name + ".part.meta").exists()
+
+
+@pytest.mark.parametrize("validador", [None, "", '"versao-antiga"'])
+def test_recomeca_sem_validador_ou_com_outra_versao(
+    cliente: ClientePJe,
+    tmp_path: Path,
+    validador: str | None,
+) -> None:
+    destino = _parcial(tmp_path, validador)
+
+    resultado = baixar_integra(cliente, "3", ID_PROCESSO, tmp_path)
+
+    conteudo = integra_simulada(ID_PROCESSO)
+    assert resultado["erro"] is None
+    assert resultado["baixados"] == len(conteudo)
+    assert destino.read_bytes() == conteudo
+
+
+def test_baixar_varios_sem_repetir(cliente: ClientePJe, tmp_path: Path) -> None:
+    processos = [("3", 1), ("3", 2), ("3", 1), ("3", 2), ("3", 1)]
+
+    resultados = list(baixar_varios(cliente, processos, tmp_path, max_workers=2))
+
+    assert sorted(r["id_processo"] for r in resultados) == [1, 2]
+    for resultado in resultados:
+        assert resultado["erro"] is None
+        assert resultado["baixados"] == len(integra_simulada(resultado["id_processo"]))
@@ -0,0 +1,103 @@
+"""Testes do índice de URIs OTP do KeePass."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import pyotp
+import pytest
+
+from autenticapje import keystore
+from autenticapje.benchmark.fixtures import gerar_kdbx
+from autenticapje.keystore import IndiceOTP
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from autenticapje.benchmark.fixtures import Fixtures
+
+
+@pytest.fixture
+def kdbx(fixtures: Fixtures, tmp_path: Path) -> Path:
+    """Cópia do KeePass fixture, que o teste pode regravar.
+
+    Returns:
+        Path: Arquivo KDBX.
+
+    """
+    return shutil.copy(fixtures.kdbx, tmp_path.joinpath("banco.kdbx"))
+
+
+@pytest.fixture
+def leituras(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Conte quantas vezes o KDBX é indexado.
+
+    Returns:
+        list[int]: Uma posição por leitura do arquivo.
+
+    """
+    indexar = keystore._indexar  # noqa: SLF001
+    contagem: list[int] = []
+
+    def indexar_contando(banco: keystore.KeyStore) -> dict[str, str]:
+        contagem.append(1)
+        return indexar(banco)
+
+    monkeypatch.setattr(keystore, "_indexar", indexar_contando)
+    return contagem
+
+
+@pytest.mark.parametrize("usuario", ["000.000.001-91", "00000000191", "000000001-91"])
+def test_busca_por_usuario_ou_cpf(
+    fixtures: Fixtures,
+    kdbx: Path,
+    usuario: str,
+) -> None:
+    indice = IndiceOTP()
+
+    assert indice.obter(usuario, str(kdbx), fixtures.senha_kdbx) == fixtures.otp_uri
+
+
+def test_usuario_sem_otp(fixtures: Fixtures, kdbx: Path) -> None:
+    indice = IndiceOTP()
+
+    assert indice.obter("usuario1", str(kdbx), fixtures.senha_kdbx) is None
+    assert indice.obter("inexistente", str(kdbx), fixtures.senha_kdbx) is None
+
+
+@pytest.mark.parametrize("usuario", [None, ""])
+def test_sem_usuario_nao_abre_o_banco(
+    tmp_path: Path,
+    leituras: list[int],
+    usuario: str | None,
+) -> None:
+    arquivo = str(tmp_path.joinpath("inexistente.kdbx"))
+
+    assert IndiceOTP().obter(usuario, arquivo, "senha") is None
+    assert not leituras
+
+
+def test_indice_refeito_quando_o_arquivo_muda(
+    fixtures: Fixtures,
+    kdbx: Path,
+    leituras: list[int],
+) -> None:
+    indice = IndiceOTP()
+    for _ in range(3):
+        assert indice.obter(fixtures.usuario, str(kdbx), fixtures.senha_kdbx)
+
+    assert len(leituras) == 1
+
+    nova_uri = pyotp.TOTP(pyotp.random_base32()).provisioning_uri(
+        name=fixtures.usuario,
+        issuer_name="PJe",
+    )
+    estado = kdbx.stat()
+    gerar_kdbx(kdbx, nova_uri, entradas=5, senha=fixtures.senha_kdbx)
+    # Garante mtime diferente mesmo se a regravação cair no mesmo instante
+    os.utime(kdbx, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+
+    assert indice.obter(fixtures.usuario, str(kdbx), fixtures.senha_kdbx) == nova_uri
+    assert len(leituras) == 2  # noqa: PLR2004
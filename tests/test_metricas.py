@@ -0,0 +1,118 @@
+"""Testes das medições do login e da exportação."""
+
+from __future__ import annotations
+
+import json
+from itertools import count
+from typing import TYPE_CHECKING
+
+import pytest
+
+from autenticapje import metricas
+from autenticapje.metricas import ExportadorPrometheus, Medidor, gravar_jsonl
+from autenticapje.regioes import ResultadoAutenticacao
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _resultado(
+    regiao: str,
+    tempo: float,
+    fases: dict[str, float],
+    *,
+    sucesso: bool = True,
+) -> ResultadoAutenticacao:
+    return ResultadoAutenticacao(
+        regiao=regiao,
+        sucesso=sucesso,
+        origem="login",
+        tempo=tempo,
+        fases=fases,
+        cookies_requests="/tmp/cookies_requests.json",  # noqa: S108
+        cookies_navegador="/tmp/cookies_navegador.json",  # noqa: S108
+        erro=None if sucesso else "Traceback...",
+    )
+
+
+def test_medidor_registra_fases(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Cada leitura do relógio avança 1 s
+    monkeypatch.setattr(metricas, "perf_counter", count().__next__)
+    medidor = Medidor()
+
+    with medidor.fase("assinatura"):
+        pass
+
+    with pytest.raises(RuntimeError), medidor.fase("desafio"):
+        raise RuntimeError
+
+    with medidor.fase("assinatura"):
+        pass
+
+    assert [fase["nome"] for fase in medidor.fases] == [
+        "assinatura",
+        "desafio",
+        "assinatura",
+    ]
+    assert medidor.fases[1] == {"nome": "desafio", "inicio": 3, "duracao": 1}
+    assert medidor.duracoes() == {"assinatura": 2, "desafio": 1}
+
+
+def test_gravar_jsonl(tmp_path: Path) -> None:
+    arquivo = tmp_path.joinpath("metricas.jsonl")
+
+    gravar_jsonl(_resultado("1", 2.5, {"driver": 1.0}), arquivo)
+    gravar_jsonl(_resultado("2", 3.0, {}, sucesso=False), arquivo)
+
+    linhas = [json.loads(linha) for linha in arquivo.read_text().splitlines()]
+    assert linhas == [
+        {
+            "regiao": "1",
+            "sucesso": True,
+            "origem": "login",
+            "tempo": 2.5,
+            "fases": {"driver": 1.0},
+        },
+        {"regiao": "2", "sucesso": False, "origem": "login", "tempo": 3.0, "fases": {}},
+    ]
+
+
+def test_prometheus_formato_texto(tmp_path: Path) -> None:
+    exportador = ExportadorPrometheus(buckets=(0.5, 1.0))
+    exportador.registrar(_resultado("1", 0.75, {"otp": 0.25}))
+    exportador.registrar(_resultado("1", 2.0, {"otp": 0.5}, sucesso=False))
+
+    assert exportador.texto() == (
+        "# HELP autenticapje_logins_total Logins por região e situação.\n"
+        "# TYPE autenticapje_logins_total counter\n"
+        'autenticapje_logins_total{regiao="1",situacao="falha"} 1\n'
+        'autenticapje_logins_total{regiao="1",situacao="sucesso"} 1\n'
+        "# HELP autenticapje_login_segundos Duração total da autenticação por região.\n"
+        "# TYPE autenticapje_login_segundos histogram\n"
+        'autenticapje_login_segundos_bucket{regiao="1",origem="login",le="0.5"} 0\n'
+        'autenticapje_login_segundos_bucket{regiao="1",origem="login",le="1"} 1\n'
+        'autenticapje_login_segundos_bucket{regiao="1",origem="login",le="+Inf"} 2\n'
+        'autenticapje_login_segundos_sum{regiao="1",origem="login"} 2.750000\n'
+        'autenticapje_login_segundos_count{regiao="1",origem="login"} 2\n'
+        "# HELP autenticapje_fase_segundos Duração de cada fase do login por região.\n"
+        "# TYPE autenticapje_fase_segundos histogram\n"
+        'autenticapje_fase_segundos_bucket{regiao="1",fase="otp",le="0.5"} 2\n'
+        'autenticapje_fase_segundos_bucket{regiao="1",fase="otp",le="1"} 2\n'
+        'autenticapje_fase_segundos_bucket{regiao="1",fase="otp",le="+Inf"} 2\n'
+        'autenticapje_fase_segundos_sum{regiao="1",fase="otp"} 0.750000\n'
+        'autenticapje_fase_segundos_count{regiao="1",fase="otp"} 2\n'
+    )
+
+    arquivo = tmp_path.joinpath("autenticapje.prom")
+    exportador.gravar(arquivo)
+    assert arquivo.read_text(encoding="utf-8") == exportador.texto()
+
+
+def test_prometheus_escapa_rotulos() -> None:
+    exportador = ExportadorPrometheus(buckets=(1.0,))
+    exportador.registrar(_resultado("1", 0.5, {'fase "nova"\\x': 0.1}))
+
+    assert (
+        'autenticapje_fase_segundos_count{regiao="1",fase="fase \\"nova\\"\\\\x"} 1'
+        in exportador.texto().splitlines()
+    )
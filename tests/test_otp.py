@@ -0,0 +1,107 @@
+"""Testes da geração de OTP com margem de validade."""
+
+from __future__ import annotations
+
+import pyotp
+import pytest
+
+from autenticapje import otp
+from autenticapje.otp import MARGEM_MINIMA, gerar_otp
+
+# Início de uma janela de 30 s
+INICIO_JANELA = 1_700_000_010.0
+
+
+class RelogioFalso:
+    """Relógio em que `sleep` apenas avança o tempo."""
+
+    def __init__(self, agora: float) -> None:
+        """Inicialize o relógio no instante informado.
+
+        Args:
+            agora (float): Epoch inicial.
+
+        """
+        self.agora = agora
+        self.esperas: list[float] = []
+
+    def time(self) -> float:
+        """Retorne o instante atual do relógio.
+
+        Returns:
+            float: Epoch atual.
+
+        """
+        return self.agora
+
+    def sleep(self, segundos: float) -> None:
+        """Avance o relógio sem esperar de fato.
+
+        Args:
+            segundos (float): Tempo a avançar.
+
+        """
+        self.esperas.append(segundos)
+        self.agora += segundos
+
+
+@pytest.fixture
+def totp() -> pyotp.TOTP:
+    """TOTP com segredo aleatório e janela de 30 s.
+
+    Returns:
+        pyotp.TOTP: Gerador de referência.
+
+    """
+    return pyotp.TOTP(pyotp.random_base32())
+
+
+def _relogio(monkeypatch: pytest.MonkeyPatch, agora: float) -> RelogioFalso:
+    relogio = RelogioFalso(agora)
+    monkeypatch.setattr(otp, "time", relogio.time)
+    monkeypatch.setattr(otp, "sleep", relogio.sleep)
+    return relogio
+
+
+@pytest.mark.parametrize("estrategia", ["aguardar", "proxima"])
+def test_margem_suficiente_sem_espera(
+    totp: pyotp.TOTP,
+    monkeypatch: pytest.MonkeyPatch,
+    estrategia: otp.EstrategiaOTP,
+) -> None:
+    relogio = _relogio(monkeypatch, INICIO_JANELA + 10)
+
+    gerado = gerar_otp(totp.provisioning_uri(), estrategia=estrategia)
+
+    assert gerado.codigo == totp.at(relogio.agora)
+    assert gerado.segundos_restantes == pytest.approx(20)
+    assert not relogio.esperas
+
+
+def test_aguardar_segura_ate_a_proxima_janela(
+    totp: pyotp.TOTP,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    restante = MARGEM_MINIMA - 2
+    relogio = _relogio(monkeypatch, INICIO_JANELA + totp.interval - restante)
+
+    gerado = gerar_otp(totp.provisioning_uri(), estrategia="aguardar")
+
+    assert relogio.esperas == [pytest.approx(restante)]
+    assert relogio.agora == pytest.approx(INICIO_JANELA + totp.interval)
+    assert gerado.codigo == totp.at(INICIO_JANELA + totp.interval)
+    assert gerado.segundos_restantes == pytest.approx(totp.interval)
+
+
+def test_proxima_entrega_o_codigo_da_janela_seguinte(
+    totp: pyotp.TOTP,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    restante = MARGEM_MINIMA - 2
+    relogio = _relogio(monkeypatch, INICIO_JANELA + totp.interval - restante)
+
+    gerado = gerar_otp(totp.provisioning_uri(), estrategia="proxima")
+
+    assert not relogio.esperas
+    assert gerado.codigo == totp.at(INICIO_JANELA + totp.interval)
+    assert gerado.segundos_restantes == pytest.approx(restante + totp.interval)
@@ -0,0 +1,66 @@
+"""Testes da codificação PkiPath sem JVM."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from cryptography.hazmat.primitives.serialization import Encoding, pkcs12
+
+from autenticapje.pkipath import (
+    codificar_pkipath,
+    codificar_pkipath_java,
+    decodificar_pkipath,
+)
+
+if TYPE_CHECKING:
+    from autenticapje.benchmark.fixtures import Fixtures
+
+
+@pytest.fixture(scope="module")
+def cadeia_der(fixtures: Fixtures) -> list[bytes]:
+    """Cadeia final -> intermediária -> raiz do certificado fixture.
+
+    Returns:
+        list[bytes]: Certificados em DER, final primeiro.
+
+    """
+    _, certificado, intermediarias = pkcs12.load_key_and_certificates(
+        fixtures.certificado.read_bytes(),
+        fixtures.senha_certificado.encode(),
+    )
+    cadeia = [certificado, *intermediarias]
+    assert len(cadeia) == 3  # noqa: PLR2004
+    return [cert.public_bytes(Encoding.DER) for cert in cadeia]
+
+
+def test_ida_e_volta(cadeia_der: list[bytes]) -> None:
+    pkipath = codificar_pkipath(cadeia_der)
+
+    assert decodificar_pkipath(pkipath) == cadeia_der
+
+
+def test_raiz_primeiro(cadeia_der: list[bytes]) -> None:
+    pkipath = codificar_pkipath(cadeia_der)
+
+    assert pkipath.index(cadeia_der[-1]) < pkipath.index(cadeia_der[1])
+    assert pkipath.endswith(cadeia_der[0])
+
+
+@pytest.mark.parametrize(
+    "invalido",
+    [b"", b"\x04\x00", b"\x30\x05\x30\x03", b"\x30\x02\x04\x00"],
+)
+def test_decodificar_recusa_invalido(invalido: bytes) -> None:
+    with pytest.raises(ValueError, match="PkiPath inválido"):
+        decodificar_pkipath(invalido)
+
+
+def test_igual_ao_java(cadeia_der: list[bytes]) -> None:
+    jpype = pytest.importorskip("jpype")
+    try:
+        jpype.getDefaultJVMPath()
+    except jpype.JVMNotFoundException:
+        pytest.skip("JVM não encontrada")
+
+    assert codificar_pkipath(cadeia_der) == codificar_pkipath_java(cadeia_der)
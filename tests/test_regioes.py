@@ -0,0 +1,91 @@
+"""Testes da interpretação de regiões e do login de várias regiões."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from typer.testing import CliRunner
+
+from autenticapje.cli import app
+from autenticapje.regioes import autenticar_regioes, interpretar_regioes
+from autenticapje.sessao import CacheSessoes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from autenticapje.simulador import ServidorSimulado
+
+
+@pytest.mark.parametrize(
+    ("valor", "esperado"),
+    [
+        ("1", ["1"]),
+        ("3-5,1", ["1", "3", "4", "5"]),
+        (" 2 , 2-3 ", ["2", "3"]),
+        ("todas", [str(regiao) for regiao in range(1, 25)]),
+        ("", []),
+    ],
+)
+def test_interpretar_regioes(valor: str, esperado: list[str]) -> None:
+    assert interpretar_regioes(valor) == esperado
+
+
+@pytest.mark.parametrize("valor", ["abc", "0", "25", "5-3", "1-x"])
+def test_interpretar_regioes_invalidas(valor: str) -> None:
+    with pytest.raises(ValueError, match="Região"):
+        interpretar_regioes(valor)
+
+
+def test_autenticar_regioes(simulador: ServidorSimulado, tmp_path: Path) -> None:
+    cache = CacheSessoes(tmp_path.joinpath("sessoes"))
+
+    resultados = {
+        resultado["regiao"]: resultado
+        for resultado in autenticar_regioes(
+            ["1", "2"],
+            max_workers=2,
+            diretorio=tmp_path,
+            cache=cache,
+            modo="http",
+        )
+    }
+
+    assert set(resultados) == {"1", "2"}
+    for regiao, resultado in resultados.items():
+        assert resultado["sucesso"], resultado["erro"]
+        assert resultado["origem"] == "login"
+        assert resultado["cookies_requests"] == str(
+            tmp_path.joinpath(f"cookies_requests_trt{regiao}.json"),
+        )
+
+    # Segunda varredura: sessões do cache, sem novo login
+    for resultado in autenticar_regioes(["1", "2"], cache=cache, modo="http"):
+        assert resultado["origem"] == "cache"
+
+
+@pytest.mark.parametrize(
+    ("argumentos", "mensagem"),
+    [
+        (["--regiao", "abc"], "Região inválida: abc"),
+        (["--regiao", "30"], "Região fora do intervalo: 30"),
+        (["--regiao", ""], "Nenhuma região informada"),
+    ],
+)
+def test_cli_recusa_regiao_invalida(
+    simulador: ServidorSimulado,  # noqa: ARG001
+    argumentos: list[str],
+    mensagem: str,
+) -> None:
+    resultado = CliRunner().invoke(app, ["autenticar", *argumentos])
+
+    assert resultado.exit_code == 0
+    assert resultado.exception is None
+    assert mensagem in resultado.output
+
+
+def test_cli_recusa_workers_zero() -> None:
+    resultado = CliRunner().invoke(app, ["autenticar", "--workers", "0"])
+
+    # Erro de uso do Typer, antes de qualquer navegador ser aberto
+    assert resultado.exit_code == 2  # noqa: PLR2004
@@ -0,0 +1,98 @@
+"""Testes da resolução do chromedriver pelo manifesto local."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from autenticapje.driver import resolver
+from autenticapje.driver.resolver import (
+    ManifestoChromedriver,
+    esquecer_chromedriver,
+    resolver_chromedriver,
+)
+
+
+@pytest.fixture
+def ambiente(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, object]:
+    """Chrome 142 instalado e um webdriver-manager que só conta instalações.
+
+    Returns:
+        dict[str, object]: Manifesto, driver e instalações feitas.
+
+    """
+    driver = str(tmp_path.joinpath("chromedriver"))
+    Path(driver).write_text("")
+    instalacoes: list[str] = []
+
+    class Instalador:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def install(self) -> str:
+            instalacoes.append(driver)
+            return driver
+
+    monkeypatch.setattr(resolver, "ChromeDriverManager", Instalador)
+    monkeypatch.setattr(resolver, "versao_chrome_local", lambda: "142.0.7444.59")
+    monkeypatch.setattr(resolver, "_resolvido", {})
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    return {
+        "manifesto": tmp_path.joinpath("chromedriver.json"),
+        "driver": driver,
+        "instalacoes": instalacoes,
+    }
+
+
+def test_instala_uma_vez_e_grava_manifesto(ambiente: dict) -> None:
+    manifesto: Path = ambiente["manifesto"]
+
+    assert resolver_chromedriver(manifesto) == ambiente["driver"]
+    assert resolver_chromedriver(manifesto) == ambiente["driver"]
+
+    assert ambiente["instalacoes"] == [ambiente["driver"]]
+    assert json.loads(manifesto.read_text()) == ManifestoChromedriver(
+        versao_chrome="142.0.7444.59",
+        caminho=ambiente["driver"],
+    )
+    assert not list(manifesto.parent.glob("*.tmp"))
+
+
+def test_chrome_atualizado_apos_falha_do_driver(
+    ambiente: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manifesto: Path = ambiente["manifesto"]
+    resolver_chromedriver(manifesto)
+
+    monkeypatch.setattr(resolver, "versao_chrome_local", lambda: "143.0.1.2")
+    # Memorizado no processo: a versão só é conferida de novo após a falha
+    resolver_chromedriver(manifesto)
+    assert len(ambiente["instalacoes"]) == 1
+
+    esquecer_chromedriver(manifesto)
+    resolver_chromedriver(manifesto)
+    assert len(ambiente["instalacoes"]) == 2  # noqa: PLR2004
+    assert json.loads(manifesto.read_text())["versao_chrome"] == "143.0.1.2"
+
+
+def test_gravacoes_simultaneas_do_manifesto(tmp_path: Path) -> None:
+    manifesto = tmp_path.joinpath("chromedriver.json")
+    dados = [
+        ManifestoChromedriver(versao_chrome=f"{versao}.0", caminho="x" * versao)
+        for versao in range(1, 200)
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda item: resolver._gravar_manifesto(manifesto, item),  # noqa: SLF001
+                dados,
+            ),
+        )
+
+    assert json.loads(manifesto.read_text()) in dados
+    assert not list(tmp_path.glob("*.tmp"))
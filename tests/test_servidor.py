@@ -0,0 +1,118 @@
+"""Testes da API local do servidor de sessões."""
+
+from __future__ import annotations
+
+import stat
+from http import HTTPStatus
+from http.client import HTTPConnection
+from time import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import pytest
+
+from autenticapje.servidor import ServidorSessoes, obter_cookies
+from autenticapje.sessao import CacheSessoes, SessaoArmazenada
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+COOKIES = {"PJE_SESSAO": "abc"}
+
+
+@pytest.fixture
+def servidor(tmp_path: Path) -> Iterator[ServidorSessoes]:
+    """Servidor com uma sessão pronta do TRT1, sem logins reais.
+
+    Yields:
+        ServidorSessoes: Servidor ainda sem API no ar.
+
+    """
+    servidor = ServidorSessoes(
+        ["1"],
+        modo="http",
+        cache=CacheSessoes(tmp_path.joinpath("sessoes")),
+        arquivo_token=tmp_path.joinpath("servidor.token"),
+    )
+    servidor._sessoes["1"] = SessaoArmazenada(  # noqa: SLF001
+        regiao="1",
+        cpf="",
+        emitido_em=time(),
+        cookies_requests=COOKIES,
+        cookies_navegador=[],
+    )
+    try:
+        yield servidor
+    finally:
+        servidor.encerrar()
+
+
+def _get(url: str, caminho: str, cabecalhos: dict[str, str]) -> int:
+    partes = urlsplit(url)
+    conexao = HTTPConnection(partes.hostname, partes.port, timeout=5)
+    try:
+        conexao.request("GET", caminho, headers=cabecalhos)
+        resposta = conexao.getresponse()
+        resposta.read()
+    finally:
+        conexao.close()
+
+    return resposta.status
+
+
+def test_http_exige_token_e_host_local(servidor: ServidorSessoes) -> None:
+    url = servidor.servir_http(porta=0)
+    porta = urlsplit(url).port
+    token = servidor.arquivo_token.read_text()
+
+    assert stat.S_IMODE(servidor.arquivo_token.stat().st_mode) == 0o600
+    assert token == servidor.token
+    assert obter_cookies("1", porta, arquivo_token=servidor.arquivo_token) == COOKIES
+
+    autorizacao = {"Authorization": f"Bearer {token}"}
+    assert _get(url, "/cookies/1", {}) == HTTPStatus.UNAUTHORIZED
+    assert (
+        _get(url, "/cookies/1", {"Authorization": "Bearer errado"})
+        == HTTPStatus.UNAUTHORIZED
+    )
+    assert (
+        _get(url, "/cookies/1", {**autorizacao, "Host": f"evil.example:{porta}"})
+        == HTTPStatus.FORBIDDEN
+    )
+    assert (
+        _get(url, "/cookies/1", {**autorizacao, "Host": f"localhost:{porta}"})
+        == HTTPStatus.OK
+    )
+
+
+def test_unix_socket_restrito(servidor: ServidorSessoes, tmp_path: Path) -> None:
+    caminho = servidor.servir_unix(tmp_path.joinpath("api.sock"))
+
+    assert stat.S_IMODE(caminho.stat().st_mode) == 0o600
+    assert (
+        obter_cookies(
+            "1",
+            caminho_socket=caminho,
+            arquivo_token=servidor.arquivo_token,
+        )
+        == COOKIES
+    )
+
+    servidor.arquivo_token.write_text("outro")
+    assert (
+        obter_cookies(
+            "1",
+            caminho_socket=caminho,
+            arquivo_token=servidor.arquivo_token,
+        )
+        is None
+    )
+
+
+def test_token_removido_ao_encerrar(servidor: ServidorSessoes) -> None:
+    servidor.servir_http(porta=0)
+    assert servidor.arquivo_token.exists()
+
+    servidor.encerrar()
+    assert not servidor.arquivo_token.exists()
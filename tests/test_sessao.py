@@ -0,0 +1,79 @@
+"""Testes do cache de sessões contra o PJe simulado."""
+
+from __future__ import annotations
+
+import json
+import stat
+from typing import TYPE_CHECKING
+
+import pytest
+
+from autenticapje.elements import pje as el
+from autenticapje.sessao import CacheSessoes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from autenticapje.simulador import ServidorSimulado
+
+CPF = "123.456.789-09"
+
+
+@pytest.fixture
+def cache(simulador: ServidorSimulado, tmp_path: Path) -> CacheSessoes:  # noqa: ARG001
+    """Cache vazio, verificado contra o simulador.
+
+    Returns:
+        CacheSessoes: Cache em uma pasta temporária.
+
+    """
+    return CacheSessoes(tmp_path.joinpath("sessoes"), timeout_verificacao=2)
+
+
+def test_salvar_e_carregar(cache: CacheSessoes, cookies: dict[str, str]) -> None:
+    salva = cache.salvar("3", CPF, cookies, [{"name": "x", "value": "y"}])
+
+    arquivo = cache.diretorio.joinpath("trt3_12345678909.json")
+    assert stat.S_IMODE(arquivo.stat().st_mode) == 0o600
+    assert cache.carregar("3", CPF) == salva
+    assert cache.obter("3", CPF) == salva
+    assert not list(cache.diretorio.glob("*.tmp"))
+
+
+def test_expirada_por_idade(cache: CacheSessoes, cookies: dict[str, str]) -> None:
+    cache.salvar("3", CPF, cookies, [])
+    arquivo = cache.diretorio.joinpath("trt3_12345678909.json")
+    sessao = json.loads(arquivo.read_text())
+    sessao["emitido_em"] -= 3600
+    arquivo.write_text(json.dumps(sessao))
+
+    assert cache.obter("3", CPF, idade_maxima=7200) is not None
+    assert cache.obter("3", CPF, idade_maxima=1800) is None
+    assert cache.carregar("3", CPF) is None
+
+
+def test_recusada_pelo_pje(cache: CacheSessoes) -> None:
+    cache.salvar("3", CPF, {"PJE_SESSAO": "expirado"}, [])
+
+    assert cache.obter("3", CPF) is None
+    assert cache.carregar("3", CPF) is None
+
+
+def test_falha_de_rede_mantem_sessao(
+    cache: CacheSessoes,
+    cookies: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    salva = cache.salvar("3", CPF, cookies, [])
+    # Porta 9 (discard) em localhost: conexão recusada, sem resposta do PJe
+    monkeypatch.setattr(
+        el,
+        "LINK_VERIFICA_SESSAO",
+        "http://127.0.0.1:9/trt{trt_id}/pje-comum-api/api/usuarios/logado",
+    )
+
+    assert cache.obter("3", CPF) is None
+    assert cache.carregar("3", CPF) == salva
+
+    monkeypatch.undo()
+    assert cache.obter("3", CPF) == salva
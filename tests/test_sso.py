@@ -0,0 +1,76 @@
+"""Testes do login HTTP contra o PJe/SSO simulado."""
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING
+
+import pyotp
+import pytest
+
+from autenticapje import AutenticadorBase
+from autenticapje.simulador import COOKIE_SESSAO_PJE
+from autenticapje.sso import AutenticadorHTTP
+
+if TYPE_CHECKING:
+    from autenticapje.simulador import ServidorSimulado
+
+
+def test_login_com_sucesso(simulador: ServidorSimulado) -> None:
+    autenticador = AutenticadorHTTP("3")
+    try:
+        assert autenticador.autenticar()
+
+        cookies = autenticador.get_cookies_for_requests()
+        assert simulador.sessao_valida(cookies[COOKIE_SESSAO_PJE], "3")
+        assert {"assinatura", "desafio", "otp_envio"} <= set(
+            autenticador.medidor.duracoes(),
+        )
+    finally:
+        autenticador.fechar()
+
+
+def test_certificado_recusado(
+    simulador: ServidorSimulado,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assinar = AutenticadorHTTP._assinar_desafio  # noqa: SLF001
+
+    def assinatura_adulterada(self: AutenticadorHTTP) -> dict[str, str]:
+        payload = assinar(self)
+        assinatura = bytearray(base64.b64decode(payload["assinatura"]))
+        assinatura[-1] ^= 0xFF
+        payload["assinatura"] = base64.b64encode(assinatura).decode()
+        return payload
+
+    monkeypatch.setattr(AutenticadorHTTP, "_assinar_desafio", assinatura_adulterada)
+
+    autenticador = AutenticadorHTTP("1")
+    try:
+        assert not autenticador.autenticar()
+        assert COOKIE_SESSAO_PJE not in autenticador.get_cookies_for_requests()
+        assert "/protocol/openid-connect/auth" in autenticador.url_atual
+    finally:
+        autenticador.fechar()
+
+
+def test_otp_incorreto(simulador: ServidorSimulado) -> None:
+    # O KeePass guarda outro segredo: o código gerado não confere
+    simulador.otp = pyotp.TOTP(pyotp.random_base32())
+
+    autenticador = AutenticadorHTTP("1")
+    try:
+        assert not autenticador.autenticar()
+        assert "/login-actions/otp" in autenticador.url_atual
+        assert COOKIE_SESSAO_PJE not in autenticador.get_cookies_for_requests()
+    finally:
+        autenticador.fechar()
+
+
+def test_subclasse_incompleta_falha_ao_instanciar() -> None:
+    class SemCookies(AutenticadorBase):
+        def autenticar(self) -> bool:
+            return True
+
+    with pytest.raises(TypeError, match="get_cookies_browser"):
+        SemCookies("1")